@@ -0,0 +1,49 @@
+"""Add covering indexes for timecard aggregation
+
+Revision ID: 6c2f0d9a4e17
+Revises: a3d85c17e9b2
+Create Date: 2026-10-16 15:21:48.093514
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6c2f0d9a4e17"
+down_revision: Union[str, Sequence[str], None] = "a3d85c17e9b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # generate_timecard filters on a date range and groups/orders by (date, project_id);
+    # summary is left out of INCLUDE since up to 2000 chars can exceed the btree row limit
+    op.create_index(
+        "ix_work_sessions_date_project",
+        "work_sessions",
+        ["date", "project_id"],
+        unique=False,
+        postgresql_include=["duration_hours", "privacy_level"],
+    )
+    op.create_index(
+        "ix_work_sessions_date_project_shared",
+        "work_sessions",
+        ["date", "project_id"],
+        unique=False,
+        postgresql_include=["duration_hours"],
+        postgresql_where=sa.text("privacy_level != 'PRIVATE'"),
+    )
+    # Superseded by ix_work_sessions_date_project, which leads with date
+    op.drop_index("ix_work_sessions_date", table_name="work_sessions")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_work_sessions_date", "work_sessions", ["date"], unique=False)
+    op.drop_index("ix_work_sessions_date_project_shared", table_name="work_sessions")
+    op.drop_index("ix_work_sessions_date_project", table_name="work_sessions")
@@ -0,0 +1,37 @@
+"""Add partial index for due-reminder lookups
+
+Revision ID: a3d85c17e9b2
+Revises: e7b3f95c2a60
+Create Date: 2026-10-16 14:05:12.630418
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a3d85c17e9b2"
+down_revision: Union[str, Sequence[str], None] = "e7b3f95c2a60"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The scheduler's per-minute due check only ever reads open reminders, so index
+    # just those rows; completed reminders accumulate and never enter the index
+    op.create_index(
+        "ix_reminders_due",
+        "reminders",
+        ["reminder_time"],
+        unique=False,
+        postgresql_where=sa.text("is_completed = false"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_reminders_due", table_name="reminders")
@@ -0,0 +1,60 @@
+"""Add generated full-text search columns with GIN indexes
+
+Revision ID: b2c47a158eae
+Revises: 3fee97713352
+Create Date: 2026-10-16 09:12:44.318207
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b2c47a158eae"
+down_revision: Union[str, Sequence[str], None] = "3fee97713352"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Table -> text columns folded into its "searchable" tsvector
+SEARCHABLE_COLUMNS = {
+    "work_sessions": ("summary",),
+    "meetings": ("title", "summary"),
+    "notes": ("text",),
+    "projects": ("name", "description"),
+    "clients": ("name", "notes"),
+    "employers": ("name", "notes"),
+    "reminders": ("message",),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, columns in SEARCHABLE_COLUMNS.items():
+        document = " || ' ' || ".join(f"coalesce({name}, '')" for name in columns)
+        op.add_column(
+            table,
+            sa.Column(
+                "searchable",
+                postgresql.TSVECTOR(),
+                sa.Computed(f"to_tsvector('english', {document})", persisted=True),
+                nullable=True,
+            ),
+        )
+        op.create_index(
+            f"ix_{table}_searchable",
+            table,
+            ["searchable"],
+            unique=False,
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in SEARCHABLE_COLUMNS:
+        op.drop_index(f"ix_{table}_searchable", table_name=table, postgresql_using="gin")
+        op.drop_column(table, "searchable")
@@ -0,0 +1,73 @@
+"""Add pg_trgm GIN indexes for substring (ILIKE) search
+
+Revision ID: c81e5f0a9d34
+Revises: b2c47a158eae
+Create Date: 2026-10-16 10:03:27.904511
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c81e5f0a9d34"
+down_revision: Union[str, Sequence[str], None] = "b2c47a158eae"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Text columns still matched with ILIKE '%x%': people search in flexible queries,
+# and contains/starts_with/ends_with filters in structured queries
+TRIGRAM_COLUMNS = {
+    "people": ("full_name", "email"),
+    "work_sessions": ("summary",),
+    "meetings": ("title", "summary"),
+    "notes": ("text",),
+    "projects": ("name", "description"),
+    "clients": ("name", "notes"),
+    "employers": ("name", "notes"),
+    "reminders": ("message",),
+}
+
+
+def _if_trigram_available(*statements: str) -> sa.TextClause:
+    """
+    Wrap statements so they run only where the server offers pg_trgm.
+
+    pg_trgm ships with contrib, which not every server has. As in the models
+    (types.trigram_available), the extension and its indexes are skipped
+    there instead of failing; the check runs server-side so --sql output
+    behaves the same.
+    """
+    body = " ".join(f"{statement};" for statement in statements)
+    return sa.text(
+        "DO $$ BEGIN "
+        "IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN "
+        f"{body} END IF; END $$"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Index the column itself (not lower(column)): gin_trgm_ops serves ILIKE directly
+    op.execute(
+        _if_trigram_available(
+            "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+            *(
+                f"CREATE INDEX ix_{table}_{column}_trgm ON {table} "
+                f"USING gin ({column} gin_trgm_ops)"
+                for table, columns in TRIGRAM_COLUMNS.items()
+                for column in columns
+            ),
+        )
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, columns in TRIGRAM_COLUMNS.items():
+        for column in columns:
+            op.drop_index(f"ix_{table}_{column}_trgm", table_name=table, if_exists=True)
+    # pg_trgm is left installed; other objects may depend on it
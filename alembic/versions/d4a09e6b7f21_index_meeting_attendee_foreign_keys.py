@@ -0,0 +1,35 @@
+"""Index meeting_attendees foreign keys
+
+Revision ID: d4a09e6b7f21
+Revises: c81e5f0a9d34
+Create Date: 2026-10-16 11:20:41.517093
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d4a09e6b7f21"
+down_revision: Union[str, Sequence[str], None] = "c81e5f0a9d34"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # meeting_id serves attendee eager loading; person_id serves the person filter
+    op.create_index(
+        op.f("ix_meeting_attendees_meeting_id"), "meeting_attendees", ["meeting_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_meeting_attendees_person_id"), "meeting_attendees", ["person_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_meeting_attendees_person_id"), table_name="meeting_attendees")
+    op.drop_index(op.f("ix_meeting_attendees_meeting_id"), table_name="meeting_attendees")
@@ -0,0 +1,64 @@
+"""Add generated people search_blob with trigram index
+
+Revision ID: e7b3f95c2a60
+Revises: d4a09e6b7f21
+Create Date: 2026-10-16 12:05:13.842716
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7b3f95c2a60"
+down_revision: Union[str, Sequence[str], None] = "d4a09e6b7f21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _if_trigram_available(*statements: str) -> sa.TextClause:
+    """
+    Wrap statements so they run only where the server offers pg_trgm.
+
+    Same guard as c81e5f0a9d34 (and types.trigram_available in the models).
+    """
+    body = " ".join(f"{statement};" for statement in statements)
+    return sa.text(
+        "DO $$ BEGIN "
+        "IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN "
+        f"{body} END IF; END $$"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "people",
+        sa.Column(
+            "search_blob",
+            sa.Text(),
+            sa.Computed(
+                "lower(coalesce(full_name, '') || chr(10) || coalesce(email, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    # One index serves name-or-email search; guarded like c81e5f0a9d34, and the
+    # extension is (re)ensured in case the server gained pg_trgm since then
+    op.execute(
+        _if_trigram_available(
+            "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+            "CREATE INDEX ix_people_search_blob_trgm ON people "
+            "USING gin (search_blob gin_trgm_ops)",
+        )
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_people_search_blob_trgm", table_name="people", if_exists=True)
+    op.drop_column("people", "search_blob")
@@ -4,9 +4,11 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, event, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+from .types import CREATE_TRIGRAM_EXTENSION
+
 
 class PrivacyLevel(str, Enum):
     """Privacy levels for work sessions, meetings, and notes."""
@@ -78,6 +80,10 @@ class Base(DeclarativeBase):
     }
 
 
+# Trigram indexes (see types.trigram_index) need pg_trgm before any table is created
+event.listen(Base.metadata, "before_create", CREATE_TRIGRAM_EXTENSION)
+
+
 class TimestampMixin:
     """Mixin for created_at/updated_at timestamps."""
 
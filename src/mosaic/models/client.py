@@ -6,7 +6,7 @@ from sqlalchemy import Enum, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, ClientStatus, ClientType, TimestampMixin
-from .types import StringArray
+from .types import StringArray, searchable_column, searchable_index, trigram_index
 
 if TYPE_CHECKING:
     from .person import EmploymentHistory, Person
@@ -32,9 +32,17 @@ class Client(Base, TimestampMixin):
     notes: Mapped[Optional[str]] = mapped_column(String(2000))
     tags: Mapped[list[str]] = mapped_column(StringArray, default=list, nullable=False)
 
+    searchable: Mapped[Optional[str]] = searchable_column("name", "notes")
+
     # Relationships
     contact_person: Mapped[Optional["Person"]] = relationship("Person")
     projects: Mapped[list["Project"]] = relationship("Project", back_populates="client")
     employments: Mapped[list["EmploymentHistory"]] = relationship(
         "EmploymentHistory", back_populates="client"
     )
+
+    __table_args__ = (
+        searchable_index("clients"),
+        trigram_index("clients", "name"),
+        trigram_index("clients", "notes"),
+    )
@@ -6,7 +6,7 @@ from sqlalchemy import Boolean, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin
-from .types import StringArray
+from .types import StringArray, searchable_column, searchable_index, trigram_index
 
 if TYPE_CHECKING:
     from .project import Project
@@ -27,9 +27,17 @@ class Employer(Base, TimestampMixin):
         StringArray, default=list, nullable=False, server_default="{}"
     )
 
+    searchable: Mapped[Optional[str]] = searchable_column("name", "notes")
+
     # Relationships
     projects: Mapped[list["Project"]] = relationship(
         "Project",
         back_populates="employer",
         foreign_keys="Project.on_behalf_of_id",
     )
+
+    __table_args__ = (
+        searchable_index("employers"),
+        trigram_index("employers", "name"),
+        trigram_index("employers", "notes"),
+    )
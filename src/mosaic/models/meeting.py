@@ -7,7 +7,7 @@ from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, PrivacyLevel, TimestampMixin
-from .types import StringArray
+from .types import StringArray, searchable_column, searchable_index, trigram_index
 
 if TYPE_CHECKING:
     from .person import Person
@@ -21,10 +21,10 @@ class MeetingAttendee(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     meeting_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("meetings.id", ondelete="CASCADE"), nullable=False
+        Integer, ForeignKey("meetings.id", ondelete="CASCADE"), nullable=False, index=True
     )
     person_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("people.id", ondelete="CASCADE"), nullable=False
+        Integer, ForeignKey("people.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Relationships
@@ -58,6 +58,8 @@ class Meeting(Base, TimestampMixin):
         StringArray, default=list, nullable=False, server_default="{}"
     )
 
+    searchable: Mapped[Optional[str]] = searchable_column("title", "summary")
+
     # Relationships
     project: Mapped[Optional["Project"]] = relationship("Project", back_populates="meetings")
     attendees: Mapped[list["MeetingAttendee"]] = relationship(
@@ -65,3 +67,9 @@ class Meeting(Base, TimestampMixin):
         back_populates="meeting",
         cascade="all, delete-orphan",
     )
+
+    __table_args__ = (
+        searchable_index("meetings"),
+        trigram_index("meetings", "title"),
+        trigram_index("meetings", "summary"),
+    )
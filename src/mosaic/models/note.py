@@ -6,7 +6,7 @@ from sqlalchemy import Enum, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, EntityType, PrivacyLevel, TimestampMixin
-from .types import StringArray
+from .types import StringArray, searchable_column, searchable_index, trigram_index
 
 
 class Note(Base, TimestampMixin):
@@ -27,4 +27,10 @@ class Note(Base, TimestampMixin):
         StringArray, default=list, nullable=False, server_default="{}"
     )
 
-    __table_args__ = (Index("ix_notes_entity", "entity_type", "entity_id"),)
+    searchable: Mapped[Optional[str]] = searchable_column("text")
+
+    __table_args__ = (
+        Index("ix_notes_entity", "entity_type", "entity_id"),
+        searchable_index("notes"),
+        trigram_index("notes", "text"),
+    )
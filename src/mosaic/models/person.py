@@ -3,12 +3,12 @@
 from datetime import date
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import Boolean, Date, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Computed, Date, ForeignKey, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin
-from .types import StringArray
+from .types import StringArray, trigram_index
 
 if TYPE_CHECKING:
     from .client import Client
@@ -53,6 +53,16 @@ class Person(Base, TimestampMixin):
     tags: Mapped[list[str]] = mapped_column(StringArray, default=list, nullable=False)
     additional_info: Mapped[Optional[dict[str, Any]]] = mapped_column(JSONB)
 
+    # Lowercased name and email (newline-separated so a match cannot span both)
+    # for single-expression substring search; trigram-indexed below
+    search_blob: Mapped[Optional[str]] = mapped_column(
+        Text,
+        Computed(
+            "lower(coalesce(full_name, '') || chr(10) || coalesce(email, ''))", persisted=True
+        ),
+        deferred=True,
+    )
+
     # Relationships
     employments: Mapped[list["EmploymentHistory"]] = relationship(
         "EmploymentHistory",
@@ -62,3 +72,9 @@ class Person(Base, TimestampMixin):
     meeting_attendances: Mapped[list["MeetingAttendee"]] = relationship(
         "MeetingAttendee", back_populates="person"
     )
+
+    __table_args__ = (
+        trigram_index("people", "full_name"),
+        trigram_index("people", "email"),
+        trigram_index("people", "search_blob"),
+    )
@@ -7,7 +7,7 @@ from sqlalchemy import Date, Enum, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, ProjectStatus, TimestampMixin
-from .types import StringArray
+from .types import StringArray, searchable_column, searchable_index, trigram_index
 
 if TYPE_CHECKING:
     from .client import Client
@@ -41,6 +41,8 @@ class Project(Base, TimestampMixin):
         StringArray, default=list, nullable=False, server_default="{}"
     )
 
+    searchable: Mapped[Optional[str]] = searchable_column("name", "description")
+
     # Relationships
     employer: Mapped[Optional["Employer"]] = relationship(
         "Employer",
@@ -52,3 +54,9 @@ class Project(Base, TimestampMixin):
         "WorkSession", back_populates="project"
     )
     meetings: Mapped[list["Meeting"]] = relationship("Meeting", back_populates="project")
+
+    __table_args__ = (
+        searchable_index("projects"),
+        trigram_index("projects", "name"),
+        trigram_index("projects", "description"),
+    )
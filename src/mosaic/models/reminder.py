@@ -3,12 +3,12 @@
 from datetime import datetime
 from typing import Any, Optional
 
-from sqlalchemy import Boolean, DateTime, Enum, Index, Integer, String
+from sqlalchemy import Boolean, DateTime, Enum, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, EntityType, TimestampMixin
-from .types import StringArray
+from .types import StringArray, searchable_column, searchable_index, trigram_index
 
 
 class Reminder(Base, TimestampMixin):
@@ -33,4 +33,16 @@ class Reminder(Base, TimestampMixin):
         DateTime(timezone=True), index=True
     )
 
-    __table_args__ = (Index("ix_reminders_active", "reminder_time", "is_completed"),)
+    searchable: Mapped[Optional[str]] = searchable_column("message")
+
+    __table_args__ = (
+        Index("ix_reminders_active", "reminder_time", "is_completed"),
+        # Partial index for the scheduler's due check (open reminders only)
+        Index("ix_reminders_due", "reminder_time", postgresql_where=text("is_completed = false")),
+        searchable_index("reminders"),
+        trigram_index("reminders", "message"),
+    )
+
+    # Fetch server-generated values (updated_at on UPDATE) via RETURNING in the same
+    # statement, so reminders stay readable after a flush without a refresh()
+    __mapper_args__ = {"eager_defaults": True}
@@ -3,8 +3,14 @@
 import json
 from typing import Any
 
-from sqlalchemy import String, Text, TypeDecorator
+from sqlalchemy import DDL, Computed, Connection, Index, String, Table, Text, TypeDecorator, text
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import MappedColumn, mapped_column
+from sqlalchemy.schema import SchemaItem
+from sqlalchemy.sql.ddl import BaseDDLElement
+
+# Text search configuration shared by generated search columns and queries
+SEARCH_CONFIG = "english"
 
 
 class StringArray(TypeDecorator[Any]):
@@ -42,3 +48,97 @@ class StringArray(TypeDecorator[Any]):
         else:
             result = json.loads(value) if isinstance(value, str) else value
             return result  # type: ignore[no-any-return]
+
+
+def searchable_column(*source_columns: str) -> MappedColumn[Any]:
+    """
+    Stored, generated tsvector over text columns for PostgreSQL full-text search.
+
+    The column is deferred so loading an entity never fetches the vector; it
+    is only referenced in WHERE clauses (see QueryService).
+
+    Args:
+        *source_columns: Names of the text columns to index (NULLs become '')
+
+    Returns:
+        MappedColumn: Column definition to assign to a ``searchable`` attribute
+    """
+    document = " || ' ' || ".join(f"coalesce({name}, '')" for name in source_columns)
+    return mapped_column(
+        postgresql.TSVECTOR,
+        Computed(f"to_tsvector('{SEARCH_CONFIG}', {document})", persisted=True),
+        deferred=True,
+    )
+
+
+def searchable_index(table_name: str) -> Index:
+    """
+    GIN index over a table's ``searchable`` column.
+
+    Args:
+        table_name: Table name, used to build the index name
+
+    Returns:
+        Index: Index to include in the model's ``__table_args__``
+    """
+    return Index(f"ix_{table_name}_searchable", "searchable", postgresql_using="gin")
+
+
+def trigram_available(
+    ddl: BaseDDLElement,
+    target: SchemaItem | str,
+    bind: Connection | None,
+    tables: list[Table] | None = None,
+    state: Any | None = None,
+    **kw: Any,
+) -> bool:
+    """
+    Whether the server can provide pg_trgm (DDL condition for create_all).
+
+    The extension ships with PostgreSQL contrib, which not every server has.
+    Trigram indexes only speed up ILIKE, so they are skipped rather than
+    failing schema creation.
+
+    Args:
+        ddl: DDL element being considered
+        target: Object the DDL applies to (MetaData or Index)
+        bind: Connection running create_all (None when only compiling DDL)
+        tables: Tables being created, if any
+        state: Optional state passed to ddl_if/execute_if
+        **kw: Additional DDL event arguments
+
+    Returns:
+        bool: True if pg_trgm is installed or installable
+    """
+    if bind is None:
+        return False
+    available = bind.execute(
+        text("SELECT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')")
+    ).scalar()
+    return bool(available)
+
+
+# Installs pg_trgm ahead of the trigram indexes; attached to Base.metadata
+CREATE_TRIGRAM_EXTENSION = DDL(  # type: ignore[no-untyped-call]
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+).execute_if(dialect="postgresql", callable_=trigram_available)
+
+
+def trigram_index(table_name: str, column: str) -> Index:
+    """
+    GIN trigram index serving ILIKE '%x%' substring matches on a text column.
+
+    Args:
+        table_name: Table name, used to build the index name
+        column: Text column to index
+
+    Returns:
+        Index: Index to include in the model's ``__table_args__`` (only
+            created where pg_trgm is available)
+    """
+    return Index(
+        f"ix_{table_name}_{column}_trgm",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    ).ddl_if(dialect="postgresql", callable_=trigram_available)
@@ -5,11 +5,11 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Date, Enum, ForeignKey, Index, Integer, Numeric, String
+from sqlalchemy import Date, Enum, ForeignKey, Index, Integer, Numeric, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, PrivacyLevel, TimestampMixin
-from .types import StringArray
+from .types import StringArray, searchable_column, searchable_index, trigram_index
 
 if TYPE_CHECKING:
     from datetime import date  # noqa: F401
@@ -26,7 +26,8 @@ class WorkSession(Base, TimestampMixin):
     project_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("projects.id", ondelete="RESTRICT"), nullable=False
     )
-    date: Mapped[date] = mapped_column(Date, nullable=False, index=True)  # noqa: F811
+    # Indexed through ix_work_sessions_date_project (date is its leading column)
+    date: Mapped[date] = mapped_column(Date, nullable=False)  # noqa: F811
     duration_hours: Mapped[Decimal] = mapped_column(Numeric(4, 2), nullable=False)
     summary: Mapped[Optional[str]] = mapped_column(String(2000))
     privacy_level: Mapped[PrivacyLevel] = mapped_column(
@@ -38,7 +39,29 @@ class WorkSession(Base, TimestampMixin):
         StringArray, default=list, nullable=False, server_default="{}"
     )
 
+    searchable: Mapped[Optional[str]] = searchable_column("summary")
+
     # Relationships
     project: Mapped["Project"] = relationship("Project", back_populates="work_sessions")
 
-    __table_args__ = (Index("ix_work_sessions_project_date", "project_id", "date"),)
+    __table_args__ = (
+        Index("ix_work_sessions_project_date", "project_id", "date"),
+        # Timecard group/order keys; summary stays out of INCLUDE (up to 2000 chars
+        # would overflow the btree tuple size limit)
+        Index(
+            "ix_work_sessions_date_project",
+            "date",
+            "project_id",
+            postgresql_include=["duration_hours", "privacy_level"],
+        ),
+        # Same keys for timecards that exclude private sessions
+        Index(
+            "ix_work_sessions_date_project_shared",
+            "date",
+            "project_id",
+            postgresql_include=["duration_hours"],
+            postgresql_where=text("privacy_level != 'PRIVATE'"),
+        ),
+        searchable_index("work_sessions"),
+        trigram_index("work_sessions", "summary"),
+    )
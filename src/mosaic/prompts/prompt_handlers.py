@@ -11,13 +11,13 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from mosaic.models.base import ProjectStatus
-from mosaic.models.employer import Employer
-from mosaic.models.meeting import Meeting
-from mosaic.models.person import Person
-from mosaic.models.project import Project
-from mosaic.models.reminder import Reminder
-from mosaic.models.work_session import WorkSession
+from ..models.base import ProjectStatus
+from ..models.employer import Employer
+from ..models.meeting import Meeting
+from ..models.person import Person
+from ..models.project import Project
+from ..models.reminder import Reminder
+from ..models.work_session import WorkSession
 
 
 async def generate_log_work_prompt(session: AsyncSession) -> str:
@@ -41,6 +41,10 @@ class ReminderRepository(BaseRepository[Reminder]):
         """
         List reminders due before a specific time (not completed, not snoozed).
 
+        Tuned for the partial index ix_reminders_due (reminder_time WHERE
+        is_completed = false): keep the literal `is_completed == False` predicate
+        so the planner can match the index condition.
+
         Args:
             before_time: Time threshold for reminder_time
             cooldown_since: Optional cooldown threshold - skip reminders notified after this time
@@ -1,6 +1,6 @@
 """Pydantic schemas for MCP tool input/output validation."""
 
-from mosaic.schemas.action_item import (
+from .action_item import (
     AddActionItemInput,
     AddActionItemOutput,
     DeleteActionItemInput,
@@ -10,7 +10,7 @@ from mosaic.schemas.action_item import (
     UpdateActionItemInput,
     UpdateActionItemOutput,
 )
-from mosaic.schemas.bookmark import (
+from .bookmark import (
     AddBookmarkInput,
     AddBookmarkOutput,
     DeleteBookmarkInput,
@@ -20,13 +20,13 @@ from mosaic.schemas.bookmark import (
     UpdateBookmarkInput,
     UpdateBookmarkOutput,
 )
-from mosaic.schemas.client import (
+from .client import (
     AddClientInput,
     AddClientOutput,
     UpdateClientInput,
     UpdateClientOutput,
 )
-from mosaic.schemas.common import (
+from .common import (
     BaseSchema,
     ClientStatus,
     ClientType,
@@ -38,24 +38,24 @@ from mosaic.schemas.common import (
     TimezoneAwareDatetimeMixin,
     WeekBoundary,
 )
-from mosaic.schemas.employer import AddEmployerInput, AddEmployerOutput
-from mosaic.schemas.meeting import (
+from .employer import AddEmployerInput, AddEmployerOutput
+from .meeting import (
     LogMeetingInput,
     LogMeetingOutput,
     UpdateMeetingInput,
     UpdateMeetingOutput,
 )
-from mosaic.schemas.note import (
+from .note import (
     AddNoteInput,
     AddNoteOutput,
     UpdateNoteInput,
     UpdateNoteOutput,
 )
-from mosaic.schemas.notification import (
+from .notification import (
     TriggerNotificationInput,
     TriggerNotificationOutput,
 )
-from mosaic.schemas.person import (
+from .person import (
     AddPersonInput,
     AddPersonOutput,
     EmploymentHistoryInput,
@@ -63,19 +63,19 @@ from mosaic.schemas.person import (
     UpdatePersonInput,
     UpdatePersonOutput,
 )
-from mosaic.schemas.project import (
+from .project import (
     AddProjectInput,
     AddProjectOutput,
     UpdateProjectInput,
     UpdateProjectOutput,
 )
-from mosaic.schemas.prompts import (
+from .prompts import (
     FindGapsArgs,
     GenerateTimecardArgs,
     SearchContextArgs,
     WeeklyReviewArgs,
 )
-from mosaic.schemas.query import (
+from .query import (
     ClientResult,
     EmployerResult,
     EmploymentHistoryResult,
@@ -90,7 +90,7 @@ from mosaic.schemas.query import (
     UserResult,
     WorkSessionResult,
 )
-from mosaic.schemas.query_structured import (
+from .query_structured import (
     AggregationFunction,
     AggregationResult,
     AggregationSpec,
@@ -99,7 +99,7 @@ from mosaic.schemas.query_structured import (
     StructuredQueryInput,
     StructuredQueryOutput,
 )
-from mosaic.schemas.reminder import (
+from .reminder import (
     AddReminderInput,
     AddReminderOutput,
     CompleteReminderInput,
@@ -107,8 +107,8 @@ from mosaic.schemas.reminder import (
     SnoozeReminderInput,
     SnoozeReminderOutput,
 )
-from mosaic.schemas.user import GetUserOutput, UpdateUserInput, UpdateUserOutput
-from mosaic.schemas.work_session import (
+from .user import GetUserOutput, UpdateUserInput, UpdateUserOutput
+from .work_session import (
     LogWorkSessionInput,
     LogWorkSessionOutput,
     UpdateWorkSessionInput,
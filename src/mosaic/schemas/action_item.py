@@ -4,8 +4,8 @@ from datetime import datetime
 
 from pydantic import Field
 
-from mosaic.models.base import ActionItemStatus
-from mosaic.schemas.common import (
+from ..models.base import ActionItemStatus
+from .common import (
     BaseSchema,
     EntityType,
     PrivacyLevel,
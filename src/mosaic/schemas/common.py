@@ -5,7 +5,7 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, field_validator, model_validator
 
-from mosaic.models.base import (
+from ..models.base import (
     ClientStatus,
     ClientType,
     EntityType,
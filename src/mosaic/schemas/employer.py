@@ -4,7 +4,7 @@ from datetime import datetime
 
 from pydantic import Field
 
-from mosaic.schemas.common import BaseSchema, TimezoneAwareDatetimeMixin
+from .common import BaseSchema, TimezoneAwareDatetimeMixin
 
 
 class AddEmployerInput(BaseSchema):
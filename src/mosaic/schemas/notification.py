@@ -2,7 +2,7 @@
 
 from pydantic import Field
 
-from mosaic.schemas.common import BaseSchema
+from .common import BaseSchema
 
 
 class TriggerNotificationInput(BaseSchema):
@@ -4,7 +4,7 @@ from datetime import date, datetime
 
 from pydantic import EmailStr, Field
 
-from mosaic.schemas.common import (
+from .common import (
     BaseSchema,
     DateRangeMixin,
     TimezoneAwareDatetimeMixin,
@@ -4,7 +4,7 @@ from datetime import datetime
 
 from pydantic import Field
 
-from mosaic.schemas.common import (
+from .common import (
     BaseSchema,
     ProjectStatus,
     TimezoneAwareDatetimeMixin,
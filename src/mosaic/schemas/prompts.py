@@ -8,7 +8,7 @@ from typing import Optional
 
 from pydantic import Field, field_validator, model_validator
 
-from mosaic.schemas.common import BaseSchema
+from .common import BaseSchema
 
 
 class GenerateTimecardArgs(BaseSchema):
@@ -7,7 +7,7 @@ from typing import Annotated, Literal
 
 from pydantic import Field
 
-from mosaic.schemas.common import (
+from .common import (
     BaseSchema,
     ClientStatus,
     ClientType,
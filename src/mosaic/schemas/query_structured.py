@@ -176,6 +176,26 @@ class StructuredQueryInput(BaseSchema):
         ge=0,
     )
 
+    @model_validator(mode="after")
+    def validate_field_paths(self) -> "StructuredQueryInput":
+        """Ensure every referenced field path exists on the entity type."""
+        # Import here to avoid circular dependency (query_builder imports these schemas)
+        from ..services.query_builder import QueryBuilder
+
+        known = QueryBuilder.field_paths(self.entity_type)
+        paths = [filter_spec.field for filter_spec in self.filters]
+        if self.aggregation:
+            if self.aggregation.field != "*":
+                paths.append(self.aggregation.field)
+            paths.extend(self.aggregation.group_by)
+
+        unknown = [path for path in paths if path not in known]
+        if unknown:
+            entity = EntityType(self.entity_type).value
+            raise ValueError(f"Unknown field(s) for {entity}: {', '.join(unknown)}")
+
+        return self
+
 
 class AggregationResult(BaseSchema):
     """
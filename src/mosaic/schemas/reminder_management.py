@@ -5,7 +5,7 @@ from enum import Enum
 
 from pydantic import Field
 
-from mosaic.schemas.common import BaseSchema, EntityType, TimezoneAwareDatetimeMixin
+from .common import BaseSchema, EntityType, TimezoneAwareDatetimeMixin
 
 
 class ReminderStatus(str, Enum):
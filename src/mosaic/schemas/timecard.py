@@ -5,7 +5,7 @@ from decimal import Decimal
 
 from pydantic import Field
 
-from mosaic.schemas.common import BaseSchema, DateRangeMixin
+from .common import BaseSchema, DateRangeMixin
 
 
 class TimecardInput(BaseSchema, DateRangeMixin):
@@ -6,7 +6,7 @@ from decimal import Decimal
 
 from pydantic import Field
 
-from mosaic.schemas.common import BaseSchema, PrivacyLevel
+from .common import BaseSchema, PrivacyLevel
 
 
 class LogWorkSessionInput(BaseSchema):
@@ -24,12 +24,16 @@ if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is not set")
 
 # Configure async engine
+# JIT is disabled per connection: queries here are selective, LIMITed lookups
+# where JIT compilation (tens to hundreds of ms) can dwarf execution time once
+# joins and filters push the plan cost past jit_above_cost.
 engine = create_async_engine(
     DATABASE_URL,
     pool_size=5,
     max_overflow=10,
     echo=os.getenv("LOG_LEVEL") == "DEBUG",
     pool_pre_ping=True,
+    connect_args={"server_settings": {"jit": "off"}},
 )
 
 # Create async session factory
@@ -96,6 +100,11 @@ def _parse_database_url(url: str) -> DatabaseConfig:
     )
 
 
+def _quote_identifier(name: str) -> str:
+    """Quote a PostgreSQL identifier, escaping embedded double quotes."""
+    return '"' + name.replace('"', '""') + '"'
+
+
 async def _ensure_database_exists() -> None:
     """Create the database if it doesn't exist."""
     if not DATABASE_URL:
@@ -120,12 +129,14 @@ async def _ensure_database_exists() -> None:
 
         try:
             # Check if database exists
-            exists = await conn.fetchval("SELECT 1 FROM pg_database WHERE datname = $1", db_name)
+            exists = await conn.fetchval(
+                "SELECT EXISTS(SELECT 1 FROM pg_database WHERE datname = $1)", db_name
+            )
 
             if not exists:
                 logger.info(f"Database '{db_name}' does not exist, creating...")
                 # CREATE DATABASE cannot run inside a transaction
-                await conn.execute(f'CREATE DATABASE "{db_name}"')
+                await conn.execute(f"CREATE DATABASE {_quote_identifier(db_name)}")
                 logger.info(f"Database '{db_name}' created successfully")
             else:
                 logger.debug(f"Database '{db_name}' already exists")
@@ -12,9 +12,16 @@ from ..models.meeting import Meeting, MeetingAttendee
 from ..models.project import Project
 from ..models.work_session import WorkSession
 
+MINUTES_PER_HOUR = Decimal(60)
+
 
 class MeetingService:
-    """Business logic for meeting operations."""
+    """
+    Business logic for meeting operations.
+
+    Methods flush but never commit: the caller owns the transaction and
+    commits (or rolls back) once, so a whole create flow costs one COMMIT.
+    """
 
     def __init__(self, session: AsyncSession) -> None:
         """
@@ -62,7 +69,7 @@ class MeetingService:
         if duration_minutes <= 0:
             raise ValueError("duration_minutes must be positive")
 
-        # Create meeting
+        # Create meeting with attendees; a single flush inserts both
         meeting = Meeting(
             start_time=start_time,
             duration_minutes=duration_minutes,
@@ -73,21 +80,11 @@ class MeetingService:
             meeting_type=meeting_type,
             location=location,
             tags=tags or [],
+            attendees=[MeetingAttendee(person_id=person_id) for person_id in attendee_ids or []],
         )
 
         self.session.add(meeting)
         await self.session.flush()
-
-        # Add attendees if provided
-        if attendee_ids:
-            for person_id in attendee_ids:
-                attendee = MeetingAttendee(
-                    meeting_id=meeting.id,
-                    person_id=person_id,
-                )
-                self.session.add(attendee)
-
-        await self.session.flush()
         await self.session.refresh(meeting)
 
         return meeting
@@ -134,14 +131,16 @@ class MeetingService:
         if duration_minutes <= 0:
             raise ValueError("duration_minutes must be positive")
 
-        # Verify project exists
-        project_result = await self.session.execute(select(Project).where(Project.id == project_id))
-        project = project_result.scalar_one_or_none()
+        # Verify project exists (scalar PK probe, no ORM load)
+        existing_project_id = await self.session.scalar(
+            select(Project.id).where(Project.id == project_id)
+        )
 
-        if project is None:
+        if existing_project_id is None:
             raise ValueError(f"Project with id {project_id} not found")
 
-        # Create meeting
+        # Create meeting; attendees ride the relationship so the unit of work
+        # inserts them after the meeting without an intermediate flush
         meeting = Meeting(
             start_time=start_time,
             duration_minutes=duration_minutes,
@@ -152,23 +151,14 @@ class MeetingService:
             meeting_type=meeting_type,
             location=location,
             tags=tags or [],
+            attendees=[MeetingAttendee(person_id=person_id) for person_id in attendee_ids or []],
         )
 
         self.session.add(meeting)
-        await self.session.flush()
-
-        # Add attendees if provided
-        if attendee_ids:
-            for person_id in attendee_ids:
-                attendee = MeetingAttendee(
-                    meeting_id=meeting.id,
-                    person_id=person_id,
-                )
-                self.session.add(attendee)
 
         # Calculate duration in hours from meeting duration_minutes
         # Convert minutes to hours (exact conversion, no rounding)
-        duration_hours = Decimal(str(duration_minutes)) / Decimal("60")
+        duration_hours = Decimal(duration_minutes) / MINUTES_PER_HOUR
 
         # Create work session with same details
         # Note: Meetings still have times, but work sessions only store date + duration
@@ -182,6 +172,8 @@ class MeetingService:
         )
 
         self.session.add(work_session)
+
+        # Single flush emits all INSERTs for meeting, attendees and work session
         await self.session.flush()
 
         # Refresh both entities to get full data
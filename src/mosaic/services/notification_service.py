@@ -1,5 +1,6 @@
 """Service layer for sending desktop notifications."""
 
+import asyncio
 import logging
 from typing import Any
 
@@ -7,6 +8,16 @@ from desktop_notifier import DEFAULT_SOUND, DesktopNotifier, Urgency
 
 logger = logging.getLogger(__name__)
 
+# Notification capabilities are an OS-level property, so the probe result is
+# shared by every NotificationService instance in the process. Not guarded by a
+# lock: a module-level asyncio.Lock binds to whichever event loop first contends
+# it, and a rare duplicate probe is harmless.
+_capabilities_cache: frozenset[str] | dict[str, bool] | None = None
+
+# Strong references to fire-and-forget sends so they aren't garbage collected
+# before completion (see asyncio.create_task documentation).
+_background_sends: set[asyncio.Task[bool]] = set()
+
 
 class NotificationService:
     """
@@ -23,6 +34,10 @@ class NotificationService:
         Without signing, notifications silently fail (no error raised).
     """
 
+    # DesktopNotifier construction sets up the platform backend (an ObjC bridge
+    # on macOS), so one notifier per app name is reused by every instance.
+    _notifier_pool: dict[str, DesktopNotifier] = {}
+
     def __init__(self, app_name: str = "Mosaic") -> None:
         """
         Initialize NotificationService with desktop notifier.
@@ -30,8 +45,11 @@ class NotificationService:
         Args:
             app_name: Application name to display in notifications
         """
-        self.notifier = DesktopNotifier(app_name=app_name)
-        self._capabilities_checked = False
+        notifier = NotificationService._notifier_pool.get(app_name)
+        if notifier is None:
+            notifier = DesktopNotifier(app_name=app_name)
+            NotificationService._notifier_pool[app_name] = notifier
+        self.notifier = notifier
         self._notifications_available = True
 
     async def check_capabilities(self) -> frozenset[str] | dict[str, bool]:
@@ -44,18 +62,21 @@ class NotificationService:
         Note:
             On macOS 10.14+, this doesn't detect unsigned executable issue.
             Notifications will appear to work but fail silently.
+            The probe runs once per process; later calls return the cached result.
         """
-        if not self._capabilities_checked:
+        global _capabilities_cache
+
+        if _capabilities_cache is None:
             try:
                 capabilities = await self.notifier.get_capabilities()
-                self._capabilities_checked = True
-                logger.info(f"Notification capabilities: {capabilities}")
-                return capabilities  # type: ignore[return-value]
             except Exception as e:
                 logger.warning(f"Could not check notification capabilities: {e}")
                 self._notifications_available = False
                 return frozenset()
-        return frozenset()
+            _capabilities_cache = capabilities  # type: ignore[assignment]
+            logger.info(f"Notification capabilities: {capabilities}")
+            return capabilities  # type: ignore[return-value]
+        return _capabilities_cache
 
     async def trigger_notification(
         self,
@@ -63,6 +84,7 @@ class NotificationService:
         message: str,
         sound: str = "default",
         metadata: dict[str, Any] | None = None,
+        fire_and_forget: bool = False,
     ) -> bool:
         """
         Send a desktop notification.
@@ -72,9 +94,12 @@ class NotificationService:
             message: Notification message body
             sound: Notification sound ("default" or "none")
             metadata: Optional metadata (logged but not displayed)
+            fire_and_forget: Schedule the send in the background and return
+                immediately instead of waiting on the notification backend
 
         Returns:
-            bool: True if send() completed without exception, False otherwise
+            bool: True if send() completed without exception, False otherwise.
+                Always True when fire_and_forget is set; failures are logged.
 
         Warning:
             On macOS 10.14+, may return True even if notification doesn't show
@@ -84,6 +109,33 @@ class NotificationService:
             Metadata is logged but not included in the notification itself.
             Desktop notifications have limited display capabilities.
         """
+        if fire_and_forget:
+            task = asyncio.create_task(self._send_safely(title, message, sound, metadata))
+            _background_sends.add(task)
+            task.add_done_callback(_background_sends.discard)
+            return True
+
+        return await self._send_safely(title, message, sound, metadata)
+
+    async def _send_safely(
+        self,
+        title: str,
+        message: str,
+        sound: str,
+        metadata: dict[str, Any] | None,
+    ) -> bool:
+        """
+        Send a notification, logging and swallowing any backend failure.
+
+        Args:
+            title: Notification title
+            message: Notification message body
+            sound: Notification sound ("default" or "none")
+            metadata: Optional metadata (logged but not displayed)
+
+        Returns:
+            bool: True if send() completed without exception, False otherwise
+        """
         try:
             # Log metadata if provided
             if metadata:
@@ -1,11 +1,18 @@
 """QueryBuilder service for converting structured queries to SQLAlchemy."""
 
+import functools
 import re
+from collections.abc import Collection, Mapping
 from datetime import date, datetime, timedelta, timezone
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, TypeVar
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import BindParameter, Integer, Select, bindparam, func
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import join as orm_join
+from sqlalchemy.orm import selectinload
 from sqlalchemy.sql import ColumnElement
 
 from ..models import (
@@ -25,8 +32,81 @@ from ..schemas.query_structured import (
     AggregationSpec,
     FilterOperator,
     FilterSpec,
+    StructuredQueryInput,
 )
 
+# Structural description of a query: everything except bound values.
+# (entity_type, ((field, operator), ...), (function, field, group_by) | None,
+#  load_paths)
+FilterShape = tuple[str, FilterOperator]
+AggregationShape = tuple[AggregationFunction, str, tuple[str, ...]]
+# Precomputed resolution of one field path:
+# (column attribute, join models, relationship path or "" for base columns)
+ResolvedField = tuple[Any, tuple[type[Any], ...], str]
+QueryShape = tuple[EntityType, tuple[FilterShape, ...], AggregationShape | None, tuple[str, ...]]
+
+# Operators that compare against no value (nothing to bind)
+_VALUELESS_OPERATORS = frozenset({FilterOperator.IS_NULL, FilterOperator.IS_NOT_NULL})
+
+# Operators whose list value is bound as an expanding IN parameter
+_EXPANDING_OPERATORS = frozenset({FilterOperator.IN, FilterOperator.NOT_IN})
+
+# Filter values resolved relative to the current date/time
+_TIME_SHORTCUTS = frozenset(
+    {
+        "today",
+        "tomorrow",
+        "yesterday",
+        "this_week",
+        "next_week",
+        "last_week",
+        "this_month",
+        "next_month",
+        "last_month",
+        "this_year",
+        "now",
+    }
+)
+
+# Escape character for LIKE patterns built from user text
+LIKE_ESCAPE = "\\"
+
+_LIKE_ESCAPES = str.maketrans({"\\": "\\\\", "%": "\\%", "_": "\\_"})
+
+
+def escape_like(text: Any) -> str:
+    """
+    Escape LIKE wildcards so user text matches literally.
+
+    Use the result with ``ESCAPE LIKE_ESCAPE``. Unescaped, a search for
+    ``100%`` or ``snake_case`` would treat ``%``/``_`` as wildcards.
+
+    Args:
+        text: User-supplied search text (converted with str())
+
+    Returns:
+        str: Text with backslash, ``%`` and ``_`` escaped
+    """
+    return str(text).translate(_LIKE_ESCAPES)
+
+
+# Operators whose bound value differs from the resolved filter value
+_BIND_VALUE_SHAPERS: dict[FilterOperator, Callable[[Any], Any]] = {
+    FilterOperator.CONTAINS: lambda value: f"%{escape_like(value)}%",
+    FilterOperator.STARTS_WITH: lambda value: f"{escape_like(value)}%",
+    FilterOperator.ENDS_WITH: lambda value: f"%{escape_like(value)}",
+    FilterOperator.HAS_TAG: lambda value: [value],
+}
+
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+
+def _freeze(table: Mapping[_K, Mapping[str, _V]]) -> Mapping[_K, Mapping[str, _V]]:
+    """Return a read-only view of a two-level lookup table."""
+    return MappingProxyType({key: MappingProxyType(dict(inner)) for key, inner in table.items()})
+
 
 class QueryBuilder:
     """
@@ -45,9 +125,9 @@ class QueryBuilder:
     - Dependency Inversion: Depends on schema abstractions
     """
 
-    # Relationship path mappings
+    # Relationship path mappings (read-only; frozen after the class body)
     # Maps "entity.relationship.field" to SQLAlchemy join paths
-    RELATIONSHIP_PATHS: dict[EntityType, dict[str, tuple[type[Any], ...]]] = {
+    RELATIONSHIP_PATHS: Mapping[EntityType, Mapping[str, tuple[type[Any], ...]]] = {
         EntityType.WORK_SESSION: {
             "project": (Project,),
             "project.client": (Project, Client),
@@ -76,9 +156,24 @@ class QueryBuilder:
         EntityType.REMINDER: {},
     }
 
-    # Field name mappings from schema field names to model field names
+    # Entity type <-> model class lookups
+    _MODEL_BY_ENTITY: ClassVar[dict[EntityType, type[Any]]] = {
+        EntityType.WORK_SESSION: WorkSession,
+        EntityType.MEETING: Meeting,
+        EntityType.PROJECT: Project,
+        EntityType.CLIENT: Client,
+        EntityType.PERSON: Person,
+        EntityType.EMPLOYER: Employer,
+        EntityType.NOTE: Note,
+        EntityType.REMINDER: Reminder,
+    }
+    _ENTITY_BY_MODEL: ClassVar[dict[type[Any], EntityType]] = {
+        model: entity_type for entity_type, model in _MODEL_BY_ENTITY.items()
+    }
+
+    # Field name mappings from schema field names to model field names (read-only)
     # Maps "entity_type" -> {"schema_field": "model_field"}
-    FIELD_NAME_MAPPINGS: dict[EntityType, dict[str, str]] = {
+    FIELD_NAME_MAPPINGS: Mapping[EntityType, Mapping[str, str]] = {
         EntityType.PROJECT: {
             "on_behalf_of": "on_behalf_of_id",
         },
@@ -92,6 +187,51 @@ class QueryBuilder:
         EntityType.REMINDER: {},
     }
 
+    # Resolved filter fields, filled once at import by _build_field_cache():
+    # base model -> {"field.path": (column attribute, join models, relationship path)}
+    _RESOLVED_FIELDS: ClassVar[Mapping[type[Any], Mapping[str, ResolvedField]]] = {}
+
+    # Unfiltered, unaggregated listings: entity_type -> select
+    _BASE_SELECTS: ClassVar[dict[EntityType, Select[Any]]] = {}
+
+    # Memoized join trees: (base model, relationship paths) -> join expression
+    _JOIN_TREES: ClassVar[dict[tuple[type[Any], tuple[str, ...]], Any]] = {}
+
+    # Memoized relationship attribute chains: (base model, path) -> attributes
+    _RELATIONSHIP_CHAINS: ClassVar[dict[tuple[type[Any], str], tuple[Any, ...]]] = {}
+
+    # Operator -> expression builder (column, bound value) -> condition
+    _OPERATOR_DISPATCH: ClassVar[dict[FilterOperator, Callable[[Any, Any], Any]]] = {
+        FilterOperator.EQ: lambda column, value: column == value,
+        FilterOperator.NE: lambda column, value: column != value,
+        FilterOperator.GT: lambda column, value: column > value,
+        FilterOperator.GTE: lambda column, value: column >= value,
+        FilterOperator.LT: lambda column, value: column < value,
+        FilterOperator.LTE: lambda column, value: column <= value,
+        FilterOperator.IN: lambda column, value: column.in_(value),
+        FilterOperator.NOT_IN: lambda column, value: column.not_in(value),
+        # Wildcards are added to the value by _bind_value()
+        FilterOperator.CONTAINS: lambda column, value: column.ilike(value, escape=LIKE_ESCAPE),
+        FilterOperator.STARTS_WITH: lambda column, value: column.ilike(value, escape=LIKE_ESCAPE),
+        FilterOperator.ENDS_WITH: lambda column, value: column.ilike(value, escape=LIKE_ESCAPE),
+        FilterOperator.IS_NULL: lambda column, value: column.is_(None),
+        FilterOperator.IS_NOT_NULL: lambda column, value: column.is_not(None),
+        # PostgreSQL array contains (@>); value wrapped as [tag] by _bind_value()
+        FilterOperator.HAS_TAG: lambda column, value: column.op("@>")(value),
+        # PostgreSQL array overlap (&&)
+        FilterOperator.HAS_ANY_TAG: lambda column, value: column.op("&&")(value),
+    }
+
+    # Aggregation function -> SQL aggregate builder
+    _AGGREGATION_DISPATCH: ClassVar[dict[AggregationFunction, Callable[[Any], Any]]] = {
+        AggregationFunction.COUNT: func.count,
+        AggregationFunction.SUM: func.sum,
+        AggregationFunction.AVG: func.avg,
+        AggregationFunction.MIN: func.min,
+        AggregationFunction.MAX: func.max,
+        AggregationFunction.COUNT_DISTINCT: lambda column: func.count(func.distinct(column)),
+    }
+
     def __init__(self, session: AsyncSession) -> None:
         """
         Initialize QueryBuilder.
@@ -108,157 +248,321 @@ class QueryBuilder:
         aggregation: AggregationSpec | None = None,
         limit: int | None = None,
         offset: int | None = None,
-    ) -> Select[Any]:
+        load_paths: list[str] | None = None,
+    ) -> tuple[Select[Any], dict[str, Any]]:
         """
         Build SQLAlchemy query from structured specifications.
 
+        The statement structure depends only on the query shape (entity type,
+        filter fields/operators, aggregation, load paths), so it is built once
+        per shape and cached. Filter values, limit and offset are returned
+        separately as bind parameters; execute with
+        ``session.execute(query, params)``.
+
         Args:
             entity_type: Type of entity to query
             filters: List of filter specifications
             aggregation: Optional aggregation specification
             limit: Maximum results
             offset: Result offset for pagination
+            load_paths: Extra relationship paths to eager load with selectinload
+                (e.g., ["project.client"]); ignored for aggregations
+
+        Returns:
+            tuple: (SQLAlchemy select statement, bind parameters)
+
+        Raises:
+            ValueError: If entity_type is invalid or field path is malformed
+        """
+        if not filters and aggregation is None and not load_paths:
+            # Plain listing: prebuilt statement, only pagination to bind
+            query = self._BASE_SELECTS[entity_type]
+            return query, self._pagination_params(limit, offset)
+
+        shape: QueryShape = (
+            entity_type,
+            tuple((filter_spec.field, filter_spec.operator) for filter_spec in filters),
+            (
+                (aggregation.function, aggregation.field, tuple(aggregation.group_by))
+                if aggregation
+                else None
+            ),
+            tuple(sorted(set(load_paths))) if load_paths else (),
+        )
+        query = _build_query_skeleton(shape)
+
+        # Bind values for this call; time shortcuts share one anchor per call
+        params: dict[str, Any] = {}
+        today = date.today()
+        now = datetime.now(timezone.utc)
+        resolve = self._resolve_filter_value
+        for index, name, shaper in _filter_binders(shape[1]):
+            value = resolve(filters[index].value, today, now)
+            params[name] = shaper(value) if shaper else value
+
+        if aggregation is None:
+            params.update(self._pagination_params(limit, offset))
+        return query, params
+
+    @classmethod
+    def field_paths(cls, entity_type: EntityType) -> Mapping[str, Any]:
+        """
+        Return the queryable field paths for an entity type.
+
+        Args:
+            entity_type: Entity type enum
+
+        Returns:
+            Mapping: field path -> resolved (column, join models), read-only
+
+        Raises:
+            ValueError: If entity_type is not supported
+        """
+        return cls._RESOLVED_FIELDS[cls._get_model_class(entity_type)]
+
+    def build_queries(
+        self, specs: list[StructuredQueryInput]
+    ) -> list[tuple[Select[Any], dict[str, Any]]]:
+        """
+        Build statements for several independent structured queries.
+
+        Each spec goes through build_query, so specs sharing a shape share one
+        cached statement. The statements are independent and can be executed
+        concurrently, but an AsyncSession runs one statement at a time; give
+        each statement its own session when awaiting them together:
+
+            async def run(query, params):
+                async with get_session() as session:
+                    return (await session.execute(query, params)).all()
+
+            rows = await asyncio.gather(*(run(q, p) for q, p in builder.build_queries(specs)))
+
+        Args:
+            specs: Structured query specifications
+
+        Returns:
+            list: (select statement, bind parameters) per spec, in order
+
+        Raises:
+            ValueError: If any spec has an invalid entity_type or field path
+        """
+        return [
+            self.build_query(
+                entity_type=spec.entity_type,
+                filters=spec.filters,
+                aggregation=spec.aggregation,
+                limit=spec.limit,
+                offset=spec.offset,
+            )
+            for spec in specs
+        ]
+
+    @staticmethod
+    def _pagination_params(limit: int | None, offset: int | None) -> dict[str, Any]:
+        """
+        Build the bind parameters for pagination.
+
+        Entity statements always carry LIMIT/OFFSET placeholders; PostgreSQL
+        treats a NULL limit as LIMIT ALL and a NULL offset as OFFSET 0.
+
+        Args:
+            limit: Maximum results
+            offset: Result offset for pagination
 
         Returns:
-            Select: SQLAlchemy select statement
+            dict: "limit" and "offset" values (None when unset)
+        """
+        return {"limit": limit or None, "offset": offset or None}
+
+    @classmethod
+    def _build_base_selects(cls) -> dict[EntityType, Select[Any]]:
+        """
+        Prebuild unfiltered entity listings for every entity type.
+
+        Returns:
+            dict: entity_type -> select statement
+        """
+        return {
+            entity_type: cls._build_skeleton((entity_type, (), None, ()))
+            for entity_type in cls._MODEL_BY_ENTITY
+        }
+
+    @classmethod
+    def _build_skeleton(cls, shape: QueryShape) -> Select[Any]:
+        """
+        Build the statement for a query shape with bind parameter placeholders.
+
+        Filter ``i`` binds its value as ``:p{i}``; pagination binds ``:limit``
+        and ``:offset``. Entity statements select ``(entity, total_count)`` rows.
+
+        Args:
+            shape: Structural description of the query
+
+        Returns:
+            Select: SQLAlchemy select statement with unbound parameters
 
         Raises:
             ValueError: If entity_type is invalid or field path is malformed
         """
-        from sqlalchemy.orm import selectinload
+        entity_type, filter_shapes, aggregation_shape, load_paths = shape
 
         # Get base model class
-        model = self._get_model_class(entity_type)
+        model = cls._get_model_class(entity_type)
 
-        if aggregation:
+        if aggregation_shape:
             # Build aggregation query
-            query = self._build_aggregation_query(model, aggregation, filters)
-        else:
-            # Build entity query
-            query = select(model)
-
-            # Add eager loading for relationships that ResultConverter needs
-            # This prevents lazy loading errors in async context
-            if entity_type == EntityType.MEETING:
-                query = query.options(selectinload(model.attendees))
-
-            # Collect required relationship paths for joins
-            join_paths_needed: set[str] = set()
-
-            # Apply filters and collect join paths
-            for filter_spec in filters:
-                parts = filter_spec.field.split(".")
-                if len(parts) > 1:
-                    # This field requires joins
-                    relationship_path = ".".join(parts[:-1])
-                    join_paths_needed.add(relationship_path)
-
-                # Parse field to get column
-                column = self._parse_field_path(model, filter_spec.field)
-
-                # Resolve value (handle time shortcuts)
-                value = self._resolve_filter_value(filter_spec.value)
-
-                # Apply operator
-                condition = self._apply_operator(column, filter_spec.operator, value)
-                query = query.where(condition)
-
-            # Apply joins for each relationship path
-            for rel_path in sorted(join_paths_needed):
-                query = self._apply_joins_for_path(query, model, entity_type, rel_path)
-
-            # Apply ordering (default: created_at DESC)
-            if hasattr(model, "created_at"):
-                query = query.order_by(model.created_at.desc())
-            elif hasattr(model, "start_time"):
-                query = query.order_by(model.start_time.desc())
-
-            # Apply pagination
-            if limit:
-                query = query.limit(limit)
-            if offset:
-                query = query.offset(offset)
+            return cls._build_aggregation_query(model, aggregation_shape, filter_shapes)
+
+        # Build entity query; the window count reports the total match count
+        # (before LIMIT/OFFSET) on every row, saving a separate COUNT query
+        query = select(model, func.count().over().label("total_count"))
+
+        # Add eager loading for relationships that ResultConverter needs
+        # This prevents lazy loading errors in async context
+        if entity_type == EntityType.MEETING:
+            query = query.options(selectinload(model.attendees))
+
+        # Eager load caller-requested relationships (one query per relationship level)
+        loaders: list[Any] = []
+        for load_path in load_paths:
+            if any(other.startswith(f"{load_path}.") for other in load_paths):
+                continue  # Covered by a longer path
+            chain = cls._resolve_relationship_chain(model, load_path)
+            loader = selectinload(chain[0])
+            for rel_attr in chain[1:]:
+                loader = loader.selectinload(rel_attr)
+            loaders.append(loader)
+        if loaders:
+            query = query.options(*loaders)
+
+        # Collect required relationship paths for joins
+        join_paths_needed: dict[str, None] = {}  # Insertion-ordered set
+
+        # Build filter conditions and collect join paths
+        conditions: list[Any] = []
+        for index, (field, operator) in enumerate(filter_shapes):
+            relationship_path = cls._relationship_path(model, field)
+            if relationship_path:
+                # This field requires joins
+                join_paths_needed[relationship_path] = None
+
+            conditions.append(cls._filter_condition(model, index, field, operator))
+
+        # Apply all filters at once (AND)
+        if conditions:
+            query = query.where(*conditions)
+
+        # Apply joins for all relationship paths (each relationship once)
+        query = cls._apply_joins(query, model, join_paths_needed)
+
+        # Apply ordering (default: created_at DESC)
+        if hasattr(model, "created_at"):
+            query = query.order_by(model.created_at.desc())
+        elif hasattr(model, "start_time"):
+            query = query.order_by(model.start_time.desc())
+
+        # Apply pagination (always bound, so pagination never changes the shape)
+        query = query.limit(bindparam("limit", type_=Integer))
+        query = query.offset(bindparam("offset", type_=Integer))
 
         return query
 
+    @classmethod
     def _build_aggregation_query(
-        self,
+        cls,
         model: type[Any],
-        aggregation: AggregationSpec,
-        filters: list[FilterSpec],
+        aggregation: AggregationShape,
+        filters: tuple[FilterShape, ...],
     ) -> Select[Any]:
         """
         Build aggregation query with GROUP BY.
 
         Args:
             model: SQLAlchemy model class
-            aggregation: Aggregation specification
-            filters: Filter specifications
+            aggregation: Aggregation shape (function, field, group_by)
+            filters: Filter shapes (field, operator)
 
         Returns:
             Select: SQLAlchemy select with aggregation
         """
+        function, field, group_by = aggregation
+
         # Parse field path for aggregation field
-        if aggregation.field != "*":
-            agg_column = self._parse_field_path(model, aggregation.field)
+        if field != "*":
+            agg_column = cls._parse_field_path(model, field)
         else:
             # For COUNT(*), use model itself
             agg_column = None
 
         # Apply aggregation function
-        agg_expr = self._apply_aggregation_function(
-            aggregation.function,
+        agg_expr = cls._apply_aggregation_function(
+            function,
             agg_column if agg_column is not None else model.id,
         )
 
         # Parse GROUP BY columns and track needed joins
-        group_columns = []
-        join_paths_needed: set[str] = set()
-
-        if aggregation.group_by:
-            for field_path in aggregation.group_by:
-                group_columns.append(self._parse_field_path(model, field_path))
-                # Track if this field requires a join
-                parts = field_path.split(".")
-                if len(parts) > 1:
-                    relationship_path = ".".join(parts[:-1])
-                    join_paths_needed.add(relationship_path)
-
-        # Build query with aggregation
-        if aggregation.group_by:
-            query = select(*group_columns, agg_expr)
-        else:
-            # Global aggregation (no GROUP BY)
-            query = select(agg_expr)
-
-        # Apply joins needed for GROUP BY columns
-        entity_type = self._get_entity_type(model)
-        for rel_path in sorted(join_paths_needed):
-            query = self._apply_joins_for_path(query, model, entity_type, rel_path)
-
-        # Apply filters and their joins
-        for filter_spec in filters:
-            # Track filter join needs
-            parts = filter_spec.field.split(".")
-            if len(parts) > 1:
-                relationship_path = ".".join(parts[:-1])
-                if relationship_path not in join_paths_needed:
-                    # Add join if not already added for GROUP BY
-                    query = self._apply_joins_for_path(query, model, entity_type, relationship_path)
-                    join_paths_needed.add(relationship_path)
-
-            # Parse and apply filter
-            column = self._parse_field_path(model, filter_spec.field)
-            value = self._resolve_filter_value(filter_spec.value)
-            condition = self._apply_operator(column, filter_spec.operator, value)
-            query = query.where(condition)
+        group_columns = tuple(cls._parse_field_path(model, field_path) for field_path in group_by)
+        join_paths_needed: dict[str, None] = {}  # Insertion-ordered set
+
+        for field_path in group_by:
+            # Track if this field requires a join
+            relationship_path = cls._relationship_path(model, field_path)
+            if relationship_path:
+                join_paths_needed[relationship_path] = None
+
+        # Build query with aggregation (no group columns for global aggregation)
+        query: Select[Any] = select(*group_columns, agg_expr)
+
+        # Build filter conditions and collect their join paths
+        conditions: list[Any] = []
+        for index, (filter_field, operator) in enumerate(filters):
+            relationship_path = cls._relationship_path(model, filter_field)
+            if relationship_path:
+                join_paths_needed[relationship_path] = None
+
+            conditions.append(cls._filter_condition(model, index, filter_field, operator))
+
+        # Apply all filters at once (AND)
+        if conditions:
+            query = query.where(*conditions)
+
+        # Apply joins for GROUP BY columns and filters (each relationship once)
+        query = cls._apply_joins(query, model, join_paths_needed)
 
         # Apply GROUP BY
-        if aggregation.group_by:
+        if group_by:
             query = query.group_by(*group_columns)
 
         return query
 
+    @classmethod
+    def _filter_condition(
+        cls,
+        model: type[Any],
+        index: int,
+        field: str,
+        operator: FilterOperator,
+    ) -> Any:
+        """
+        Build the WHERE condition for one filter with a bind placeholder.
+
+        Args:
+            model: Base model class
+            index: Filter position (names the ``:p{index}`` parameter)
+            field: Dot-separated field path
+            operator: Filter operator enum
+
+        Returns:
+            Boolean expression
+        """
+        column = cls._parse_field_path(model, field)
+        value: BindParameter[Any] | None = (
+            None
+            if operator in _VALUELESS_OPERATORS
+            else bindparam(f"p{index}", expanding=operator in _EXPANDING_OPERATORS)
+        )
+        return cls._apply_operator(column, operator, value)
+
     def _apply_filter(
         self,
         query: Select[Any],
@@ -286,13 +590,14 @@ class QueryBuilder:
         condition = self._apply_operator(
             column,
             filter_spec.operator,
-            value,
+            self._bind_value(filter_spec.operator, value),
         )
 
         return query.where(condition)
 
+    @classmethod
     def _apply_operator(
-        self,
+        cls,
         column: ColumnElement[Any],
         operator: FilterOperator,
         value: Any,
@@ -303,7 +608,7 @@ class QueryBuilder:
         Args:
             column: SQLAlchemy column
             operator: Filter operator enum
-            value: Filter value
+            value: Bind parameter or value already shaped by _bind_value()
 
         Returns:
             Boolean expression
@@ -311,44 +616,89 @@ class QueryBuilder:
         Raises:
             ValueError: If operator is not supported
         """
-        if operator == FilterOperator.EQ:
-            return column == value
-        elif operator == FilterOperator.NE:
-            return column != value
-        elif operator == FilterOperator.GT:
-            return column > value
-        elif operator == FilterOperator.GTE:
-            return column >= value
-        elif operator == FilterOperator.LT:
-            return column < value
-        elif operator == FilterOperator.LTE:
-            return column <= value
-        elif operator == FilterOperator.IN:
-            return column.in_(value)
-        elif operator == FilterOperator.NOT_IN:
-            return column.not_in(value)
-        elif operator == FilterOperator.CONTAINS:
-            return column.ilike(f"%{value}%")
-        elif operator == FilterOperator.STARTS_WITH:
-            return column.ilike(f"{value}%")
-        elif operator == FilterOperator.ENDS_WITH:
-            return column.ilike(f"%{value}")
-        elif operator == FilterOperator.IS_NULL:
-            return column.is_(None)
-        elif operator == FilterOperator.IS_NOT_NULL:
-            return column.is_not(None)
-        elif operator == FilterOperator.HAS_TAG:
-            # PostgreSQL array contains operator (@>)
-            # Check if array contains single value
-            return column.op("@>")([value])
-        elif operator == FilterOperator.HAS_ANY_TAG:
-            # PostgreSQL array overlap operator (&&)
-            return column.op("&&")(value)
-        else:
-            raise ValueError(f"Unsupported operator: {operator}")
+        try:
+            build = cls._OPERATOR_DISPATCH[operator]
+        except KeyError:
+            raise ValueError(f"Unsupported operator: {operator}") from None
+        return build(column, value)
+
+    @staticmethod
+    def _bind_value(operator: FilterOperator, value: Any) -> Any:
+        """
+        Shape a resolved filter value into the bound parameter for an operator.
 
+        Args:
+            operator: Filter operator enum
+            value: Resolved filter value
+
+        Returns:
+            Any: Value to bind (ILIKE pattern, single-tag array, or value as-is)
+        """
+        shape = _BIND_VALUE_SHAPERS.get(operator)
+        return shape(value) if shape else value
+
+    @classmethod
+    def _build_field_cache(
+        cls,
+    ) -> dict[type[Any], dict[str, ResolvedField]]:
+        """
+        Resolve every known column path for every queryable entity up front.
+
+        Covers mapped columns on the base model and on each model reachable
+        through RELATIONSHIP_PATHS, under both model and schema (see
+        FIELD_NAME_MAPPINGS) field names.
+
+        Returns:
+            dict: base model -> {field path: (column, join models, relationship path)}
+        """
+
+        def columns_of(model: type[Any]) -> dict[str, Any]:
+            # Deferred columns (generated search vectors) are not queryable fields
+            columns = {
+                attr.key: getattr(model, attr.key)
+                for attr in sa_inspect(model).column_attrs
+                if not attr.deferred
+            }
+            try:
+                mappings = cls.FIELD_NAME_MAPPINGS[cls._get_entity_type(model)]
+            except ValueError:
+                mappings = {}  # Association models (MeetingAttendee) have no entity type
+            for schema_name, model_name in mappings.items():
+                columns[schema_name] = getattr(model, model_name)
+            return columns
+
+        resolved: dict[type[Any], dict[str, ResolvedField]] = {}
+        for entity_type, paths in cls.RELATIONSHIP_PATHS.items():
+            base_model = cls._get_model_class(entity_type)
+            fields: dict[str, ResolvedField] = {
+                name: (column, (), "") for name, column in columns_of(base_model).items()
+            }
+            for relationship_path, join_models in paths.items():
+                for name, column in columns_of(join_models[-1]).items():
+                    fields[f"{relationship_path}.{name}"] = (column, join_models, relationship_path)
+            resolved[base_model] = fields
+        return resolved
+
+    @classmethod
+    def _relationship_path(cls, base_model: type[Any], field_path: str) -> str:
+        """
+        Return the relationship part of a field path ("" for base-model fields).
+
+        Args:
+            base_model: Base SQLAlchemy model
+            field_path: Dot-separated field path
+
+        Returns:
+            str: Relationship path to join (e.g., "project.client")
+        """
+        resolved = cls._RESOLVED_FIELDS.get(base_model, {}).get(field_path)
+        if resolved is not None:
+            return resolved[2]
+        return field_path.rpartition(".")[0]
+
+    @classmethod
     def _parse_field_path(
-        self,
+        cls,
         base_model: type[Any],
         field_path: str,
     ) -> Any:
@@ -373,16 +723,44 @@ class QueryBuilder:
         Raises:
             ValueError: If field path is invalid
         """
-        parts = field_path.split(".")
+        resolved = cls._RESOLVED_FIELDS.get(base_model, {}).get(field_path)
+        if resolved is not None:
+            return resolved[0]
+
+        # Slow path: non-column attributes and invalid paths (both memoized)
+        column, error = _lookup_field_path(base_model, field_path)  # type: ignore[arg-type]
+        if error is not None:
+            raise ValueError(error)
+        return column
+
+    @classmethod
+    def _resolve_field_path(
+        cls,
+        base_model: type[Any],
+        field_path: str,
+    ) -> Any:
+        """
+        Resolve a field path not covered by _RESOLVED_FIELDS.
+
+        Args:
+            base_model: Base SQLAlchemy model
+            field_path: Dot-separated field path
+
+        Returns:
+            SQLAlchemy attribute for the field
+
+        Raises:
+            ValueError: If field path is invalid
+        """
+        relationship_path, sep, field_name = field_path.rpartition(".")
 
-        if len(parts) == 1:
+        if not sep:
             # Simple field on base model
-            entity_type = self._get_entity_type(base_model)
-            field_name = parts[0]
+            entity_type = cls._get_entity_type(base_model)
 
             # Translate schema field name to model field name if mapping exists
-            if entity_type in self.FIELD_NAME_MAPPINGS:
-                field_name = self.FIELD_NAME_MAPPINGS[entity_type].get(field_name, field_name)
+            if entity_type in cls.FIELD_NAME_MAPPINGS:
+                field_name = cls.FIELD_NAME_MAPPINGS[entity_type].get(field_name, field_name)
 
             if not hasattr(base_model, field_name):
                 raise ValueError(f"Field {field_name} not found on {base_model.__name__}")
@@ -390,32 +768,31 @@ class QueryBuilder:
 
         # Relationship traversal required
         # Get join path from RELATIONSHIP_PATHS
-        entity_type = self._get_entity_type(base_model)
-        relationship_path = ".".join(parts[:-1])
-        field_name = parts[-1]
+        entity_type = cls._get_entity_type(base_model)
 
-        if entity_type not in self.RELATIONSHIP_PATHS:
+        if entity_type not in cls.RELATIONSHIP_PATHS:
             raise ValueError(f"No relationship mappings for {entity_type}")
 
-        if relationship_path not in self.RELATIONSHIP_PATHS[entity_type]:
+        if relationship_path not in cls.RELATIONSHIP_PATHS[entity_type]:
             raise ValueError(f"Relationship path {relationship_path} not found for {entity_type}")
 
         # Get target model (last in join path)
-        join_models = self.RELATIONSHIP_PATHS[entity_type][relationship_path]
+        join_models = cls.RELATIONSHIP_PATHS[entity_type][relationship_path]
         target_model = join_models[-1]
 
         # Translate schema field name to model field name for target model
-        target_entity_type = self._get_entity_type(target_model)
-        if target_entity_type in self.FIELD_NAME_MAPPINGS:
-            field_name = self.FIELD_NAME_MAPPINGS[target_entity_type].get(field_name, field_name)
+        target_entity_type = cls._get_entity_type(target_model)
+        if target_entity_type in cls.FIELD_NAME_MAPPINGS:
+            field_name = cls.FIELD_NAME_MAPPINGS[target_entity_type].get(field_name, field_name)
 
         if not hasattr(target_model, field_name):
             raise ValueError(f"Field {field_name} not found on {target_model.__name__}")
 
         return getattr(target_model, field_name)
 
+    @classmethod
     def _parse_field_path_with_joins(
-        self,
+        cls,
         base_model: type[Any],
         field_path: str,
     ) -> tuple[Any, list[type[Any]]]:
@@ -432,27 +809,29 @@ class QueryBuilder:
         Raises:
             ValueError: If field path is invalid
         """
-        parts = field_path.split(".")
+        resolved = cls._RESOLVED_FIELDS.get(base_model, {}).get(field_path)
+        if resolved is not None:
+            return resolved[0], list(resolved[1])
+
+        relationship_path, sep, field_name = field_path.rpartition(".")
 
-        if len(parts) == 1:
+        if not sep:
             # Simple field on base model - no joins needed
-            if not hasattr(base_model, parts[0]):
-                raise ValueError(f"Field {parts[0]} not found on {base_model.__name__}")
-            return getattr(base_model, parts[0]), []
+            if not hasattr(base_model, field_name):
+                raise ValueError(f"Field {field_name} not found on {base_model.__name__}")
+            return getattr(base_model, field_name), []
 
         # Relationship traversal - get join path
-        entity_type = self._get_entity_type(base_model)
-        relationship_path = ".".join(parts[:-1])
-        field_name = parts[-1]
+        entity_type = cls._get_entity_type(base_model)
 
-        if entity_type not in self.RELATIONSHIP_PATHS:
+        if entity_type not in cls.RELATIONSHIP_PATHS:
             raise ValueError(f"No relationship mappings for {entity_type}")
 
-        if relationship_path not in self.RELATIONSHIP_PATHS[entity_type]:
+        if relationship_path not in cls.RELATIONSHIP_PATHS[entity_type]:
             raise ValueError(f"Relationship path {relationship_path} not found for {entity_type}")
 
         # Get join models
-        join_models = self.RELATIONSHIP_PATHS[entity_type][relationship_path]
+        join_models = cls.RELATIONSHIP_PATHS[entity_type][relationship_path]
         target_model = join_models[-1]
 
         if not hasattr(target_model, field_name):
@@ -460,44 +839,105 @@ class QueryBuilder:
 
         return getattr(target_model, field_name), list(join_models)
 
-    def _apply_joins_for_path(
-        self,
+    @classmethod
+    def _apply_joins(
+        cls,
         query: Select[Any],
         base_model: type[Any],
-        entity_type: EntityType,
-        relationship_path: str,
+        relationship_paths: Collection[str],
     ) -> Select[Any]:
         """
-        Apply joins for a relationship path.
+        Apply the joins for a set of relationship paths.
+
+        The join tree for a set of paths is built once and reused, and is
+        applied with a single select_from().
 
         Args:
             query: Current query
             base_model: Base model class
-            entity_type: Entity type being queried
-            relationship_path: Dot-separated relationship path (e.g., "project.client")
+            relationship_paths: Dot-separated relationship paths (e.g., "project.client")
 
         Returns:
             Select: Query with joins applied
 
+        Raises:
+            ValueError: If a relationship path is invalid
+        """
+        if not relationship_paths:
+            return query
+
+        key = (base_model, tuple(relationship_paths))
+        join_tree = cls._JOIN_TREES.get(key)
+        if join_tree is None:
+            join_tree = cls._build_join_tree(base_model, relationship_paths)
+            cls._JOIN_TREES[key] = join_tree
+        return query.select_from(join_tree)
+
+    @classmethod
+    def _build_join_tree(cls, base_model: type[Any], relationship_paths: Collection[str]) -> Any:
+        """
+        Build one join expression covering a set of relationship paths.
+
+        Shared prefixes are joined once, e.g. "project" and "project.client"
+        join projects a single time.
+
+        Args:
+            base_model: Base model class
+            relationship_paths: Dot-separated relationship paths
+
+        Returns:
+            Join: ORM join rooted at base_model
+
+        Raises:
+            ValueError: If a relationship path is invalid
+        """
+        join_tree: Any = base_model
+        joined: set[str] = set()
+        for relationship_path in relationship_paths:
+            chain = cls._resolve_relationship_chain(base_model, relationship_path)
+            prefix = ""
+            for part, rel_attr in zip(relationship_path.split("."), chain):
+                prefix = f"{prefix}.{part}" if prefix else part
+                if prefix not in joined:
+                    join_tree = orm_join(join_tree, rel_attr.property.mapper.class_, rel_attr)
+                    joined.add(prefix)
+        return join_tree
+
+    @classmethod
+    def _resolve_relationship_chain(
+        cls,
+        base_model: type[Any],
+        relationship_path: str,
+    ) -> tuple[Any, ...]:
+        """
+        Resolve a relationship path to its relationship attributes (memoized).
+
+        Args:
+            base_model: Base model class
+            relationship_path: Dot-separated relationship path (e.g., "project.client")
+
+        Returns:
+            tuple: Relationship attributes to join, in order
+
         Raises:
             ValueError: If relationship path is invalid
         """
-        # Split path into parts
-        parts = relationship_path.split(".")
+        key = (base_model, relationship_path)
+        chain = cls._RELATIONSHIP_CHAINS.get(key)
+        if chain is not None:
+            return chain
 
         # Start from base model
         current_model = base_model
+        attrs = []
 
-        # Apply joins step by step
-        for part in parts:
+        for part in relationship_path.split("."):
             if not hasattr(current_model, part):
                 raise ValueError(f"Model {current_model.__name__} has no relationship '{part}'")
 
             # Get the relationship attribute
             rel_attr = getattr(current_model, part)
-
-            # Apply join using relationship attribute
-            query = query.join(rel_attr)
+            attrs.append(rel_attr)
 
             # Get the target model for next iteration
             # The relationship property has a mapper with the class_
@@ -506,10 +946,13 @@ class QueryBuilder:
             else:
                 raise ValueError(f"Cannot determine target model for relationship '{part}'")
 
-        return query
+        chain = tuple(attrs)
+        cls._RELATIONSHIP_CHAINS[key] = chain
+        return chain
 
+    @classmethod
     def _apply_aggregation_function(
-        self,
+        cls,
         function: AggregationFunction,
         column: ColumnElement[Any],
     ) -> Any:
@@ -526,20 +969,11 @@ class QueryBuilder:
         Raises:
             ValueError: If function is not supported
         """
-        if function == AggregationFunction.COUNT:
-            return func.count(column)
-        elif function == AggregationFunction.SUM:
-            return func.sum(column)
-        elif function == AggregationFunction.AVG:
-            return func.avg(column)
-        elif function == AggregationFunction.MIN:
-            return func.min(column)
-        elif function == AggregationFunction.MAX:
-            return func.max(column)
-        elif function == AggregationFunction.COUNT_DISTINCT:
-            return func.count(func.distinct(column))
-        else:
-            raise ValueError(f"Unsupported aggregation function: {function}")
+        try:
+            build = cls._AGGREGATION_DISPATCH[function]
+        except KeyError:
+            raise ValueError(f"Unsupported aggregation function: {function}") from None
+        return build(column)
 
     def _parse_iso_datetime(self, value: str) -> datetime | str:
         """
@@ -570,7 +1004,12 @@ class QueryBuilder:
             # Not a valid ISO datetime, return as-is
             return value
 
-    def _resolve_filter_value(self, value: Any) -> Any:
+    def _resolve_filter_value(
+        self,
+        value: Any,
+        today: date | None = None,
+        now: datetime | None = None,
+    ) -> Any:
         """
         Resolve filter value (handle time shortcuts and ISO date/datetime strings).
 
@@ -593,6 +1032,8 @@ class QueryBuilder:
 
         Args:
             value: Raw filter value
+            today: Date anchor for date shortcuts (defaults to date.today())
+            now: Datetime anchor for "now" (defaults to datetime.now(timezone.utc))
 
         Returns:
             Any: Resolved value (date | datetime | original)
@@ -600,8 +1041,15 @@ class QueryBuilder:
         if not isinstance(value, str):
             return value
 
+        if value not in _TIME_SHORTCUTS:
+            return self._parse_iso_value(value)
+
         # Handle time shortcuts
-        today = date.today()
+        if value == "now":
+            return now if now is not None else datetime.now(timezone.utc)
+
+        if today is None:
+            today = date.today()
 
         if value == "today":
             return today
@@ -632,11 +1080,19 @@ class QueryBuilder:
                 return date(today.year - 1, 12, 1)
             else:
                 return date(today.year, today.month - 1, 1)
-        elif value == "this_year":
+        else:  # "this_year"
             return today.replace(month=1, day=1)
-        elif value == "now":
-            return datetime.now(timezone.utc)
 
+    def _parse_iso_value(self, value: str) -> Any:
+        """
+        Parse an ISO date or datetime string, returning other strings unchanged.
+
+        Args:
+            value: Raw string filter value
+
+        Returns:
+            Any: Parsed date | datetime, or the original string
+        """
         # Try ISO datetime parsing (strings containing 'T')
         if "T" in value:
             return self._parse_iso_datetime(value)
@@ -650,7 +1106,8 @@ class QueryBuilder:
 
         return value
 
-    def _get_model_class(self, entity_type: EntityType) -> type[Any]:
+    @classmethod
+    def _get_model_class(cls, entity_type: EntityType) -> type[Any]:
         """
         Get SQLAlchemy model class from entity type.
 
@@ -663,23 +1120,13 @@ class QueryBuilder:
         Raises:
             ValueError: If entity_type is not supported
         """
-        mapping = {
-            EntityType.WORK_SESSION: WorkSession,
-            EntityType.MEETING: Meeting,
-            EntityType.PROJECT: Project,
-            EntityType.CLIENT: Client,
-            EntityType.PERSON: Person,
-            EntityType.EMPLOYER: Employer,
-            EntityType.NOTE: Note,
-            EntityType.REMINDER: Reminder,
-        }
-
-        if entity_type not in mapping:
-            raise ValueError(f"Unsupported entity type: {entity_type}")
-
-        return mapping[entity_type]
+        try:
+            return cls._MODEL_BY_ENTITY[entity_type]
+        except KeyError:
+            raise ValueError(f"Unsupported entity type: {entity_type}") from None
 
-    def _get_entity_type(self, model: type[Any]) -> EntityType:
+    @classmethod
+    def _get_entity_type(cls, model: type[Any]) -> EntityType:
         """
         Get entity type from SQLAlchemy model class.
 
@@ -692,18 +1139,57 @@ class QueryBuilder:
         Raises:
             ValueError: If model is not recognized
         """
-        reverse_mapping = {
-            WorkSession: EntityType.WORK_SESSION,
-            Meeting: EntityType.MEETING,
-            Project: EntityType.PROJECT,
-            Client: EntityType.CLIENT,
-            Person: EntityType.PERSON,
-            Employer: EntityType.EMPLOYER,
-            Note: EntityType.NOTE,
-            Reminder: EntityType.REMINDER,
-        }
+        try:
+            return cls._ENTITY_BY_MODEL[model]
+        except KeyError:
+            raise ValueError(f"Unknown model: {model}") from None
+
+
+# The lookup tables back cached statements and field resolutions, so they
+# must not change after import
+QueryBuilder.RELATIONSHIP_PATHS = _freeze(QueryBuilder.RELATIONSHIP_PATHS)
+QueryBuilder.FIELD_NAME_MAPPINGS = _freeze(QueryBuilder.FIELD_NAME_MAPPINGS)
+QueryBuilder._RESOLVED_FIELDS = _freeze(QueryBuilder._build_field_cache())
+QueryBuilder._BASE_SELECTS = QueryBuilder._build_base_selects()
 
-        if model not in reverse_mapping:
-            raise ValueError(f"Unknown model: {model}")
 
-        return reverse_mapping[model]
+@functools.lru_cache(maxsize=512)
+def _build_query_skeleton(shape: QueryShape) -> Select[Any]:
+    """
+    Return the cached statement skeleton for a query shape.
+
+    Reusing one Select per shape skips statement construction and lets
+    SQLAlchemy's compiled cache hit on every repeat of the shape.
+    """
+    return QueryBuilder._build_skeleton(shape)
+
+
+@functools.lru_cache(maxsize=1024)
+def _lookup_field_path(base_model: type[Any], field_path: str) -> tuple[Any, str | None]:
+    """
+    Return the memoized slow-path resolution of a field path.
+
+    Invalid paths are cached too, as ``(None, error message)``, so a client
+    repeating a bad field does not re-walk the relationship mappings.
+    """
+    try:
+        return QueryBuilder._resolve_field_path(base_model, field_path), None
+    except ValueError as exc:
+        return None, str(exc)
+
+
+@functools.lru_cache(maxsize=512)
+def _filter_binders(
+    filter_shapes: tuple[FilterShape, ...],
+) -> tuple[tuple[int, str, Callable[[Any], Any] | None], ...]:
+    """
+    Return the per-filter binding plan for a filter shape.
+
+    Each entry is (filter index, parameter name, value shaper or None);
+    filters whose operator takes no value are left out.
+    """
+    return tuple(
+        (index, f"p{index}", _BIND_VALUE_SHAPERS.get(operator))
+        for index, (_, operator) in enumerate(filter_shapes)
+        if operator not in _VALUELESS_OPERATORS
+    )
@@ -1,26 +1,32 @@
 """Query parsing service for natural language queries."""
 
+import calendar
+import functools
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from datetime import date, timedelta
+from enum import Enum
+from typing import Any, ClassVar
 
 from ..models.base import ClientStatus, EntityType, PrivacyLevel, ProjectStatus
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedQuery:
     """
     Parsed natural language query with extracted filters.
 
     Contains all filters extracted from user query to be passed
-    to QueryService.flexible_query().
+    to QueryService.flexible_query(). Instances returned by
+    QueryParser.parse() are cached and shared, so the multi-valued filters
+    are tuples: nothing a caller does can change a cached result.
     """
 
-    entity_types: list[EntityType] | None = None
+    entity_types: tuple[EntityType, ...] | None = None
     start_date: date | None = None
     end_date: date | None = None
-    privacy_levels: list[PrivacyLevel] | None = None
+    privacy_levels: tuple[PrivacyLevel, ...] | None = None
     include_private: bool = True
     search_text: str | None = None
     project_id: int | None = None
@@ -32,47 +38,140 @@ class ParsedQuery:
     client_status: str | None = None
 
 
+# Common lowercase query prefixes stripped before search text extraction
+_PREFIXES = ("show me ", "find ", "search ", "get ", "list ", "what ", "how many ")
+
+# Filler words and prepositions, plus common entity-related words that appear
+# in natural queries (work, meet, note, remind, track, log, record)
+_FILLER = frozenset(
+    (
+        "did do does is are was were have has had in on at for from to the a an i my me "
+        "work worked meet met note noted remind reminded track tracked log logged "
+        "record recorded"
+    ).split()
+)
+
+# Punctuation dropped from search text
+_PUNCT_TABLE = str.maketrans("", "", "?!,.")
+
+
+@functools.lru_cache(maxsize=8)
+def _this_week_range(today: date) -> tuple[date, date]:
+    """
+    Calculate this week's date range (Monday through today).
+
+    Args:
+        today: Reference date
+
+    Returns:
+        tuple[date, date]: (monday, today)
+    """
+    return (today - timedelta(days=today.weekday()), today)
+
+
+@functools.lru_cache(maxsize=8)
+def _last_week_range(today: date) -> tuple[date, date]:
+    """
+    Calculate last week's date range (Monday through Sunday).
+
+    Args:
+        today: Reference date
+
+    Returns:
+        tuple[date, date]: (monday, sunday) of last week
+    """
+    return (
+        today - timedelta(days=today.weekday() + 7),
+        today - timedelta(days=today.weekday() + 1),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _this_month_range(today: date) -> tuple[date, date]:
+    """
+    Calculate this month's date range (first of month through today).
+
+    Args:
+        today: Reference date
+
+    Returns:
+        tuple[date, date]: (first_day, today)
+    """
+    return (today.replace(day=1), today)
+
+
+@functools.lru_cache(maxsize=8)
+def _last_month_range(today: date) -> tuple[date, date]:
+    """
+    Calculate last month's date range.
+
+    Args:
+        today: Reference date
+
+    Returns:
+        tuple[date, date]: (first_day, last_day) of last month
+    """
+    # First day of current month
+    first_of_this_month = today.replace(day=1)
+    # Last day of last month
+    last_of_last_month = first_of_this_month - timedelta(days=1)
+    # First day of last month
+    first_of_last_month = last_of_last_month.replace(day=1)
+
+    return (first_of_last_month, last_of_last_month)
+
+
+@functools.lru_cache(maxsize=8)
+def _this_year_range(today: date) -> tuple[date, date]:
+    """
+    Calculate this year's date range (January 1st through today).
+
+    Args:
+        today: Reference date
+
+    Returns:
+        tuple[date, date]: (first_day, today)
+    """
+    return (today.replace(month=1, day=1), today)
+
+
 class QueryParser:
     """
     Pattern-based natural language query parser.
 
     Extracts entity types, filters, and date ranges from natural language
     queries WITHOUT using LLMs. Uses regex patterns for common query forms.
+
+    The pattern tables are class attributes to be overridden in a subclass; the
+    fused matching regexes are compiled per class from that class's tables.
     """
 
     # Entity type patterns
-    ENTITY_PATTERNS = {
-        EntityType.WORK_SESSION: [
-            r"\b(work\s+sessions?|time\s+entries|hours?)\b",
-            r"\bworked\b",
-        ],
-        EntityType.MEETING: [r"\b(meetings?|calls?)\b"],
-        EntityType.PROJECT: [r"\b(projects?)\b"],
-        EntityType.PERSON: [r"\b(people|persons?|contacts?)\b"],
-        EntityType.CLIENT: [r"\b(clients?)\b"],
-        EntityType.EMPLOYER: [r"\b(employers?)\b"],
-        EntityType.NOTE: [r"\b(notes?)\b"],
-        EntityType.REMINDER: [r"\b(reminders?|todos?)\b"],
+    ENTITY_PATTERNS: dict[EntityType, re.Pattern[str]] = {
+        EntityType.WORK_SESSION: re.compile(r"\b(work\s+sessions?|time\s+entries|hours?|worked)\b"),
+        EntityType.MEETING: re.compile(r"\b(meetings?|calls?)\b"),
+        EntityType.PROJECT: re.compile(r"\b(projects?)\b"),
+        EntityType.PERSON: re.compile(r"\b(people|persons?|contacts?)\b"),
+        EntityType.CLIENT: re.compile(r"\b(clients?)\b"),
+        EntityType.EMPLOYER: re.compile(r"\b(employers?)\b"),
+        EntityType.NOTE: re.compile(r"\b(notes?)\b"),
+        EntityType.REMINDER: re.compile(r"\b(reminders?|todos?)\b"),
     }
 
-    # Date range patterns - use regex for flexible matching
-    DATE_PATTERNS: dict[str, "Callable[[], tuple[date, date]]"] = {
-        r"\btoday\b": lambda: (date.today(), date.today()),
-        r"\byesterday\b": lambda: (
-            date.today() - timedelta(days=1),
-            date.today() - timedelta(days=1),
-        ),
-        r"\bthis\s+week\b": lambda: (
-            date.today() - timedelta(days=date.today().weekday()),
-            date.today(),
+    # Date range patterns - use regex for flexible matching. Each range function
+    # takes a single "today" snapshot so start and end are always consistent;
+    # the calendar ranges are cached per day.
+    DATE_PATTERNS: dict[re.Pattern[str], "Callable[[date], tuple[date, date]]"] = {
+        re.compile(r"\btoday\b"): lambda t: (t, t),
+        re.compile(r"\byesterday\b"): lambda t: (
+            t - timedelta(days=1),
+            t - timedelta(days=1),
         ),
-        r"\blast\s+week\b": lambda: (
-            date.today() - timedelta(days=date.today().weekday() + 7),
-            date.today() - timedelta(days=date.today().weekday() + 1),
-        ),
-        r"\bthis\s+month\b": lambda: (date.today().replace(day=1), date.today()),
-        r"\blast\s+month\b": lambda: _last_month_range(),
-        r"\bthis\s+year\b": lambda: (date.today().replace(month=1, day=1), date.today()),
+        re.compile(r"\bthis\s+week\b"): _this_week_range,
+        re.compile(r"\blast\s+week\b"): _last_week_range,
+        re.compile(r"\bthis\s+month\b"): _this_month_range,
+        re.compile(r"\blast\s+month\b"): _last_month_range,
+        re.compile(r"\bthis\s+year\b"): _this_year_range,
     }
 
     # Month name patterns - dynamically matches month names
@@ -92,26 +191,91 @@ class QueryParser:
     }
 
     # Privacy level patterns
-    PRIVACY_PATTERNS = {
-        PrivacyLevel.PUBLIC: [r"\bpublic\b"],
-        PrivacyLevel.INTERNAL: [r"\binternal\b"],
-        PrivacyLevel.PRIVATE: [r"\bprivate\b"],
+    PRIVACY_PATTERNS: dict[PrivacyLevel, re.Pattern[str]] = {
+        PrivacyLevel.PUBLIC: re.compile(r"\bpublic\b"),
+        PrivacyLevel.INTERNAL: re.compile(r"\binternal\b"),
+        PrivacyLevel.PRIVATE: re.compile(r"\bprivate\b"),
     }
 
     # Project status patterns
-    PROJECT_STATUS_PATTERNS = {
-        ProjectStatus.ACTIVE: [r"\bactive\b"],
-        ProjectStatus.PAUSED: [r"\bpaused\b"],
-        ProjectStatus.COMPLETED: [r"\bcompleted\b"],
+    PROJECT_STATUS_PATTERNS: dict[ProjectStatus, re.Pattern[str]] = {
+        ProjectStatus.ACTIVE: re.compile(r"\bactive\b"),
+        ProjectStatus.PAUSED: re.compile(r"\bpaused\b"),
+        ProjectStatus.COMPLETED: re.compile(r"\bcompleted\b"),
     }
 
-    # Client status patterns
-    CLIENT_STATUS_PATTERNS = {
-        ClientStatus.ACTIVE: [r"\bactive\b"],
-        ClientStatus.PAST: [r"\bpast\b"],
+    # Client status patterns. "active" is shared with project status: one match
+    # sets both filters, and each only applies to its own entity type.
+    CLIENT_STATUS_PATTERNS: dict[ClientStatus, re.Pattern[str]] = {
+        ClientStatus.ACTIVE: re.compile(r"\bactive\b"),
+        ClientStatus.PAST: re.compile(r"\bpast\b"),
     }
 
-    def parse(self, query_text: str) -> ParsedQuery:
+    # Fused regexes and lookups derived from the tables above (populated after the
+    # class body, and again for every subclass; see _compile_patterns)
+    _MONTH_RE: ClassVar[re.Pattern[str]]
+    _TAG_RE: ClassVar[re.Pattern[str]]
+    _TAG_HITS: ClassVar[Mapping[str, tuple[tuple[str, Enum], ...]]]
+    _PROJECT_STATUS_PROBES: ClassVar[tuple[tuple[tuple[str, Enum], str], ...]]
+    _CLIENT_STATUS_PROBES: ClassVar[tuple[tuple[tuple[str, Enum], str], ...]]
+    _REMOVAL_RE: ClassVar[re.Pattern[str]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Compile a subclass's fused regexes from its own pattern tables."""
+        super().__init_subclass__(**kwargs)
+        cls._compile_patterns()
+
+    @classmethod
+    def _compile_patterns(cls) -> None:
+        """
+        Compile the fused matching regexes from this class's pattern tables.
+
+        Sets _MONTH_RE (any month name; group 1 is the name), _TAG_RE/_TAG_HITS
+        (entity, privacy and status keywords tagged in one scan), the status
+        probes, and _REMOVAL_RE (every pattern stripped from search text).
+        """
+        cls._MONTH_RE = re.compile(rf"\b({'|'.join(cls.MONTH_NAMES)})\b")
+        cls._TAG_RE, cls._TAG_HITS = _build_tag_regex(
+            (
+                ("ENT", cls.ENTITY_PATTERNS),
+                ("PRV", cls.PRIVACY_PATTERNS),
+                ("PST", cls.PROJECT_STATUS_PATTERNS),
+                ("CST", cls.CLIENT_STATUS_PATTERNS),
+            )
+        )
+
+        # Status (tag, value) pairs in declaration order, so parse() can return the
+        # value string of the first tagged status without touching the enum
+        cls._PROJECT_STATUS_PROBES = tuple(
+            (("PST", status), status.value) for status in cls.PROJECT_STATUS_PATTERNS
+        )
+        cls._CLIENT_STATUS_PROBES = tuple(
+            (("CST", status), status.value) for status in cls.CLIENT_STATUS_PATTERNS
+        )
+
+        # Date patterns come first so multi-word ranges ("last week") win over
+        # shorter alternatives starting at the same position
+        cls._REMOVAL_RE = re.compile(
+            "|".join(
+                f"(?:{pattern.pattern})"
+                for pattern in (
+                    *cls.DATE_PATTERNS,
+                    cls._MONTH_RE,
+                    *cls.ENTITY_PATTERNS.values(),
+                    *cls.PRIVACY_PATTERNS.values(),
+                    *cls.PROJECT_STATUS_PATTERNS.values(),
+                    *cls.CLIENT_STATUS_PATTERNS.values(),
+                )
+            )
+        )
+
+    def __init__(self) -> None:
+        """Initialize query parser with its own parse() result cache."""
+        # Per instance: results depend on the class's pattern tables, so a
+        # subclass never receives results computed by another parser
+        self._parse_cached = functools.lru_cache(maxsize=512)(self._parse_on_day)
+
+    def parse(self, query_text: str, extract_search_text: bool = True) -> ParsedQuery:
         """
         Parse natural language query into structured filters.
 
@@ -124,6 +288,8 @@ class QueryParser:
 
         Args:
             query_text: Natural language query string
+            extract_search_text: Whether to compute search_text; callers that only
+                need structured filters can pass False to skip that pipeline
 
         Returns:
             ParsedQuery: Structured filters for QueryService
@@ -132,27 +298,75 @@ class QueryParser:
             >>> parser = QueryParser()
             >>> parsed = parser.parse("Show me work sessions from last week")
             >>> parsed.entity_types
-            [EntityType.WORK_SESSION]
+            (EntityType.WORK_SESSION,)
             >>> parsed.start_date
             datetime.date(2026, 1, 6)
         """
-        query_lower = query_text.lower()
+        # Results depend on the current day for relative ranges, so it is part of the key
+        return self._parse_cached(query_text, date.today().toordinal(), extract_search_text)
 
-        # Extract entity types
-        entity_types = self._extract_entity_types(query_lower)
+    def _parse_on_day(
+        self, query_text: str, today_ordinal: int, extract_search_text: bool
+    ) -> ParsedQuery:
+        """
+        Parse a query for a given day; memoized per instance by parse().
 
-        # Extract date range
-        start_date, end_date = self._extract_date_range(query_lower)
+        Keying on the day ordinal lets cached relative ranges roll over at midnight.
+
+        Args:
+            query_text: Natural language query string
+            today_ordinal: date.today().toordinal() at call time
+            extract_search_text: Whether to compute search_text
+
+        Returns:
+            ParsedQuery: Shared, read-only parse result
+        """
+        return self._parse(query_text, date.fromordinal(today_ordinal), extract_search_text)
+
+    def _parse(self, query_text: str, today: date, extract_search_text: bool = True) -> ParsedQuery:
+        """
+        Parse a query against a fixed reference date (uncached).
+
+        Args:
+            query_text: Natural language query string
+            today: Reference date for relative date ranges
+            extract_search_text: Whether to compute search_text
+
+        Returns:
+            ParsedQuery: Structured filters for QueryService
+        """
+        # All patterns are lowercase and compiled without IGNORECASE, so the
+        # query is lowercased once and every scan runs on that copy
+        query_lower = query_text.lower()
 
-        # Extract privacy levels
-        privacy_levels = self._extract_privacy_levels(query_lower)
+        # Fast path: _REMOVAL_RE is the union of every tag, date and month
+        # pattern, so a miss means only search text can be extracted
+        if self._REMOVAL_RE.search(query_lower) is None:
+            if not extract_search_text:
+                return ParsedQuery()
+            return ParsedQuery(search_text=self._extract_search_text(query_lower))
+
+        # Entity, privacy and status keywords are tagged in a single scan
+        hits: set[tuple[str, Enum]] = set()
+        for match in self._TAG_RE.finditer(query_lower):
+            if match.lastgroup:
+                hits.update(self._TAG_HITS[match.lastgroup])
+
+        # Preserve declaration order of each pattern table
+        entity_types = tuple(e for e in self.ENTITY_PATTERNS if ("ENT", e) in hits)
+        privacy_levels = tuple(p for p in self.PRIVACY_PATTERNS if ("PRV", p) in hits)
+        project_status = next(
+            (value for tag, value in self._PROJECT_STATUS_PROBES if tag in hits), None
+        )
+        client_status = next(
+            (value for tag, value in self._CLIENT_STATUS_PROBES if tag in hits), None
+        )
 
-        # Extract status filters
-        project_status = self._extract_project_status(query_lower)
-        client_status = self._extract_client_status(query_lower)
+        # Extract date range
+        start_date, end_date = self._extract_date_range(query_lower, today)
 
         # Extract search text (words not part of patterns)
-        search_text = self._extract_search_text(query_text)
+        search_text = self._extract_search_text(query_lower) if extract_search_text else None
 
         # Build ParsedQuery
         return ParsedQuery(
@@ -167,193 +381,127 @@ class QueryParser:
             limit=None,  # No limit by default
         )
 
-    def _extract_entity_types(self, query_lower: str) -> list[EntityType]:
-        """
-        Extract entity types from query text.
-
-        Args:
-            query_lower: Lowercase query text
-
-        Returns:
-            list[EntityType]: Matched entity types (empty if none found)
-        """
-        entity_types = []
-        for entity_type, patterns in self.ENTITY_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, query_lower):
-                    entity_types.append(entity_type)
-                    break  # Only add each entity type once
-
-        return entity_types
-
-    def _extract_date_range(self, query_lower: str) -> tuple[date | None, date | None]:
+    def _extract_date_range(
+        self, query_lower: str, today: date | None = None
+    ) -> tuple[date | None, date | None]:
         """
         Extract date range from query text.
 
         Args:
             query_lower: Lowercase query text
+            today: Reference date (defaults to date.today())
 
         Returns:
             tuple[date | None, date | None]: (start_date, end_date)
         """
-        import re
+        # One clock read per parse keeps every range computed from the same day
+        if today is None:
+            today = date.today()
 
         # Check date patterns (regex)
-        for pattern_regex, range_func in self.DATE_PATTERNS.items():
-            if re.search(pattern_regex, query_lower):
-                return range_func()
-
-        # Check month names
-        for month_name, month_num in self.MONTH_NAMES.items():
-            if month_name in query_lower:
-                # Extract month range for current year
-                year = date.today().year
-                # First day of month
-                start = date(year, month_num, 1)
-                # Last day of month
-                if month_num == 12:
-                    end = date(year, 12, 31)
-                else:
-                    end = date(year, month_num + 1, 1) - timedelta(days=1)
-                return (start, end)
+        for pattern, range_func in self.DATE_PATTERNS.items():
+            if pattern.search(query_lower):
+                return range_func(today)
+
+        # Check month names (first month mentioned wins)
+        match = self._MONTH_RE.search(query_lower)
+        if match:
+            # Extract month range for current year
+            year = today.year
+            month_num = self.MONTH_NAMES[match.group(1)]
+            end_day = _MONTH_END_DAY[month_num - 1]
+            if month_num == 2 and calendar.isleap(year):
+                end_day = 29
+            return (date(year, month_num, 1), date(year, month_num, end_day))
 
         return (None, None)
 
-    def _extract_privacy_levels(self, query_lower: str) -> list[PrivacyLevel]:
+    def _extract_search_text(self, query_lower: str) -> str | None:
         """
-        Extract privacy levels from query text.
+        Extract search text from query.
+
+        Removes common query prefixes and date/entity patterns
+        to get the core search terms.
 
         Args:
             query_lower: Lowercase query text
 
         Returns:
-            list[PrivacyLevel]: Matched privacy levels (empty if none found)
+            str | None: Lowercase search text or None if empty
         """
-        privacy_levels = []
-        for privacy_level, patterns in self.PRIVACY_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, query_lower):
-                    privacy_levels.append(privacy_level)
-                    break
-
-        return privacy_levels
+        # Remove common query prefixes
+        text = query_lower
+        for prefix in _PREFIXES:
+            if text.startswith(prefix):
+                text = text[len(prefix) :]
+                break
 
-    def _extract_project_status(self, query_lower: str) -> str | None:
-        """
-        Extract project status from query text.
+        # Remove date, month, entity, privacy and status patterns in one pass
+        text = self._REMOVAL_RE.sub("", text)
 
-        Args:
-            query_lower: Lowercase query text
+        # Remove punctuation
+        text = text.translate(_PUNCT_TABLE)
 
-        Returns:
-            str | None: Matched project status value or None
-        """
-        for status, patterns in self.PROJECT_STATUS_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, query_lower):
-                    return status.value
+        # Drop filler words; splitting on whitespace also normalizes spacing
+        text = " ".join(word for word in text.split() if word not in _FILLER)
 
-        return None
+        # Return None if empty
+        return text if text else None
 
-    def _extract_client_status(self, query_lower: str) -> str | None:
-        """
-        Extract client status from query text.
 
-        Args:
-            query_lower: Lowercase query text
+# Last day of each month in a non-leap year, indexed by month number - 1
+_MONTH_END_DAY = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 
-        Returns:
-            str | None: Matched client status value or None
-        """
-        for status, patterns in self.CLIENT_STATUS_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, query_lower):
-                    return status.value
 
-        return None
+def _build_tag_regex(
+    tag_tables: tuple[tuple[str, Mapping[Any, re.Pattern[str]]], ...],
+) -> tuple[re.Pattern[str], dict[str, tuple[tuple[str, Enum], ...]]]:
+    """
+    Build the named-group regex that tags entity, privacy and status keywords.
 
-    def _extract_search_text(self, query_text: str) -> str | None:
-        """
-        Extract search text from query.
+    Each pattern source is compiled into exactly one named group. A source owned by
+    a single enum member is named ``<CATEGORY>_<MEMBER>`` (e.g. ``ENT_WORK_SESSION``).
+    A source shared by several tables is named after every owning category (e.g.
+    ``PST_CST_ACTIVE`` for "active"), and one hit tags all of its owners.
 
-        Removes common query prefixes and date/entity patterns
-        to get the core search terms.
+    Args:
+        tag_tables: (category prefix, pattern table) pairs to tag
 
-        Args:
-            query_text: Original query text
+    Returns:
+        tuple: (compiled regex, map of group name to (category, member) hits)
+    """
+    owners_by_source: dict[str, list[tuple[str, Enum]]] = {}
+    for category, table in tag_tables:
+        for member, pattern in table.items():
+            owners_by_source.setdefault(pattern.pattern, []).append((category, member))
 
-        Returns:
-            str | None: Search text or None if empty
-        """
-        # Remove common query prefixes
-        text = re.sub(
-            r"^(show\s+me|find|search|get|list|what|how\s+many)\s+",
-            "",
-            query_text,
-            flags=re.IGNORECASE,
-        )
+    groups: dict[str, str] = {}
+    group_hits: dict[str, tuple[tuple[str, Enum], ...]] = {}
+    for source, owners in owners_by_source.items():
+        categories = "_".join(category for category, _ in owners)
+        name = f"{categories}_{owners[0][1].name}"
+        groups[name] = source
+        group_hits[name] = tuple(owners)
 
-        # Remove date patterns (regex)
-        for pattern_text in self.DATE_PATTERNS.keys():
-            text = re.sub(pattern_text, "", text, flags=re.IGNORECASE)
-
-        # Remove month names
-        for month_name in self.MONTH_NAMES.keys():
-            text = re.sub(rf"\b{month_name}\b", "", text, flags=re.IGNORECASE)
-
-        # Remove entity type patterns
-        for patterns in self.ENTITY_PATTERNS.values():
-            for pattern in patterns:
-                text = re.sub(pattern, "", text, flags=re.IGNORECASE)
-
-        # Remove privacy patterns
-        for patterns in self.PRIVACY_PATTERNS.values():
-            for pattern in patterns:
-                text = re.sub(pattern, "", text, flags=re.IGNORECASE)
-
-        # Remove project status patterns
-        for patterns in self.PROJECT_STATUS_PATTERNS.values():
-            for pattern in patterns:
-                text = re.sub(pattern, "", text, flags=re.IGNORECASE)
-
-        # Remove client status patterns
-        for patterns in self.CLIENT_STATUS_PATTERNS.values():
-            for pattern in patterns:
-                text = re.sub(pattern, "", text, flags=re.IGNORECASE)
-
-        # Remove filler words and prepositions
-        # Also includes common entity-related words that appear in natural queries
-        # (work, meet, note, remind, track, log, record)
-        filler_words = (
-            r"\b(did|do|does|is|are|was|were|have|has|had|in|on|at|for|"
-            r"from|to|the|a|an|i|my|me|work|worked|meet|met|note|noted|"
-            r"remind|reminded|track|tracked|log|logged|record|recorded)\b"
-        )
-        text = re.sub(filler_words, "", text, flags=re.IGNORECASE)
+    regex = re.compile("|".join(f"(?P<{name}>{source})" for name, source in groups.items()))
+    return regex, group_hits
 
-        # Remove punctuation
-        text = re.sub(r"[?!,.]", "", text)
 
-        # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text).strip()
+QueryParser._compile_patterns()
 
-        # Return None if empty
-        return text if text else None
+# One shared instance (and parse cache) serves every module-level parse() call
+_DEFAULT = QueryParser()
 
 
-def _last_month_range() -> tuple[date, date]:
+def parse(query_text: str, extract_search_text: bool = True) -> ParsedQuery:
     """
-    Calculate last month's date range.
+    Parse a natural language query with the shared default parser.
+
+    Args:
+        query_text: Natural language query string
+        extract_search_text: Whether to compute search_text
 
     Returns:
-        tuple[date, date]: (first_day, last_day) of last month
+        ParsedQuery: Structured filters for QueryService
     """
-    today = date.today()
-    # First day of current month
-    first_of_this_month = today.replace(day=1)
-    # Last day of last month
-    last_of_last_month = first_of_this_month - timedelta(days=1)
-    # First day of last month
-    first_of_last_month = last_of_last_month.replace(day=1)
-
-    return (first_of_last_month, last_of_last_month)
+    return _DEFAULT.parse(query_text, extract_search_text)
@@ -1,37 +1,145 @@
 """Query service for flexible multi-entity queries with filtering."""
 
-from datetime import date, datetime
-from typing import TYPE_CHECKING, Any, Optional
-
-from sqlalchemy import or_, select
-from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import date, datetime, time
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
+
+from sqlalchemy import ColumnElement, Integer, Select, String, any_, bindparam, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import selectinload
 
 from ..models.base import EntityType, PrivacyLevel
+from ..models.types import SEARCH_CONFIG
+from ..schemas.query_structured import AggregationFunction
+from .query_builder import LIKE_ESCAPE, QueryBuilder, escape_like
+from .result_converter import ResultConverter
 
 if TYPE_CHECKING:
     from ..schemas.query_structured import AggregationSpec, FilterSpec
+
 from ..models.client import Client
 from ..models.employer import Employer
-from ..models.meeting import Meeting
+from ..models.meeting import Meeting, MeetingAttendee
 from ..models.note import Note
 from ..models.person import Person
 from ..models.project import Project
 from ..models.reminder import Reminder
 from ..models.work_session import WorkSession
 
+# Whole-day bounds for widening date filters on datetime columns
+_DAY_START = time.min
+_DAY_END = time.max
+
+# Entity types flexible_query covers when none are requested
+_ALL_ENTITY_TYPES = frozenset(
+    {
+        EntityType.WORK_SESSION,
+        EntityType.MEETING,
+        EntityType.NOTE,
+        EntityType.PROJECT,
+        EntityType.PERSON,
+        EntityType.CLIENT,
+        EntityType.EMPLOYER,
+        EntityType.REMINDER,
+    }
+)
+
+# Result buckets flexible_query always returns, in output order
+_RESULT_KEYS = (
+    "work_sessions",
+    "meetings",
+    "notes",
+    "reminders",
+    "projects",
+    "people",
+    "clients",
+    "employers",
+    "users",
+)
+
 
 class QueryService:
     """Business logic for flexible cross-entity queries."""
 
-    def __init__(self, session: AsyncSession) -> None:
+    # Rows fetched per server-side cursor round-trip in flexible_query
+    STREAM_CHUNK_SIZE: ClassVar[int] = 200
+
+    # Sessions (pooled connections) one flexible_query call may hold at once;
+    # kept below the engine's pool_size so a single call cannot drain the pool
+    MAX_CONCURRENT_SUBQUERIES: ClassVar[int] = 4
+
+    # Entity type -> (result key, sub-query method, flexible_query filters it
+    # takes besides limit); populated after the class body
+    _SUB_QUERIES: ClassVar[
+        Mapping[EntityType, tuple[str, Callable[..., Awaitable[list[Any]]], tuple[str, ...]]]
+    ]
+
+    # Entity type -> statement builder for flexible_query sub-queries
+    # (populated after the class body; see _flexible_statement)
+    _STATEMENT_BUILDERS: ClassVar[Mapping[EntityType, Callable[[frozenset[str]], Select[Any]]]]
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+    ) -> None:
         """
         Initialize query service.
 
         Args:
             session: Async database session
+            session_factory: Optional session factory. When set, flexible_query
+                runs its per-entity sub-queries concurrently, each on its own
+                session (an AsyncSession cannot run statements concurrently).
+                Those sessions use their own connections and transactions, so
+                they do not see uncommitted writes made on ``session``; the
+                sequential path (no factory) does. Only pass a factory when
+                the caller has nothing pending. structured_query ignores it.
         """
         self.session = session
+        self.session_factory = session_factory
+
+    @staticmethod
+    async def _run_isolated(
+        session_factory: async_sessionmaker[AsyncSession],
+        slots: asyncio.Semaphore,
+        run: Callable[["QueryService"], Awaitable[list[Any]]],
+    ) -> list[Any]:
+        """
+        Run one sub-query on a fresh session.
+
+        Args:
+            session_factory: Factory for the sub-query's own session
+            slots: Bounds how many sub-query sessions are open at once
+            run: Sub-query taking the QueryService bound to the new session
+
+        Returns:
+            list: Sub-query results (detached once the session closes)
+        """
+        async with slots, session_factory() as session:
+            return await run(QueryService(session))
+
+    @staticmethod
+    def _text_match(model: Any, search_text: ColumnElement[str]) -> ColumnElement[bool]:
+        """
+        Full-text match against a model's generated ``searchable`` tsvector.
+
+        The GIN index on ``searchable`` serves the match, so text search no
+        longer scans every row. Matching is by stemmed word, not substring.
+
+        Args:
+            model: Model class with a ``searchable`` column
+            search_text: Search text expression, usually a bind parameter
+                (parsed with plainto_tsquery)
+
+        Returns:
+            ColumnElement[bool]: WHERE clause for the match
+        """
+        tsquery = func.plainto_tsquery(SEARCH_CONFIG, search_text)
+        return model.searchable.bool_op("@@")(tsquery)  # type: ignore[no-any-return]
 
     async def flexible_query(
         self,
@@ -63,7 +171,7 @@ class QueryService:
             privacy_levels: Specific privacy levels to include
             include_private: Include PRIVATE privacy level (default: True)
             search_text: Full-text search on summary/text fields
-                (case-insensitive)
+                (case-insensitive, stemmed words; substring match for people)
             project_id: Filter to specific project
             person_id: Filter to specific person
             client_id: Filter to specific client
@@ -85,108 +193,297 @@ class QueryService:
             raise ValueError("end_date must be after or equal to start_date")
 
         # Default to all entity types if not specified
-        if entity_types is None:
-            entity_types = [
-                EntityType.WORK_SESSION,
-                EntityType.MEETING,
-                EntityType.NOTE,
-                EntityType.PROJECT,
-                EntityType.PERSON,
-                EntityType.CLIENT,
-                EntityType.EMPLOYER,
-                EntityType.REMINDER,
-            ]
-
-        results: dict[str, list[Any]] = {
-            "work_sessions": [],
-            "meetings": [],
-            "notes": [],
-            "reminders": [],
-            "projects": [],
-            "people": [],
-            "clients": [],
-            "employers": [],
-            "users": [],
+        wanted = _ALL_ENTITY_TYPES if entity_types is None else frozenset(entity_types)
+
+        results: dict[str, list[Any]] = {key: [] for key in _RESULT_KEYS}
+
+        # One sub-query per requested entity type, keyed by result bucket;
+        # each sub-query takes only the filters that apply to its entity
+        filters: dict[str, Any] = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "privacy_levels": privacy_levels,
+            "include_private": include_private,
+            "search_text": search_text,
+            "project_id": project_id,
+            "person_id": person_id,
+            "client_id": client_id,
+            "employer_id": employer_id,
+            "include_completed": include_completed,
+            "project_status": project_status,
+            "client_status": client_status,
         }
-
-        # Query work sessions
-        if EntityType.WORK_SESSION in entity_types:
-            results["work_sessions"] = await self._query_work_sessions(
-                start_date=start_date,
-                end_date=end_date,
-                privacy_levels=privacy_levels,
-                include_private=include_private,
-                search_text=search_text,
-                project_id=project_id,
-                employer_id=employer_id,
-                limit=limit,
+        queries: dict[str, Callable[[QueryService], Awaitable[list[Any]]]] = {
+            key: functools.partial(
+                sub_query, limit=limit, **{name: filters[name] for name in names}
             )
+            for entity_type, (key, sub_query, names) in self._SUB_QUERIES.items()
+            if entity_type in wanted
+        }
 
-        # Query meetings
-        if EntityType.MEETING in entity_types:
-            results["meetings"] = await self._query_meetings(
-                start_date=start_date,
-                end_date=end_date,
-                privacy_levels=privacy_levels,
-                include_private=include_private,
-                search_text=search_text,
-                project_id=project_id,
-                person_id=person_id,
-                limit=limit,
+        session_factory = self.session_factory
+        if session_factory is None or len(queries) <= 1:
+            # Nothing to overlap: run on the caller's session, no extra sessions
+            for key, run in queries.items():
+                results[key] = await run(self)
+        else:
+            # Independent round-trips: run them concurrently, one session each
+            slots = asyncio.Semaphore(self.MAX_CONCURRENT_SUBQUERIES)
+            fetched = await asyncio.gather(
+                *(self._run_isolated(session_factory, slots, run) for run in queries.values())
             )
+            results.update(zip(queries, fetched))
 
-        # Query notes
-        if EntityType.NOTE in entity_types:
-            results["notes"] = await self._query_notes(
-                privacy_levels=privacy_levels,
-                include_private=include_private,
-                search_text=search_text,
-                limit=limit,
-            )
+        return results
 
-        # Query projects
-        if EntityType.PROJECT in entity_types:
-            results["projects"] = await self._query_projects(
-                search_text=search_text,
-                client_id=client_id,
-                employer_id=employer_id,
-                project_status=project_status,
-                limit=limit,
-            )
+    async def _fetch_all(self, query: Select[Any], params: dict[str, Any]) -> list[Any]:
+        """
+        Execute a flexible_query statement and collect its entities.
 
-        # Query people
-        if EntityType.PERSON in entity_types:
-            results["people"] = await self._query_people(
-                search_text=search_text,
-                limit=limit,
-            )
+        Rows stream from a server-side cursor in chunks of STREAM_CHUNK_SIZE,
+        so the driver never buffers the whole result set next to the entities.
 
-        # Query clients
-        if EntityType.CLIENT in entity_types:
-            results["clients"] = await self._query_clients(
-                search_text=search_text,
-                client_status=client_status,
-                limit=limit,
-            )
+        Args:
+            query: Statement to execute
+            params: Bind parameter values
+
+        Returns:
+            list: Loaded entities in statement order
+        """
+        result = await self.session.stream_scalars(
+            query, params, execution_options={"yield_per": self.STREAM_CHUNK_SIZE}
+        )
+        return [entity async for entity in result]
+
+    @staticmethod
+    def _filter_params(**values: Any) -> dict[str, Any]:
+        """
+        Collect bind values for the filters that are set.
+
+        A filter is set when its value is truthy; the resulting key set is
+        part of the statement shape.
+
+        Returns:
+            dict: bind parameter name -> value
+        """
+        return {name: value for name, value in values.items() if value}
+
+    @staticmethod
+    def _privacy_shape(
+        params: dict[str, Any],
+        privacy_levels: Optional[list[PrivacyLevel]],
+        include_private: bool,
+    ) -> frozenset[str]:
+        """
+        Bind the privacy filter and return the statement shape.
+
+        Explicit privacy levels take precedence over include_private.
+
+        Args:
+            params: Bind values collected so far (updated in place)
+            privacy_levels: Specific privacy levels to include
+            include_private: Include PRIVATE privacy level
+
+        Returns:
+            frozenset[str]: Names of the active filters
+        """
+        if privacy_levels is not None:
+            params["privacy_levels"] = privacy_levels
+        elif not include_private:
+            return frozenset(params) | {"exclude_private"}
+        return frozenset(params)
+
+    @staticmethod
+    def _privacy_conditions(model: Any, shape: frozenset[str]) -> list[Any]:
+        """Privacy WHERE clauses for a statement shape."""
+        if "privacy_levels" in shape:
+            # One array parameter (= ANY) rather than an expanding IN, so the
+            # SQL text, and its prepared statement, is the same for any
+            # combination of levels
+            levels = bindparam("privacy_levels", type_=ARRAY(model.privacy_level.type))
+            return [model.privacy_level == any_(levels)]
+        if "exclude_private" in shape:
+            return [model.privacy_level != PrivacyLevel.PRIVATE]
+        return []
+
+    @staticmethod
+    def _limited(query: Select[Any], shape: frozenset[str]) -> Select[Any]:
+        """Apply the bound limit when the shape has one."""
+        if "limit" in shape:
+            return query.limit(bindparam("limit", type_=Integer))
+        return query
+
+    @classmethod
+    def _work_sessions_statement(cls, shape: frozenset[str]) -> Select[Any]:
+        """Build the work session statement for a filter shape."""
+        query = select(WorkSession).order_by(WorkSession.date.desc())
 
-        # Query employers
-        if EntityType.EMPLOYER in entity_types:
-            results["employers"] = await self._query_employers(
-                search_text=search_text,
-                limit=limit,
+        # Date filters
+        if "start_date" in shape:
+            query = query.where(WorkSession.date >= bindparam("start_date"))
+        if "end_date" in shape:
+            query = query.where(WorkSession.date <= bindparam("end_date"))
+
+        query = query.where(*cls._privacy_conditions(WorkSession, shape))
+
+        # Project filter
+        if "project_id" in shape:
+            query = query.where(WorkSession.project_id == bindparam("project_id"))
+
+        # Employer filter (requires join to project)
+        if "employer_id" in shape:
+            query = query.join(Project).where(Project.on_behalf_of_id == bindparam("employer_id"))
+
+        # Text search
+        if "search_text" in shape:
+            query = query.where(cls._text_match(WorkSession, bindparam("search_text")))
+
+        if "employer_id" in shape and "limit" in shape:
+            # Pick the page's ids in a MATERIALIZED CTE so the project join and
+            # LIMIT run over narrow id rows before full sessions are fetched
+            page = (
+                cls._limited(query.with_only_columns(WorkSession.id), shape)
+                .cte("work_session_page")
+                .prefix_with("MATERIALIZED")
             )
+            return (
+                select(WorkSession)
+                .join(page, WorkSession.id == page.c.id)
+                .order_by(WorkSession.date.desc())
+            )
+
+        return cls._limited(query, shape)
 
-        # Query reminders
-        if EntityType.REMINDER in entity_types:
-            results["reminders"] = await self._query_reminders(
-                start_date=start_date,
-                end_date=end_date,
-                search_text=search_text,
-                include_completed=include_completed,
-                limit=limit,
+    @classmethod
+    def _meetings_statement(cls, shape: frozenset[str]) -> Select[Any]:
+        """Build the meeting statement for a filter shape."""
+        query = (
+            select(Meeting)
+            .options(selectinload(Meeting.attendees))
+            .order_by(Meeting.start_time.desc())
+        )
+
+        # Date filters (bound as datetimes)
+        if "start_date" in shape:
+            query = query.where(Meeting.start_time >= bindparam("start_date"))
+        if "end_date" in shape:
+            query = query.where(Meeting.start_time <= bindparam("end_date"))
+
+        query = query.where(*cls._privacy_conditions(Meeting, shape))
+
+        # Project filter
+        if "project_id" in shape:
+            query = query.where(Meeting.project_id == bindparam("project_id"))
+
+        # Person filter: EXISTS semi-join on attendees. A plain JOIN (or
+        # contains_eager over it) would trim the loaded attendee list to the
+        # filtered person; selectinload still fetches the full list.
+        if "person_id" in shape:
+            query = query.where(
+                Meeting.attendees.any(MeetingAttendee.person_id == bindparam("person_id"))
             )
 
-        return results
+        # Text search (title and summary)
+        if "search_text" in shape:
+            query = query.where(cls._text_match(Meeting, bindparam("search_text")))
+
+        return cls._limited(query, shape)
+
+    @classmethod
+    def _notes_statement(cls, shape: frozenset[str]) -> Select[Any]:
+        """Build the note statement for a filter shape."""
+        query = select(Note).order_by(Note.created_at.desc())
+        query = query.where(*cls._privacy_conditions(Note, shape))
+
+        # Text search
+        if "search_text" in shape:
+            query = query.where(cls._text_match(Note, bindparam("search_text")))
+
+        return cls._limited(query, shape)
+
+    @classmethod
+    def _projects_statement(cls, shape: frozenset[str]) -> Select[Any]:
+        """Build the project statement for a filter shape."""
+        query = select(Project).order_by(Project.name)
+
+        # Status filter
+        if "project_status" in shape:
+            query = query.where(Project.status == bindparam("project_status"))
+
+        # Client filter
+        if "client_id" in shape:
+            query = query.where(Project.client_id == bindparam("client_id"))
+
+        # Employer filter
+        if "employer_id" in shape:
+            query = query.where(Project.on_behalf_of_id == bindparam("employer_id"))
+
+        # Text search (name and description)
+        if "search_text" in shape:
+            query = query.where(cls._text_match(Project, bindparam("search_text")))
+
+        return cls._limited(query, shape)
+
+    @classmethod
+    def _people_statement(cls, shape: frozenset[str]) -> Select[Any]:
+        """Build the person statement for a filter shape."""
+        query = select(Person).order_by(Person.full_name)
+
+        # Text search (name and email). Names and emails are identifiers rather
+        # than prose, so they keep substring matching instead of full-text search,
+        # as one LIKE over the lowercased name/email column.
+        if "search_pattern" in shape:
+            pattern = bindparam("search_pattern", type_=String)
+            query = query.where(Person.search_blob.like(pattern, escape=LIKE_ESCAPE))
+
+        return cls._limited(query, shape)
+
+    @classmethod
+    def _clients_statement(cls, shape: frozenset[str]) -> Select[Any]:
+        """Build the client statement for a filter shape."""
+        query = select(Client).order_by(Client.name)
+
+        # Status filter
+        if "client_status" in shape:
+            query = query.where(Client.status == bindparam("client_status"))
+
+        # Text search (name and notes)
+        if "search_text" in shape:
+            query = query.where(cls._text_match(Client, bindparam("search_text")))
+
+        return cls._limited(query, shape)
+
+    @classmethod
+    def _employers_statement(cls, shape: frozenset[str]) -> Select[Any]:
+        """Build the employer statement for a filter shape."""
+        query = select(Employer).order_by(Employer.name)
+
+        # Text search (name and notes)
+        if "search_text" in shape:
+            query = query.where(cls._text_match(Employer, bindparam("search_text")))
+
+        return cls._limited(query, shape)
+
+    @classmethod
+    def _reminders_statement(cls, shape: frozenset[str]) -> Select[Any]:
+        """Build the reminder statement for a filter shape."""
+        query = select(Reminder).order_by(Reminder.reminder_time)
+
+        # Date filters (bound as datetimes)
+        if "start_date" in shape:
+            query = query.where(Reminder.reminder_time >= bindparam("start_date"))
+        if "end_date" in shape:
+            query = query.where(Reminder.reminder_time <= bindparam("end_date"))
+
+        # Completed filter
+        if "exclude_completed" in shape:
+            query = query.where(Reminder.is_completed == False)  # noqa: E712
+
+        # Text search
+        if "search_text" in shape:
+            query = query.where(cls._text_match(Reminder, bindparam("search_text")))
+
+        return cls._limited(query, shape)
 
     async def _query_work_sessions(
         self,
@@ -200,38 +497,18 @@ class QueryService:
         limit: Optional[int] = None,
     ) -> list[WorkSession]:
         """Query work sessions with filters."""
-        query = select(WorkSession).order_by(WorkSession.date.desc())
-
-        # Date filters
-        if start_date:
-            query = query.where(WorkSession.date >= start_date)
-        if end_date:
-            query = query.where(WorkSession.date <= end_date)
-
-        # Privacy filters
-        if privacy_levels is not None:
-            query = query.where(WorkSession.privacy_level.in_(privacy_levels))
-        elif not include_private:
-            query = query.where(WorkSession.privacy_level != PrivacyLevel.PRIVATE)
-
-        # Project filter
-        if project_id:
-            query = query.where(WorkSession.project_id == project_id)
-
-        # Employer filter (requires join to project)
-        if employer_id:
-            query = query.join(Project).where(Project.on_behalf_of_id == employer_id)
+        params = self._filter_params(
+            start_date=start_date,
+            end_date=end_date,
+            project_id=project_id,
+            employer_id=employer_id,
+            search_text=search_text,
+            limit=limit,
+        )
+        shape = self._privacy_shape(params, privacy_levels, include_private)
+        query = _flexible_statement(EntityType.WORK_SESSION, shape)
 
-        # Text search
-        if search_text:
-            query = query.where(WorkSession.summary.ilike(f"%{search_text}%"))
-
-        # Limit
-        if limit:
-            query = query.limit(limit)
-
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return await self._fetch_all(query, params)
 
     async def _query_meetings(
         self,
@@ -245,51 +522,19 @@ class QueryService:
         limit: Optional[int] = None,
     ) -> list[Meeting]:
         """Query meetings with filters."""
-        query = (
-            select(Meeting)
-            .options(selectinload(Meeting.attendees))
-            .order_by(Meeting.start_time.desc())
+        params = self._filter_params(
+            # Dates widen to whole-day datetime bounds
+            start_date=start_date and datetime.combine(start_date, _DAY_START),
+            end_date=end_date and datetime.combine(end_date, _DAY_END),
+            project_id=project_id,
+            person_id=person_id,
+            search_text=search_text,
+            limit=limit,
         )
+        shape = self._privacy_shape(params, privacy_levels, include_private)
+        query = _flexible_statement(EntityType.MEETING, shape)
 
-        # Date filters (convert date to datetime)
-        if start_date:
-            start_dt = datetime.combine(start_date, datetime.min.time())
-            query = query.where(Meeting.start_time >= start_dt)
-        if end_date:
-            end_dt = datetime.combine(end_date, datetime.max.time())
-            query = query.where(Meeting.start_time <= end_dt)
-
-        # Privacy filters
-        if privacy_levels is not None:
-            query = query.where(Meeting.privacy_level.in_(privacy_levels))
-        elif not include_private:
-            query = query.where(Meeting.privacy_level != PrivacyLevel.PRIVATE)
-
-        # Project filter
-        if project_id:
-            query = query.where(Meeting.project_id == project_id)
-
-        # Person filter (requires join to attendees)
-        if person_id:
-            from ..models.meeting import MeetingAttendee
-
-            query = query.join(MeetingAttendee).where(MeetingAttendee.person_id == person_id)
-
-        # Text search (title and summary)
-        if search_text:
-            query = query.where(
-                or_(
-                    Meeting.title.ilike(f"%{search_text}%"),
-                    Meeting.summary.ilike(f"%{search_text}%"),
-                )
-            )
-
-        # Limit
-        if limit:
-            query = query.limit(limit)
-
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return await self._fetch_all(query, params)
 
     async def _query_notes(
         self,
@@ -299,24 +544,11 @@ class QueryService:
         limit: Optional[int] = None,
     ) -> list[Note]:
         """Query notes with filters."""
-        query = select(Note).order_by(Note.created_at.desc())
-
-        # Privacy filters
-        if privacy_levels is not None:
-            query = query.where(Note.privacy_level.in_(privacy_levels))
-        elif not include_private:
-            query = query.where(Note.privacy_level != PrivacyLevel.PRIVATE)
+        params = self._filter_params(search_text=search_text, limit=limit)
+        shape = self._privacy_shape(params, privacy_levels, include_private)
+        query = _flexible_statement(EntityType.NOTE, shape)
 
-        # Text search
-        if search_text:
-            query = query.where(Note.text.ilike(f"%{search_text}%"))
-
-        # Limit
-        if limit:
-            query = query.limit(limit)
-
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return await self._fetch_all(query, params)
 
     async def _query_projects(
         self,
@@ -327,35 +559,16 @@ class QueryService:
         limit: Optional[int] = None,
     ) -> list[Project]:
         """Query projects with filters."""
-        query = select(Project).order_by(Project.name)
-
-        # Status filter
-        if project_status:
-            query = query.where(Project.status == project_status)
-
-        # Client filter
-        if client_id:
-            query = query.where(Project.client_id == client_id)
-
-        # Employer filter
-        if employer_id:
-            query = query.where(Project.on_behalf_of_id == employer_id)
-
-        # Text search (name and description)
-        if search_text:
-            query = query.where(
-                or_(
-                    Project.name.ilike(f"%{search_text}%"),
-                    Project.description.ilike(f"%{search_text}%"),
-                )
-            )
-
-        # Limit
-        if limit:
-            query = query.limit(limit)
+        params = self._filter_params(
+            project_status=project_status,
+            client_id=client_id,
+            employer_id=employer_id,
+            search_text=search_text,
+            limit=limit,
+        )
+        query = _flexible_statement(EntityType.PROJECT, frozenset(params))
 
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return await self._fetch_all(query, params)
 
     async def _query_people(
         self,
@@ -363,23 +576,13 @@ class QueryService:
         limit: Optional[int] = None,
     ) -> list[Person]:
         """Query people with filters."""
-        query = select(Person).order_by(Person.full_name)
-
-        # Text search (name and email)
-        if search_text:
-            query = query.where(
-                or_(
-                    Person.full_name.ilike(f"%{search_text}%"),
-                    Person.email.ilike(f"%{search_text}%"),
-                )
-            )
-
-        # Limit
-        if limit:
-            query = query.limit(limit)
+        params = self._filter_params(
+            search_pattern=search_text and f"%{escape_like(search_text.lower())}%",
+            limit=limit,
+        )
+        query = _flexible_statement(EntityType.PERSON, frozenset(params))
 
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return await self._fetch_all(query, params)
 
     async def _query_clients(
         self,
@@ -388,27 +591,14 @@ class QueryService:
         limit: Optional[int] = None,
     ) -> list[Client]:
         """Query clients with filters."""
-        query = select(Client).order_by(Client.name)
-
-        # Status filter
-        if client_status:
-            query = query.where(Client.status == client_status)
-
-        # Text search (name and notes)
-        if search_text:
-            query = query.where(
-                or_(
-                    Client.name.ilike(f"%{search_text}%"),
-                    Client.notes.ilike(f"%{search_text}%"),
-                )
-            )
-
-        # Limit
-        if limit:
-            query = query.limit(limit)
+        params = self._filter_params(
+            client_status=client_status,
+            search_text=search_text,
+            limit=limit,
+        )
+        query = _flexible_statement(EntityType.CLIENT, frozenset(params))
 
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return await self._fetch_all(query, params)
 
     async def _query_employers(
         self,
@@ -416,23 +606,10 @@ class QueryService:
         limit: Optional[int] = None,
     ) -> list[Employer]:
         """Query employers with filters."""
-        query = select(Employer).order_by(Employer.name)
-
-        # Text search (name and notes)
-        if search_text:
-            query = query.where(
-                or_(
-                    Employer.name.ilike(f"%{search_text}%"),
-                    Employer.notes.ilike(f"%{search_text}%"),
-                )
-            )
+        params = self._filter_params(search_text=search_text, limit=limit)
+        query = _flexible_statement(EntityType.EMPLOYER, frozenset(params))
 
-        # Limit
-        if limit:
-            query = query.limit(limit)
-
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return await self._fetch_all(query, params)
 
     async def _query_reminders(
         self,
@@ -443,30 +620,44 @@ class QueryService:
         limit: Optional[int] = None,
     ) -> list[Reminder]:
         """Query reminders with filters."""
-        query = select(Reminder).order_by(Reminder.reminder_time)
+        params = self._filter_params(
+            # Dates widen to whole-day datetime bounds
+            start_date=start_date and datetime.combine(start_date, _DAY_START),
+            end_date=end_date and datetime.combine(end_date, _DAY_END),
+            search_text=search_text,
+            limit=limit,
+        )
+        shape = frozenset(params)
+        if not include_completed:
+            shape |= {"exclude_completed"}
+        query = _flexible_statement(EntityType.REMINDER, shape)
 
-        # Date filters (convert date to datetime)
-        if start_date:
-            start_dt = datetime.combine(start_date, datetime.min.time())
-            query = query.where(Reminder.reminder_time >= start_dt)
-        if end_date:
-            end_dt = datetime.combine(end_date, datetime.max.time())
-            query = query.where(Reminder.reminder_time <= end_dt)
+        return await self._fetch_all(query, params)
 
-        # Completed filter
-        if not include_completed:
-            query = query.where(Reminder.is_completed == False)  # noqa: E712
+    @staticmethod
+    def _notes_by_entity_statement(
+        entity_type: EntityType,
+        entity_id: int,
+        include_private: bool,
+        limit: Optional[int],
+    ) -> Select[Any]:
+        """Build the statement for notes attached to an entity."""
+        query = (
+            select(Note)
+            .where(Note.entity_type == entity_type)
+            .where(Note.entity_id == entity_id)
+            .order_by(Note.created_at.desc())
+        )
 
-        # Text search
-        if search_text:
-            query = query.where(Reminder.message.ilike(f"%{search_text}%"))
+        # Privacy filter
+        if not include_private:
+            query = query.where(Note.privacy_level != PrivacyLevel.PRIVATE)
 
         # Limit
         if limit:
             query = query.limit(limit)
 
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return query
 
     async def query_notes_by_entity(
         self,
@@ -487,43 +678,46 @@ class QueryService:
         Returns:
             list[Note]: Notes attached to entity
         """
-        query = (
-            select(Note)
-            .where(Note.entity_type == entity_type)
-            .where(Note.entity_id == entity_id)
-            .order_by(Note.created_at.desc())
-        )
-
-        # Privacy filter
-        if not include_private:
-            query = query.where(Note.privacy_level != PrivacyLevel.PRIVATE)
-
-        # Limit
-        if limit:
-            query = query.limit(limit)
-
+        query = self._notes_by_entity_statement(entity_type, entity_id, include_private, limit)
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
-    async def query_reminders_by_entity(
+    async def query_note_ids_by_entity(
         self,
         entity_type: EntityType,
         entity_id: int,
-        include_completed: bool = False,
+        include_private: bool = True,
         limit: Optional[int] = None,
-    ) -> list[Reminder]:
+    ) -> list[int]:
         """
-        Query reminders related to a specific entity.
+        Query the IDs of notes attached to a specific entity.
+
+        Same filters and order as query_notes_by_entity, but selects only the
+        primary key; use it for existence checks and counts. Load a full note
+        later with session.get(), which the identity map may serve without a
+        query.
 
         Args:
             entity_type: Type of entity
             entity_id: ID of entity
-            include_completed: Include completed reminders (default: False)
+            include_private: Include private notes (default: True)
             limit: Maximum number of results
 
         Returns:
-            list[Reminder]: Reminders related to entity
+            list[int]: IDs of notes attached to entity
         """
+        query = self._notes_by_entity_statement(entity_type, entity_id, include_private, limit)
+        result = await self.session.execute(query.with_only_columns(Note.id))
+        return list(result.scalars().all())
+
+    @staticmethod
+    def _reminders_by_entity_statement(
+        entity_type: EntityType,
+        entity_id: int,
+        include_completed: bool,
+        limit: Optional[int],
+    ) -> Select[Any]:
+        """Build the statement for reminders related to an entity."""
         query = (
             select(Reminder)
             .where(Reminder.related_entity_type == entity_type)
@@ -539,9 +733,61 @@ class QueryService:
         if limit:
             query = query.limit(limit)
 
+        return query
+
+    async def query_reminders_by_entity(
+        self,
+        entity_type: EntityType,
+        entity_id: int,
+        include_completed: bool = False,
+        limit: Optional[int] = None,
+    ) -> list[Reminder]:
+        """
+        Query reminders related to a specific entity.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: ID of entity
+            include_completed: Include completed reminders (default: False)
+            limit: Maximum number of results
+
+        Returns:
+            list[Reminder]: Reminders related to entity
+        """
+        query = self._reminders_by_entity_statement(
+            entity_type, entity_id, include_completed, limit
+        )
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def query_reminder_ids_by_entity(
+        self,
+        entity_type: EntityType,
+        entity_id: int,
+        include_completed: bool = False,
+        limit: Optional[int] = None,
+    ) -> list[int]:
+        """
+        Query the IDs of reminders related to a specific entity.
+
+        Same filters and order as query_reminders_by_entity, but selects only
+        the primary key; use it for existence checks and counts.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: ID of entity
+            include_completed: Include completed reminders (default: False)
+            limit: Maximum number of results
+
+        Returns:
+            list[int]: IDs of reminders related to entity
+        """
+        query = self._reminders_by_entity_statement(
+            entity_type, entity_id, include_completed, limit
+        )
+        result = await self.session.execute(query.with_only_columns(Reminder.id))
+        return list(result.scalars().all())
+
     async def structured_query(
         self,
         entity_type: EntityType,
@@ -566,7 +812,7 @@ class QueryService:
                     {
                         "entity_type": "work_session",
                         "results": [<entities>],
-                        "total_count": 42
+                        "total_count": 42  # All matches, ignoring limit/offset
                     }
                 Format (aggregation):
                     {
@@ -582,14 +828,10 @@ class QueryService:
         Raises:
             ValueError: If query specification is invalid
         """
-        # Import here to avoid circular dependency
-        from .query_builder import QueryBuilder
-        from .result_converter import ResultConverter
-
         builder = QueryBuilder(self.session)
 
-        # Build query
-        query = builder.build_query(
+        # Build query (cached statement skeleton + bound values)
+        query, params = builder.build_query(
             entity_type=entity_type,
             filters=filters,
             aggregation=aggregation,
@@ -598,22 +840,20 @@ class QueryService:
         )
 
         # Execute query
-        result = await self.session.execute(query)
+        result = await self.session.execute(query, params)
+
+        # Tool inputs carry enum values (use_enum_values); the enum lookup
+        # accepts either a member or its value
+        entity_name = EntityType(entity_type).value
 
         if aggregation:
             # Handle aggregation results
-            func_value = (
-                aggregation.function.value
-                if hasattr(aggregation.function, "value")
-                else str(aggregation.function)
-            )
+            func_value = AggregationFunction(aggregation.function).value
             if aggregation.group_by:
                 # Grouped aggregation
                 rows = result.all()
                 return {
-                    "entity_type": (
-                        entity_type.value if hasattr(entity_type, "value") else str(entity_type)
-                    ),
+                    "entity_type": entity_name,
                     "aggregation": {
                         "function": func_value,
                         "field": aggregation.field,
@@ -631,9 +871,7 @@ class QueryService:
                 # Global aggregation
                 agg_result = result.scalar_one()
                 return {
-                    "entity_type": (
-                        entity_type.value if hasattr(entity_type, "value") else str(entity_type)
-                    ),
+                    "entity_type": entity_name,
                     "aggregation": {
                         "function": func_value,
                         "field": aggregation.field,
@@ -641,17 +879,105 @@ class QueryService:
                     },
                 }
         else:
-            # Handle entity results - convert to Pydantic schemas
-            entities = list(result.scalars().all())
+            # Handle entity results - rows are (entity, total_count)
+            rows = result.all()
+            entities = [row[0] for row in rows]
+            if rows:
+                total_count = rows[0].total_count
+            elif offset:
+                # Page past the end: no row carries the window count, so count the
+                # matching ids (no entity columns, tsvector or window per row)
+                model = query.column_descriptions[0]["entity"]
+                matching_ids = (
+                    query.with_only_columns(model.id).order_by(None).limit(None).offset(None)
+                )
+                total_count = await self.session.scalar(
+                    select(func.count()).select_from(matching_ids.subquery()), params
+                )
+            else:
+                total_count = 0
 
             # Convert SQLAlchemy models to Pydantic schemas for JSON serialization
             converter = ResultConverter()
             converted_entities = converter.convert_entity_list(entity_type, entities)
 
             return {
-                "entity_type": (
-                    entity_type.value if hasattr(entity_type, "value") else str(entity_type)
-                ),
+                "entity_type": entity_name,
                 "results": converted_entities,
-                "total_count": len(converted_entities),
+                "total_count": total_count,
             }
+
+
+QueryService._SUB_QUERIES = {
+    EntityType.WORK_SESSION: (
+        "work_sessions",
+        QueryService._query_work_sessions,
+        (
+            "start_date",
+            "end_date",
+            "privacy_levels",
+            "include_private",
+            "search_text",
+            "project_id",
+            "employer_id",
+        ),
+    ),
+    EntityType.MEETING: (
+        "meetings",
+        QueryService._query_meetings,
+        (
+            "start_date",
+            "end_date",
+            "privacy_levels",
+            "include_private",
+            "search_text",
+            "project_id",
+            "person_id",
+        ),
+    ),
+    EntityType.NOTE: (
+        "notes",
+        QueryService._query_notes,
+        ("privacy_levels", "include_private", "search_text"),
+    ),
+    EntityType.PROJECT: (
+        "projects",
+        QueryService._query_projects,
+        ("search_text", "client_id", "employer_id", "project_status"),
+    ),
+    EntityType.PERSON: ("people", QueryService._query_people, ("search_text",)),
+    EntityType.CLIENT: (
+        "clients",
+        QueryService._query_clients,
+        ("search_text", "client_status"),
+    ),
+    EntityType.EMPLOYER: ("employers", QueryService._query_employers, ("search_text",)),
+    EntityType.REMINDER: (
+        "reminders",
+        QueryService._query_reminders,
+        ("start_date", "end_date", "search_text", "include_completed"),
+    ),
+}
+
+QueryService._STATEMENT_BUILDERS = {
+    EntityType.WORK_SESSION: QueryService._work_sessions_statement,
+    EntityType.MEETING: QueryService._meetings_statement,
+    EntityType.NOTE: QueryService._notes_statement,
+    EntityType.PROJECT: QueryService._projects_statement,
+    EntityType.PERSON: QueryService._people_statement,
+    EntityType.CLIENT: QueryService._clients_statement,
+    EntityType.EMPLOYER: QueryService._employers_statement,
+    EntityType.REMINDER: QueryService._reminders_statement,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _flexible_statement(entity_type: EntityType, shape: frozenset[str]) -> Select[Any]:
+    """
+    Return the cached flexible_query statement for an entity type and filter shape.
+
+    The shape is the set of active filter names; values are bound at execute
+    time. Reusing one Select per shape skips statement construction and lets
+    SQLAlchemy's compiled cache hit on every repeat of the shape.
+    """
+    return QueryService._STATEMENT_BUILDERS[entity_type](shape)
@@ -1,8 +1,12 @@
 """Service layer for reminder operations with recurrence support."""
 
-from datetime import datetime, timedelta
-from typing import Any
+import calendar
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, ClassVar
 
+from sqlalchemy import Integer, any_, bindparam, case, func, insert, or_, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import settings
@@ -10,6 +14,12 @@ from ..models.reminder import Reminder
 from ..repositories.reminder_repository import ReminderRepository
 
 
+@lru_cache(maxsize=256)
+def _max_day(year: int, month: int) -> int:
+    """Return the number of days in a month (memoized calendar.monthrange)."""
+    return calendar.monthrange(year, month)[1]
+
+
 class ReminderService:
     """
     Business logic for reminder operations.
@@ -17,6 +27,9 @@ class ReminderService:
     Handles reminder creation, completion, snoozing, and recurrence calculation.
     """
 
+    # Upper bound on reminders materialized by one create_recurring_series call
+    MAX_SERIES_OCCURRENCES: ClassVar[int] = 1000
+
     def __init__(self, session: AsyncSession) -> None:
         """
         Initialize ReminderService.
@@ -71,6 +84,82 @@ class ReminderService:
         await self.session.flush()
         return reminder
 
+    async def create_recurring_series(
+        self,
+        reminder_time: datetime,
+        until: datetime,
+        message: str,
+        recurrence_config: dict[str, Any],
+        related_entity_type: str | None = None,
+        related_entity_id: int | None = None,
+        tags: list[str] | None = None,
+    ) -> list[Reminder]:
+        """
+        Materialize every occurrence of a recurring reminder up to a horizon.
+
+        All rows are written by one multi-row INSERT ... RETURNING. Occurrence
+        times come from next_n_occurrences, so they follow the same rules as
+        completing a reminder. Only the last occurrence keeps recurrence_config:
+        earlier ones behave as one-off reminders, and completing the last one
+        continues the series past the horizon.
+
+        Args:
+            reminder_time: First occurrence
+            until: Last time an occurrence may fall on (inclusive)
+            message: Reminder text/message
+            recurrence_config: Recurrence configuration (daily/weekly/monthly)
+            related_entity_type: Optional entity type the reminders relate to
+            related_entity_id: Optional entity ID the reminders relate to
+            tags: Optional tags for categorization
+
+        Returns:
+            list[Reminder]: Created reminders in time order
+
+        Raises:
+            ValueError: If recurrence_config is invalid, until is before
+                reminder_time, or the series exceeds MAX_SERIES_OCCURRENCES
+        """
+        self._validate_recurrence_config(recurrence_config)
+        if until < reminder_time:
+            raise ValueError("until must not be before reminder_time")
+
+        # Upper bound on the number of periods between the first occurrence and until
+        if recurrence_config["frequency"] == "monthly":
+            periods = (until.year - reminder_time.year) * 12 + until.month - reminder_time.month
+        else:
+            days = (until - reminder_time).days
+            periods = days if recurrence_config["frequency"] == "daily" else days // 7
+        if periods + 1 > self.MAX_SERIES_OCCURRENCES:
+            raise ValueError(
+                f"Series would create more than {self.MAX_SERIES_OCCURRENCES} reminders"
+            )
+
+        times = [reminder_time] + [
+            occurrence
+            for occurrence in self.next_n_occurrences(reminder_time, recurrence_config, periods)
+            if occurrence <= until
+        ]
+
+        rows: list[dict[str, Any]] = [
+            {
+                "reminder_time": occurrence,
+                "message": message,
+                "is_completed": False,
+                "recurrence_config": None,
+                "related_entity_type": related_entity_type,
+                "related_entity_id": related_entity_id,
+                "tags": tags or [],
+            }
+            for occurrence in times
+        ]
+        rows[-1]["recurrence_config"] = recurrence_config
+
+        # insertmanyvalues only guarantees RETURNING order when asked to sort
+        result = await self.session.scalars(
+            insert(Reminder).returning(Reminder, sort_by_parameter_order=True), rows
+        )
+        return list(result)
+
     async def complete_reminder(self, reminder_id: int) -> Reminder | None:
         """
         Mark a reminder as completed and create next occurrence if recurring.
@@ -109,11 +198,10 @@ class ReminderService:
                     tags=reminder.tags or [],
                 )
                 self.session.add(next_reminder)
-                await self.session.flush()
-                await self.session.refresh(next_reminder)
 
+        # One flush writes both the completion and the next occurrence; server-side
+        # timestamps come back via RETURNING (Reminder uses eager_defaults)
         await self.session.flush()
-        await self.session.refresh(reminder)
         return next_reminder
 
     async def snooze_reminder(self, reminder_id: int, snooze_until: datetime) -> Reminder:
@@ -140,7 +228,6 @@ class ReminderService:
 
         reminder.snoozed_until = snooze_until
         await self.session.flush()
-        await self.session.refresh(reminder)
         return reminder
 
     async def check_due_reminders(self) -> list[Reminder]:
@@ -156,7 +243,7 @@ class ReminderService:
         Raises:
             None
         """
-        now = datetime.now(datetime.now().astimezone().tzinfo)
+        now = datetime.now(timezone.utc)
 
         # Calculate cooldown threshold
         cooldown_minutes = settings.reminder_notification_cooldown_minutes
@@ -186,7 +273,7 @@ class ReminderService:
 
         # Update last_notified_at timestamp
         if notified_at is None:
-            notified_at = datetime.now(datetime.now().astimezone().tzinfo)
+            notified_at = datetime.now(timezone.utc)
         reminder.last_notified_at = notified_at
 
         # Auto-complete non-recurring reminders if configured
@@ -194,9 +281,94 @@ class ReminderService:
             reminder.is_completed = True
 
         await self.session.flush()
-        await self.session.refresh(reminder)
         return reminder
 
+    async def mark_notified_many(
+        self, reminder_ids: list[int], notified_at: datetime | None = None
+    ) -> None:
+        """
+        Mark several reminders as notified with a single UPDATE.
+
+        Bulk counterpart of mark_notified for the scheduler job: applies the same
+        last_notified_at stamp and non-recurring auto-complete rule to every ID.
+        Reminder instances already loaded in the session keep their old values
+        until refreshed.
+
+        Args:
+            reminder_ids: IDs of the reminders that were notified
+            notified_at: Timestamp of notification (defaults to now)
+        """
+        if not reminder_ids:
+            return
+
+        if notified_at is None:
+            notified_at = datetime.now(timezone.utc)
+        values: dict[str, Any] = {"last_notified_at": notified_at}
+
+        if settings.reminder_auto_complete_non_recurring:
+            # recurrence_config=None is stored as JSON null, not SQL NULL
+            non_recurring = or_(
+                Reminder.recurrence_config.is_(None),
+                func.jsonb_typeof(Reminder.recurrence_config) == "null",
+            )
+            values["is_completed"] = case((non_recurring, True), else_=Reminder.is_completed)
+
+        # One statement shape for any batch size (id = ANY(array) rather than an
+        # expanding IN list); instances already in the session are not refreshed
+        ids = bindparam("reminder_ids", reminder_ids, type_=ARRAY(Integer))
+        await self.session.execute(
+            update(Reminder)
+            .where(Reminder.id == any_(ids))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+    def next_n_occurrences(self, start: datetime, config: dict[str, Any], n: int) -> list[datetime]:
+        """
+        Calculate the next n occurrence times after start.
+
+        Each occurrence is computed directly from start by striding the rule's
+        period (days, weeks, or months), so backfilling missed occurrences does
+        not need n chained single-step calculations.
+
+        Args:
+            start: Reminder time to count from (not included in the result)
+            config: Recurrence configuration
+            n: Number of occurrences to return
+
+        Returns:
+            list[datetime]: Up to n occurrence times in ascending order (empty for
+                an unknown frequency)
+
+        Raises:
+            ValueError: If n is negative
+        """
+        if n < 0:
+            raise ValueError(f"n must be non-negative, got {n}")
+
+        frequency = config.get("frequency")
+
+        if frequency == "daily":
+            return [start + timedelta(days=i) for i in range(1, n + 1)]
+
+        if frequency == "weekly":
+            return [start + timedelta(weeks=i) for i in range(1, n + 1)]
+
+        if frequency == "monthly":
+            day_of_month = config.get("day_of_month", start.day)
+            # Months since year 0 lets one divmod give each target year/month
+            base = start.year * 12 + start.month - 1
+            occurrences = []
+            for i in range(1, n + 1):
+                year, month_index = divmod(base + i, 12)
+                month = month_index + 1
+                # Handle day overflow (e.g., Jan 31 -> Feb 28)
+                day = min(day_of_month, _max_day(year, month))
+                occurrences.append(start.replace(year=year, month=month, day=day))
+            return occurrences
+
+        return []
+
     def _validate_recurrence_config(self, config: dict[str, Any]) -> None:
         """
         Validate recurrence configuration.
@@ -248,34 +420,5 @@ class ReminderService:
         Raises:
             ValueError: If config is invalid
         """
-        frequency = config.get("frequency")
-
-        if frequency == "daily":
-            # Add one day
-            return current_reminder_time + timedelta(days=1)
-
-        elif frequency == "weekly":
-            # Add one week
-            return current_reminder_time + timedelta(weeks=1)
-
-        elif frequency == "monthly":
-            # Add one month (handle variable month lengths)
-            day_of_month = config.get("day_of_month", current_reminder_time.day)
-
-            # Move to next month
-            if current_reminder_time.month == 12:
-                next_year = current_reminder_time.year + 1
-                next_month = 1
-            else:
-                next_year = current_reminder_time.year
-                next_month = current_reminder_time.month + 1
-
-            # Handle day overflow (e.g., Jan 31 -> Feb 28)
-            import calendar
-
-            max_day = calendar.monthrange(next_year, next_month)[1]
-            actual_day = min(day_of_month, max_day)
-
-            return current_reminder_time.replace(year=next_year, month=next_month, day=actual_day)
-
-        return None
+        occurrences = self.next_n_occurrences(current_reminder_time, config, 1)
+        return occurrences[0] if occurrences else None
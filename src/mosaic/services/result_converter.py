@@ -1,10 +1,19 @@
-"""Result converter service for query results."""
+"""Result converter service for query results.
 
-from typing import TYPE_CHECKING, Any
+Conversion never triggers I/O: relationships a converter reads (Meeting.attendees)
+must be eager-loaded by the query that produced the instances, since a lazy load
+is not possible under AsyncSession.
+"""
 
-if TYPE_CHECKING:
-    from ..models.base import EntityType
+from collections.abc import Callable, Iterable, Mapping
+from datetime import timedelta
+from typing import Any, ClassVar
 
+from pydantic import TypeAdapter
+from sqlalchemy import inspect
+from sqlalchemy.orm import NO_VALUE
+
+from ..models.base import EntityType
 from ..models.client import Client
 from ..models.employer import Employer
 from ..models.meeting import Meeting
@@ -36,6 +45,23 @@ class ResultConverter:
     returned by QueryService.flexible_query().
     """
 
+    # Ordered (result key, converter) pairs for convert_results
+    # (populated after the class body)
+    _RESULT_CONVERTERS: ClassVar[
+        tuple[tuple[str, Callable[["ResultConverter", Any], QueryResultEntity]], ...]
+    ]
+
+    # Model class -> converter for convert_flat (populated after the class body)
+    _CONVERTERS_BY_MODEL: ClassVar[
+        Mapping[type[Any], Callable[["ResultConverter", Any], QueryResultEntity]]
+    ]
+
+    # Entity type -> (field extractor, list validator) for convert_entity_list
+    # (populated after the class body)
+    _BULK_CONVERTERS: ClassVar[
+        Mapping[EntityType, tuple[Callable[[Any], dict[str, Any]], TypeAdapter[list[Any]]]]
+    ]
+
     def convert_results(self, raw_results: dict[str, list[Any]]) -> list[QueryResultEntity]:
         """
         Convert SQLAlchemy results to QueryResultEntity discriminated union.
@@ -57,47 +83,44 @@ class ResultConverter:
             3
         """
         converted: list[QueryResultEntity] = []
+        for key, convert in self._RESULT_CONVERTERS:
+            converted.extend(convert(self, row) for row in raw_results.get(key, ()))
+        return converted
 
-        # Convert work sessions
-        for ws in raw_results.get("work_sessions", []):
-            converted.append(self._convert_work_session(ws))
-
-        # Convert meetings
-        for meeting in raw_results.get("meetings", []):
-            converted.append(self._convert_meeting(meeting))
-
-        # Convert projects
-        for project in raw_results.get("projects", []):
-            converted.append(self._convert_project(project))
-
-        # Convert people
-        for person in raw_results.get("people", []):
-            converted.append(self._convert_person(person))
-
-        # Convert clients
-        for client in raw_results.get("clients", []):
-            converted.append(self._convert_client(client))
+    def convert_flat(self, rows: Iterable[Any]) -> list[QueryResultEntity]:
+        """
+        Convert a flat, possibly mixed sequence of SQLAlchemy instances.
 
-        # Convert employers
-        for employer in raw_results.get("employers", []):
-            converted.append(self._convert_employer(employer))
+        Each row is dispatched on its model class, so callers can pass query
+        output directly without grouping it by entity type first. Order is kept.
 
-        # Convert notes
-        for note in raw_results.get("notes", []):
-            converted.append(self._convert_note(note))
+        Args:
+            rows: SQLAlchemy model instances of any supported model
 
-        # Convert reminders
-        for reminder in raw_results.get("reminders", []):
-            converted.append(self._convert_reminder(reminder))
+        Returns:
+            list[QueryResultEntity]: Converted results in input order
 
-        # Convert users
-        for user in raw_results.get("users", []):
-            converted.append(self._convert_user(user))
+        Raises:
+            ValueError: If a row's model is not supported
 
+        Examples:
+            >>> converter = ResultConverter()
+            >>> results = converter.convert_flat([m1, ws1])
+            >>> [r.entity_type for r in results]
+            ['meeting', 'work_session']
+        """
+        converters = self._CONVERTERS_BY_MODEL
+        converted: list[QueryResultEntity] = []
+        for row in rows:
+            try:
+                convert = converters[type(row)]
+            except KeyError:
+                raise ValueError(f"Unsupported model type: {type(row).__name__}") from None
+            converted.append(convert(self, row))
         return converted
 
     def convert_entity_list(
-        self, entity_type: "EntityType", entities: list[Any]
+        self, entity_type: EntityType, entities: list[Any]
     ) -> list[QueryResultEntity]:
         """
         Convert list of SQLAlchemy entities to QueryResultEntity schemas.
@@ -119,31 +142,13 @@ class ResultConverter:
             >>> len(results)
             3
         """
-        from ..models.base import EntityType as ET
+        try:
+            fields, adapter = self._BULK_CONVERTERS[entity_type]
+        except KeyError:
+            raise ValueError(f"Unsupported entity type: {entity_type}") from None
 
-        converted: list[QueryResultEntity] = []
-
-        for entity in entities:
-            if entity_type == ET.WORK_SESSION:
-                converted.append(self._convert_work_session(entity))
-            elif entity_type == ET.MEETING:
-                converted.append(self._convert_meeting(entity))
-            elif entity_type == ET.PROJECT:
-                converted.append(self._convert_project(entity))
-            elif entity_type == ET.PERSON:
-                converted.append(self._convert_person(entity))
-            elif entity_type == ET.CLIENT:
-                converted.append(self._convert_client(entity))
-            elif entity_type == ET.EMPLOYER:
-                converted.append(self._convert_employer(entity))
-            elif entity_type == ET.NOTE:
-                converted.append(self._convert_note(entity))
-            elif entity_type == ET.REMINDER:
-                converted.append(self._convert_reminder(entity))
-            else:
-                raise ValueError(f"Unsupported entity type: {entity_type}")
-
-        return converted
+        # One validation call for the whole list instead of one model per entity
+        return adapter.validate_python([fields(entity) for entity in entities])
 
     def _convert_work_session(self, ws: WorkSession) -> WorkSessionResult:
         """
@@ -155,17 +160,22 @@ class ResultConverter:
         Returns:
             WorkSessionResult: Pydantic schema instance
         """
-        return WorkSessionResult(
-            id=ws.id,
-            date=ws.date,
-            project_id=ws.project_id,
-            duration_hours=ws.duration_hours,
-            description=ws.summary,
-            privacy_level=ws.privacy_level,
-            tags=ws.tags or [],
-            created_at=ws.created_at,
-            updated_at=ws.updated_at,
-        )
+        return WorkSessionResult(**self._work_session_fields(ws))
+
+    @staticmethod
+    def _work_session_fields(ws: WorkSession) -> dict[str, Any]:
+        """Extract WorkSessionResult field values from a WorkSession instance."""
+        return {
+            "id": ws.id,
+            "date": ws.date,
+            "project_id": ws.project_id,
+            "duration_hours": ws.duration_hours,
+            "description": ws.summary,
+            "privacy_level": ws.privacy_level,
+            "tags": ws.tags or [],
+            "created_at": ws.created_at,
+            "updated_at": ws.updated_at,
+        }
 
     def _convert_meeting(self, meeting: Meeting) -> MeetingResult:
         """
@@ -177,7 +187,17 @@ class ResultConverter:
         Returns:
             MeetingResult: Pydantic schema instance
         """
-        from datetime import timedelta
+        return MeetingResult(**self._meeting_fields(meeting))
+
+    @staticmethod
+    def _meeting_fields(meeting: Meeting) -> dict[str, Any]:
+        """Extract MeetingResult field values from a Meeting instance."""
+        # Fail clearly instead of attempting a lazy load (MissingGreenlet under asyncio)
+        if inspect(meeting).attrs.attendees.loaded_value is NO_VALUE:
+            raise ValueError(
+                f"Meeting {meeting.id} attendees are not loaded; "
+                "query meetings with selectinload(Meeting.attendees)"
+            )
 
         # Extract attendee IDs from relationship
         attendee_ids = [attendee.person_id for attendee in meeting.attendees]
@@ -185,19 +205,19 @@ class ResultConverter:
         # Calculate end_time from start_time + duration_minutes
         end_time = meeting.start_time + timedelta(minutes=meeting.duration_minutes)
 
-        return MeetingResult(
-            id=meeting.id,
-            start_time=meeting.start_time,
-            end_time=end_time,
-            title=meeting.title,
-            attendees=attendee_ids,
-            project_id=meeting.project_id,
-            description=meeting.summary,
-            privacy_level=meeting.privacy_level,
-            tags=meeting.tags or [],
-            created_at=meeting.created_at,
-            updated_at=meeting.updated_at,
-        )
+        return {
+            "id": meeting.id,
+            "start_time": meeting.start_time,
+            "end_time": end_time,
+            "title": meeting.title,
+            "attendees": attendee_ids,
+            "project_id": meeting.project_id,
+            "description": meeting.summary,
+            "privacy_level": meeting.privacy_level,
+            "tags": meeting.tags or [],
+            "created_at": meeting.created_at,
+            "updated_at": meeting.updated_at,
+        }
 
     def _convert_project(self, project: Project) -> ProjectResult:
         """
@@ -209,17 +229,22 @@ class ResultConverter:
         Returns:
             ProjectResult: Pydantic schema instance
         """
-        return ProjectResult(
-            id=project.id,
-            name=project.name,
-            client_id=project.client_id,
-            status=project.status,
-            on_behalf_of=project.on_behalf_of_id,
-            description=project.description,
-            tags=project.tags or [],
-            created_at=project.created_at,
-            updated_at=project.updated_at,
-        )
+        return ProjectResult(**self._project_fields(project))
+
+    @staticmethod
+    def _project_fields(project: Project) -> dict[str, Any]:
+        """Extract ProjectResult field values from a Project instance."""
+        return {
+            "id": project.id,
+            "name": project.name,
+            "client_id": project.client_id,
+            "status": project.status,
+            "on_behalf_of": project.on_behalf_of_id,
+            "description": project.description,
+            "tags": project.tags or [],
+            "created_at": project.created_at,
+            "updated_at": project.updated_at,
+        }
 
     def _convert_person(self, person: Person) -> PersonResult:
         """
@@ -231,18 +256,23 @@ class ResultConverter:
         Returns:
             PersonResult: Pydantic schema instance
         """
-        return PersonResult(
-            id=person.id,
-            full_name=person.full_name,
-            email=person.email,
-            phone=person.phone,
-            company=person.company,
-            title=person.title,
-            notes=person.notes,
-            tags=person.tags or [],
-            created_at=person.created_at,
-            updated_at=person.updated_at,
-        )
+        return PersonResult(**self._person_fields(person))
+
+    @staticmethod
+    def _person_fields(person: Person) -> dict[str, Any]:
+        """Extract PersonResult field values from a Person instance."""
+        return {
+            "id": person.id,
+            "full_name": person.full_name,
+            "email": person.email,
+            "phone": person.phone,
+            "company": person.company,
+            "title": person.title,
+            "notes": person.notes,
+            "tags": person.tags or [],
+            "created_at": person.created_at,
+            "updated_at": person.updated_at,
+        }
 
     def _convert_client(self, client: Client) -> ClientResult:
         """
@@ -254,17 +284,22 @@ class ResultConverter:
         Returns:
             ClientResult: Pydantic schema instance
         """
-        return ClientResult(
-            id=client.id,
-            name=client.name,
-            client_type=client.type,  # Client model uses 'type' not 'client_type'
-            status=client.status,
-            contact_person_id=client.contact_person_id,
-            notes=client.notes,
-            tags=client.tags or [],
-            created_at=client.created_at,
-            updated_at=client.updated_at,
-        )
+        return ClientResult(**self._client_fields(client))
+
+    @staticmethod
+    def _client_fields(client: Client) -> dict[str, Any]:
+        """Extract ClientResult field values from a Client instance."""
+        return {
+            "id": client.id,
+            "name": client.name,
+            "client_type": client.type,  # Client model uses 'type' not 'client_type'
+            "status": client.status,
+            "contact_person_id": client.contact_person_id,
+            "notes": client.notes,
+            "tags": client.tags or [],
+            "created_at": client.created_at,
+            "updated_at": client.updated_at,
+        }
 
     def _convert_employer(self, employer: Employer) -> EmployerResult:
         """
@@ -276,14 +311,19 @@ class ResultConverter:
         Returns:
             EmployerResult: Pydantic schema instance
         """
-        return EmployerResult(
-            id=employer.id,
-            name=employer.name,
-            notes=employer.notes,
-            tags=employer.tags or [],
-            created_at=employer.created_at,
-            updated_at=employer.updated_at,
-        )
+        return EmployerResult(**self._employer_fields(employer))
+
+    @staticmethod
+    def _employer_fields(employer: Employer) -> dict[str, Any]:
+        """Extract EmployerResult field values from a Employer instance."""
+        return {
+            "id": employer.id,
+            "name": employer.name,
+            "notes": employer.notes,
+            "tags": employer.tags or [],
+            "created_at": employer.created_at,
+            "updated_at": employer.updated_at,
+        }
 
     def _convert_note(self, note: Note) -> NoteResult:
         """
@@ -295,16 +335,21 @@ class ResultConverter:
         Returns:
             NoteResult: Pydantic schema instance
         """
-        return NoteResult(
-            id=note.id,
-            content=note.text,
-            entity_type_attached=note.entity_type,
-            entity_id_attached=note.entity_id,
-            privacy_level=note.privacy_level,
-            tags=note.tags or [],
-            created_at=note.created_at,
-            updated_at=note.updated_at,
-        )
+        return NoteResult(**self._note_fields(note))
+
+    @staticmethod
+    def _note_fields(note: Note) -> dict[str, Any]:
+        """Extract NoteResult field values from a Note instance."""
+        return {
+            "id": note.id,
+            "content": note.text,
+            "entity_type_attached": note.entity_type,
+            "entity_id_attached": note.entity_id,
+            "privacy_level": note.privacy_level,
+            "tags": note.tags or [],
+            "created_at": note.created_at,
+            "updated_at": note.updated_at,
+        }
 
     def _convert_reminder(self, reminder: Reminder) -> ReminderResult:
         """
@@ -316,18 +361,23 @@ class ResultConverter:
         Returns:
             ReminderResult: Pydantic schema instance
         """
-        return ReminderResult(
-            id=reminder.id,
-            reminder_time=reminder.reminder_time,  # Reminder model uses 'reminder_time'
-            message=reminder.message,  # Reminder model uses 'message' not 'text'
-            entity_type_attached=reminder.related_entity_type,
-            entity_id_attached=reminder.related_entity_id,
-            is_completed=reminder.is_completed,
-            snoozed_until=reminder.snoozed_until,
-            tags=reminder.tags or [],
-            created_at=reminder.created_at,
-            updated_at=reminder.updated_at,
-        )
+        return ReminderResult(**self._reminder_fields(reminder))
+
+    @staticmethod
+    def _reminder_fields(reminder: Reminder) -> dict[str, Any]:
+        """Extract ReminderResult field values from a Reminder instance."""
+        return {
+            "id": reminder.id,
+            "reminder_time": reminder.reminder_time,  # Reminder model uses 'reminder_time'
+            "message": reminder.message,  # Reminder model uses 'message' not 'text'
+            "entity_type_attached": reminder.related_entity_type,
+            "entity_id_attached": reminder.related_entity_id,
+            "is_completed": reminder.is_completed,
+            "snoozed_until": reminder.snoozed_until,
+            "tags": reminder.tags or [],
+            "created_at": reminder.created_at,
+            "updated_at": reminder.updated_at,
+        }
 
     def _convert_user(self, user: User) -> UserResult:
         """
@@ -339,12 +389,56 @@ class ResultConverter:
         Returns:
             UserResult: Pydantic schema instance
         """
-        return UserResult(
-            id=user.id,
-            full_name=user.full_name,
-            email=user.email,
-            timezone=user.timezone,
-            week_boundary=user.week_boundary,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-        )
+        return UserResult(**self._user_fields(user))
+
+    @staticmethod
+    def _user_fields(user: User) -> dict[str, Any]:
+        """Extract UserResult field values from a User instance."""
+        return {
+            "id": user.id,
+            "full_name": user.full_name,
+            "email": user.email,
+            "timezone": user.timezone,
+            "week_boundary": user.week_boundary,
+            "created_at": user.created_at,
+            "updated_at": user.updated_at,
+        }
+
+
+ResultConverter._RESULT_CONVERTERS = (
+    ("work_sessions", ResultConverter._convert_work_session),
+    ("meetings", ResultConverter._convert_meeting),
+    ("projects", ResultConverter._convert_project),
+    ("people", ResultConverter._convert_person),
+    ("clients", ResultConverter._convert_client),
+    ("employers", ResultConverter._convert_employer),
+    ("notes", ResultConverter._convert_note),
+    ("reminders", ResultConverter._convert_reminder),
+    ("users", ResultConverter._convert_user),
+)
+
+ResultConverter._CONVERTERS_BY_MODEL = {
+    WorkSession: ResultConverter._convert_work_session,
+    Meeting: ResultConverter._convert_meeting,
+    Project: ResultConverter._convert_project,
+    Person: ResultConverter._convert_person,
+    Client: ResultConverter._convert_client,
+    Employer: ResultConverter._convert_employer,
+    Note: ResultConverter._convert_note,
+    Reminder: ResultConverter._convert_reminder,
+    User: ResultConverter._convert_user,
+}
+
+ResultConverter._BULK_CONVERTERS = {
+    entity_type: (fields, TypeAdapter(list[schema]))  # type: ignore[valid-type]
+    for entity_type, fields, schema in (
+        (EntityType.WORK_SESSION, ResultConverter._work_session_fields, WorkSessionResult),
+        (EntityType.MEETING, ResultConverter._meeting_fields, MeetingResult),
+        (EntityType.PROJECT, ResultConverter._project_fields, ProjectResult),
+        (EntityType.PERSON, ResultConverter._person_fields, PersonResult),
+        (EntityType.CLIENT, ResultConverter._client_fields, ClientResult),
+        (EntityType.EMPLOYER, ResultConverter._employer_fields, EmployerResult),
+        (EntityType.NOTE, ResultConverter._note_fields, NoteResult),
+        (EntityType.REMINDER, ResultConverter._reminder_fields, ReminderResult),
+    )
+}
@@ -1,11 +1,15 @@
 """Service layer for scheduled tasks using APScheduler."""
 
+import asyncio
 import logging
+from datetime import timedelta
 
-from apscheduler import AsyncScheduler
+from apscheduler import AsyncScheduler, CoalescePolicy
 from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from .database import get_session
+from ..models.reminder import Reminder
+from .database import async_session_factory
 from .notification_service import NotificationService
 from .reminder_service import ReminderService
 
@@ -19,10 +23,18 @@ class SchedulerService:
     Runs periodic jobs for checking and notifying about due reminders.
     """
 
-    def __init__(self) -> None:
-        """Initialize SchedulerService with AsyncScheduler."""
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession] | None = None) -> None:
+        """
+        Initialize SchedulerService with AsyncScheduler.
+
+        Args:
+            session_factory: Factory for the per-run database sessions
+                (defaults to the application's session factory)
+        """
         self.scheduler = AsyncScheduler()
         self.notification_service = NotificationService()
+        self._session_factory = session_factory or async_session_factory
+        self._job_lock = asyncio.Lock()
         self._is_running = False
 
     async def start(self) -> None:
@@ -42,11 +54,14 @@ class SchedulerService:
         # Enter the scheduler context (required by APScheduler 4.x)
         await self.scheduler.__aenter__()
 
-        # Add reminder check job (runs every 1 minute)
+        # Add reminder check job (runs every 1 minute). Ticks missed while the process
+        # was suspended collapse into one run, and runs more than 30s late are dropped
         await self.scheduler.add_schedule(
             self._check_and_notify_reminders,
             trigger=IntervalTrigger(minutes=1),
             id="check_reminders",
+            coalesce=CoalescePolicy.latest,
+            misfire_grace_time=timedelta(seconds=30),
         )
 
         # Start the scheduler in background
@@ -86,11 +101,30 @@ class SchedulerService:
         3. Marks reminder as notified (updates last_notified_at)
         4. Auto-completes non-recurring reminders if configured
 
+        Runs never overlap: if the previous run is still in progress (slow
+        notifications or database), this run is skipped.
+
+        Raises:
+            None (logs errors instead of raising)
+        """
+        if self._job_lock.locked():
+            logger.warning("Previous reminder check still running, skipping this run")
+            return
+
+        async with self._job_lock:
+            await self._run_reminder_check()
+
+    async def _run_reminder_check(self) -> None:
+        """
+        Check for due reminders, notify, and mark them notified in one transaction.
+
         Raises:
             None (logs errors instead of raising)
         """
         try:
-            async with get_session() as session:
+            # One session and one transaction per run: committed when the block
+            # exits normally, rolled back if anything raises
+            async with self._session_factory() as session, session.begin():
                 reminder_service = ReminderService(session)
 
                 # Get all due reminders (with cooldown filter applied)
@@ -102,31 +136,52 @@ class SchedulerService:
 
                 logger.info(f"Found {len(due_reminders)} due reminders")
 
-                # Send notification for each due reminder
-                for reminder in due_reminders:
-                    success = await self.notification_service.trigger_notification(
-                        title="Reminder",
-                        message=reminder.message,
-                        metadata={
-                            "reminder_id": reminder.id,
-                            "reminder_time": reminder.reminder_time.isoformat(),
-                            "related_entity_type": reminder.related_entity_type,
-                            "related_entity_id": reminder.related_entity_id,
-                        },
-                    )
-
-                    if success:
-                        # Mark as notified to prevent spam
-                        await reminder_service.mark_notified(reminder.id)
-                        logger.info(
-                            f"Notification sent successfully for reminder {reminder.id}, "
-                            f"marked as notified"
+                # Notifications are independent I/O, so send them concurrently; the
+                # session is not shared across tasks and is only touched afterwards
+                results = await asyncio.gather(
+                    *(self._notify_one(reminder) for reminder in due_reminders),
+                    return_exceptions=True,
+                )
+
+                notified_ids: list[int] = []
+                for reminder, result in zip(due_reminders, results):
+                    if isinstance(result, BaseException):
+                        logger.error(
+                            f"Error sending notification for reminder {reminder.id}: {result}",
+                            exc_info=result,
                         )
-                    else:
-                        logger.error(f"Failed to send notification for reminder {reminder.id}")
+                    elif result:
+                        notified_ids.append(reminder.id)
 
-                # Commit all changes
-                await session.commit()
+                # Mark as notified to prevent spam, in one UPDATE for the whole batch
+                await reminder_service.mark_notified_many(notified_ids)
 
         except Exception as e:
             logger.error(f"Error in _check_and_notify_reminders: {e}", exc_info=True)
+
+    async def _notify_one(self, reminder: Reminder) -> bool:
+        """
+        Send the notification for a single due reminder.
+
+        Args:
+            reminder: Due reminder to notify about
+
+        Returns:
+            bool: True if the notification was delivered
+        """
+        success = await self.notification_service.trigger_notification(
+            title="Reminder",
+            message=reminder.message,
+            metadata={
+                "reminder_id": reminder.id,
+                "reminder_time": reminder.reminder_time.isoformat(),
+                "related_entity_type": reminder.related_entity_type,
+                "related_entity_id": reminder.related_entity_id,
+            },
+        )
+
+        if success:
+            logger.info(f"Notification sent successfully for reminder {reminder.id}")
+        else:
+            logger.error(f"Failed to send notification for reminder {reminder.id}")
+        return success
@@ -1,10 +1,17 @@
 """Summary generator service for natural language query summaries."""
 
-from collections import defaultdict
-from typing import cast
+from collections import Counter
+from decimal import Decimal
+from typing import ClassVar
 
 from ..models.base import PrivacyLevel
-from ..schemas.query import QueryResultEntity, WorkSessionResult
+from ..schemas.query import MeetingResult, NoteResult, QueryResultEntity, WorkSessionResult
+
+_PRIVATE = PrivacyLevel.PRIVATE.value
+
+# Result schemas that have privacy_level; anything else is never private, and
+# getattr() of a missing attribute on a pydantic model is slow
+_PRIVACY_SCHEMAS = (WorkSessionResult, MeetingResult, NoteResult)
 
 
 class SummaryGenerator:
@@ -15,6 +22,19 @@ class SummaryGenerator:
     and provide meaningful insights about the data returned.
     """
 
+    # (entity_type, singular, plural) for every counted type after work sessions
+    _LABELS: ClassVar[tuple[tuple[str, str, str], ...]] = (
+        ("meeting", "meeting", "meetings"),
+        ("project", "project", "projects"),
+        ("person", "person", "people"),
+        ("client", "client", "clients"),
+        ("employer", "employer", "employers"),
+        ("note", "note", "notes"),
+        ("reminder", "reminder", "reminders"),
+        ("user", "user", "users"),
+        ("employment_history", "employment history", "employment histories"),
+    )
+
     def generate(
         self,
         results: list[QueryResultEntity],
@@ -42,129 +62,65 @@ class SummaryGenerator:
         if not results:
             return "No results found."
 
-        # Filter by privacy if needed
-        filtered_results = results
-        if not include_private:
-            filtered_results = [
-                r
-                for r in results
-                if not hasattr(r, "privacy_level") or r.privacy_level != PrivacyLevel.PRIVATE
-            ]
+        # Filter by privacy and count by entity type in one pass
+        # (only work sessions are needed in full)
+        counts, work_sessions = self._count_by_entity_type(results, include_private)
 
-        if not filtered_results:
+        if not counts:
             return "No results found (all results are private)."
 
-        # Group results by entity type
-        grouped = self._group_by_entity_type(filtered_results)
-
         # Build summary parts
         summary_parts = []
 
         # Work sessions summary (with total hours)
-        if grouped["work_sessions"]:
-            ws_summary = self._summarize_work_sessions(
-                cast(list[WorkSessionResult], grouped["work_sessions"])
-            )
+        if work_sessions:
+            ws_summary = self._summarize_work_sessions(work_sessions)
             summary_parts.append(ws_summary)
 
-        # Meetings summary
-        if grouped["meetings"]:
-            count = len(grouped["meetings"])
-            plural = "meeting" if count == 1 else "meetings"
-            summary_parts.append(f"{count} {plural}")
-
-        # Projects summary
-        if grouped["projects"]:
-            count = len(grouped["projects"])
-            plural = "project" if count == 1 else "projects"
-            summary_parts.append(f"{count} {plural}")
-
-        # People summary
-        if grouped["people"]:
-            count = len(grouped["people"])
-            plural = "person" if count == 1 else "people"
-            summary_parts.append(f"{count} {plural}")
-
-        # Clients summary
-        if grouped["clients"]:
-            count = len(grouped["clients"])
-            plural = "client" if count == 1 else "clients"
-            summary_parts.append(f"{count} {plural}")
-
-        # Employers summary
-        if grouped["employers"]:
-            count = len(grouped["employers"])
-            plural = "employer" if count == 1 else "employers"
-            summary_parts.append(f"{count} {plural}")
-
-        # Notes summary
-        if grouped["notes"]:
-            count = len(grouped["notes"])
-            plural = "note" if count == 1 else "notes"
-            summary_parts.append(f"{count} {plural}")
-
-        # Reminders summary
-        if grouped["reminders"]:
-            count = len(grouped["reminders"])
-            plural = "reminder" if count == 1 else "reminders"
-            summary_parts.append(f"{count} {plural}")
-
-        # Users summary
-        if grouped["users"]:
-            count = len(grouped["users"])
-            plural = "user" if count == 1 else "users"
-            summary_parts.append(f"{count} {plural}")
-
-        # Employment histories summary
-        if grouped["employment_histories"]:
-            count = len(grouped["employment_histories"])
-            plural = "employment history" if count == 1 else "employment histories"
-            summary_parts.append(f"{count} {plural}")
-
-        # Combine parts
+        # Count summaries for the remaining entity types, in display order
+        for entity_type, singular, plural in self._LABELS:
+            count = counts[entity_type]
+            if count:
+                summary_parts.append(f"{count} {singular if count == 1 else plural}")
+
+        # Combine parts (without mutating summary_parts)
         if len(summary_parts) == 1:
-            return f"Found {summary_parts[0]}."
+            body = summary_parts[0]
         elif len(summary_parts) == 2:
-            return f"Found {summary_parts[0]} and {summary_parts[1]}."
+            body = f"{summary_parts[0]} and {summary_parts[1]}"
         else:
-            last_part = summary_parts.pop()
-            return f"Found {', '.join(summary_parts)}, and {last_part}."
+            body = ", ".join(summary_parts[:-1]) + f", and {summary_parts[-1]}"
+        return f"Found {body}."
 
-    def _group_by_entity_type(
-        self, results: list[QueryResultEntity]
-    ) -> dict[str, list[QueryResultEntity]]:
+    def _count_by_entity_type(
+        self, results: list[QueryResultEntity], include_private: bool = True
+    ) -> tuple[Counter[str], list[WorkSessionResult]]:
         """
-        Group results by entity type.
+        Count results by entity type in a single pass, skipping private ones if asked.
 
         Args:
             results: List of query result entities
+            include_private: Count private entities (default: True)
 
         Returns:
-            dict[str, list]: Results grouped by entity type (plural keys)
+            tuple[Counter, list]: Counts keyed by entity_type value, and the work
+                sessions themselves (needed for the hours total)
         """
-        # Map singular entity_type values to plural keys
-        type_mapping = {
-            "work_session": "work_sessions",
-            "meeting": "meetings",
-            "project": "projects",
-            "person": "people",
-            "client": "clients",
-            "employer": "employers",
-            "note": "notes",
-            "reminder": "reminders",
-            "user": "users",
-            "employment_history": "employment_histories",
-        }
-
-        grouped: dict[str, list[QueryResultEntity]] = defaultdict(list)
+        counts: Counter[str] = Counter()
+        work_sessions: list[WorkSessionResult] = []
 
         for result in results:
-            entity_type = result.entity_type
-            # Convert singular to plural key
-            plural_key = type_mapping.get(entity_type, f"{entity_type}s")
-            grouped[plural_key].append(result)
-
-        return grouped
+            if (
+                not include_private
+                and isinstance(result, _PRIVACY_SCHEMAS)
+                and result.privacy_level == _PRIVATE
+            ):
+                continue
+            counts[result.entity_type] += 1
+            if isinstance(result, WorkSessionResult):
+                work_sessions.append(result)
+
+        return counts, work_sessions
 
     def _summarize_work_sessions(self, work_sessions: list[WorkSessionResult]) -> str:
         """
@@ -179,8 +135,9 @@ class SummaryGenerator:
         count = len(work_sessions)
         plural = "work session" if count == 1 else "work sessions"
 
-        # Calculate total hours (sum of Decimals is always Decimal)
-        total_hours = sum(ws.duration_hours for ws in work_sessions)
+        # Sum as Decimal: libmpdec addition is cheaper than converting each value
+        # to float, and it keeps the one-decimal rounding exact (0.15 -> 0.2)
+        total_hours = sum((ws.duration_hours for ws in work_sessions), Decimal(0))
 
         # Format total hours
         hours_str = f"{total_hours:.1f}"
@@ -1,7 +1,12 @@
-"""Time utility functions for work session duration validation."""
+"""Time utility functions for duration validation and calculation."""
 
+from datetime import datetime
 from decimal import Decimal
 
+# Pre-built bounds so validation compares Decimal to Decimal (no int coercion per call)
+_MIN_DURATION_HOURS = Decimal(0)
+_MAX_DURATION_HOURS = Decimal(24)
+
 
 def validate_duration_hours(duration: Decimal) -> None:
     """
@@ -17,7 +22,25 @@ def validate_duration_hours(duration: Decimal) -> None:
     Raises:
         ValueError: If validation fails
     """
-    if duration <= 0:
+    if duration <= _MIN_DURATION_HOURS:
         raise ValueError("Duration must be greater than 0")
-    if duration > 24:
+    if duration > _MAX_DURATION_HOURS:
         raise ValueError("Duration must not exceed 24 hours")
+
+
+def minutes_between(start_time: datetime, end_time: datetime) -> int:
+    """
+    Calculate whole minutes between two times, dropping any partial minute.
+
+    Uses integer arithmetic on the timedelta fields rather than
+    total_seconds() / 60, so no float is involved.
+
+    Args:
+        start_time: Start of the interval
+        end_time: End of the interval (after start_time)
+
+    Returns:
+        int: Elapsed whole minutes
+    """
+    delta = end_time - start_time
+    return delta.days * 1440 + delta.seconds // 60
@@ -1,10 +1,11 @@
 """Work session service with business logic for time tracking."""
 
+from collections.abc import Sequence
 from datetime import date
 from decimal import Decimal
 from typing import Any, Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import RowMapping, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models.base import PrivacyLevel
@@ -101,37 +102,36 @@ class WorkSessionService:
         if duration_hours is not None:
             validate_duration_hours(duration_hours)
 
-        # Fetch existing work session
-        result = await self.session.execute(
-            select(WorkSession).where(WorkSession.id == work_session_id)
-        )
-        work_session = result.scalar_one_or_none()
+        values: dict[str, Any] = {
+            name: value
+            for name, value in (
+                ("project_id", project_id),
+                ("date", date),
+                ("duration_hours", duration_hours),
+                ("summary", summary),
+                ("privacy_level", privacy_level),
+                ("tags", tags),
+            )
+            if value is not None
+        }
+
+        if not values:
+            work_session = await self.get_work_session(work_session_id)
+        else:
+            # One UPDATE ... RETURNING instead of load, mutate, flush, refresh;
+            # populate_existing overwrites an instance already in the identity map
+            result = await self.session.execute(
+                update(WorkSession)
+                .where(WorkSession.id == work_session_id)
+                .values(**values)
+                .returning(WorkSession)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            work_session = result.scalar_one_or_none()
 
         if work_session is None:
             raise ValueError(f"WorkSession with id {work_session_id} not found")
 
-        # Update fields
-        if project_id is not None:
-            work_session.project_id = project_id
-
-        if date is not None:
-            work_session.date = date
-
-        if duration_hours is not None:
-            work_session.duration_hours = duration_hours
-
-        if summary is not None:
-            work_session.summary = summary
-
-        if privacy_level is not None:
-            work_session.privacy_level = privacy_level
-
-        if tags is not None:
-            work_session.tags = tags
-
-        await self.session.flush()
-        await self.session.refresh(work_session)
-
         return work_session
 
     async def generate_timecard(
@@ -140,7 +140,7 @@ class WorkSessionService:
         end_date: date,
         include_private: bool = True,
         project_id: Optional[int] = None,
-    ) -> list[dict[str, Any]]:
+    ) -> Sequence[RowMapping]:
         """
         Generate timecard data by project and date.
 
@@ -155,12 +155,12 @@ class WorkSessionService:
             project_id: Optional filter to specific project
 
         Returns:
-            list[dict]: Timecard entries with aggregated data
-                Each dict contains:
+            Sequence[RowMapping]: Read-only, dict-like timecard entries
+                with aggregated data. Each mapping contains:
                 - date: Session date
                 - project_id: Project ID
                 - total_hours: Sum of all session hours for project/date
-                - summary: Combined summaries (newline separated)
+                - summary: Combined summaries (newline separated, "" if none)
 
         Raises:
             ValueError: If end_date is before start_date
@@ -174,7 +174,7 @@ class WorkSessionService:
                 WorkSession.date,
                 WorkSession.project_id,
                 func.sum(WorkSession.duration_hours).label("total_hours"),
-                func.string_agg(WorkSession.summary, "\n").label("summary"),
+                func.coalesce(func.string_agg(WorkSession.summary, "\n"), "").label("summary"),
             )
             .where(WorkSession.date >= start_date)
             .where(WorkSession.date <= end_date)
@@ -190,22 +190,9 @@ class WorkSessionService:
         if project_id is not None:
             query = query.where(WorkSession.project_id == project_id)
 
-        # Execute query
+        # Execute query; rows come back as mappings, no per-row dict building
         result = await self.session.execute(query)
-        rows = result.all()
-
-        # Convert to list of dicts
-        timecard = []
-        for row in rows:
-            timecard.append(
-                {
-                    "date": row.date,
-                    "project_id": row.project_id,
-                    "total_hours": row.total_hours,
-                    "summary": row.summary if row.summary else "",
-                }
-            )
-
+        timecard: Sequence[RowMapping] = result.mappings().all()
         return timecard
 
     async def get_work_session(self, work_session_id: int) -> Optional[WorkSession]:
@@ -234,14 +221,6 @@ class WorkSessionService:
             bool: True if deleted, False if not found
         """
         result = await self.session.execute(
-            select(WorkSession).where(WorkSession.id == work_session_id)
+            delete(WorkSession).where(WorkSession.id == work_session_id).returning(WorkSession.id)
         )
-        work_session = result.scalar_one_or_none()
-
-        if work_session is None:
-            return False
-
-        await self.session.delete(work_session)
-        await self.session.flush()
-
-        return True
+        return result.scalar_one_or_none() is not None
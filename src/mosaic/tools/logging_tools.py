@@ -32,6 +32,7 @@ from ..schemas.work_session import (
 )
 from ..server import AppContext, mcp
 from ..services.meeting_service import MeetingService
+from ..services.time_utils import minutes_between
 from ..services.work_session_service import WorkSessionService
 
 logger = logging.getLogger(__name__)
@@ -122,7 +123,7 @@ async def log_meeting(
             service = MeetingService(session)
 
             # Calculate duration in minutes
-            duration_minutes = int((input.end_time - input.start_time).total_seconds() / 60)
+            duration_minutes = minutes_between(input.start_time, input.end_time)
 
             meeting = await service.create_meeting(
                 start_time=input.start_time,
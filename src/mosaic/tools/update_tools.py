@@ -24,6 +24,7 @@ from ..schemas.work_session import UpdateWorkSessionInput, UpdateWorkSessionOutp
 from ..server import AppContext, mcp
 from ..services.meeting_service import MeetingService
 from ..services.reminder_service import ReminderService
+from ..services.time_utils import minutes_between
 from ..services.work_session_service import WorkSessionService
 
 logger = logging.getLogger(__name__)
@@ -118,7 +119,7 @@ async def update_meeting(
             # Calculate new duration if times changed
             duration_minutes = None
             if input.start_time and input.end_time:
-                duration_minutes = int((input.end_time - input.start_time).total_seconds() / 60)
+                duration_minutes = minutes_between(input.start_time, input.end_time)
 
             meeting = await service.update_meeting(
                 meeting_id=meeting_id,
@@ -4,14 +4,14 @@ from datetime import datetime, timezone
 
 import pytest
 
-from mosaic.models.base import ActionItemStatus, EntityType, PrivacyLevel
-from mosaic.schemas.action_item import (
+from src.mosaic.models.base import ActionItemStatus, EntityType, PrivacyLevel
+from src.mosaic.schemas.action_item import (
     AddActionItemInput,
     DeleteActionItemInput,
     ListActionItemsInput,
     UpdateActionItemInput,
 )
-from mosaic.tools.action_item_tools import (
+from src.mosaic.tools.action_item_tools import (
     add_action_item,
     delete_action_item,
     list_action_items,
@@ -2,14 +2,14 @@
 
 import pytest
 
-from mosaic.models.base import EntityType, PrivacyLevel
-from mosaic.schemas.bookmark import (
+from src.mosaic.models.base import EntityType, PrivacyLevel
+from src.mosaic.schemas.bookmark import (
     AddBookmarkInput,
     DeleteBookmarkInput,
     ListBookmarksInput,
     UpdateBookmarkInput,
 )
-from mosaic.tools.bookmark_tools import (
+from src.mosaic.tools.bookmark_tools import (
     add_bookmark,
     delete_bookmark,
     list_bookmarks,
@@ -11,7 +11,8 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.mosaic.models.base import PrivacyLevel
-from src.mosaic.models.meeting import Meeting
+from src.mosaic.models.meeting import Meeting, MeetingAttendee
+from src.mosaic.models.person import Person
 from src.mosaic.models.project import Project
 from src.mosaic.models.work_session import WorkSession
 from src.mosaic.services.meeting_service import MeetingService
@@ -126,6 +127,32 @@ class TestMeetingWorkSessionAtomic:
 
         assert float(work_session2.duration_hours) == pytest.approx(0.5, abs=0.01)
 
+    @pytest.mark.asyncio
+    async def test_attendees_created_with_meeting_and_work_session(
+        self,
+        meeting_service: MeetingService,
+        session: AsyncSession,
+        project: Project,
+        person: Person,
+    ):
+        """Test attendees are persisted alongside meeting and work session."""
+        start_time = datetime(2024, 1, 15, 9, 0, 0, tzinfo=timezone.utc)
+
+        meeting, work_session = await meeting_service.create_meeting_with_work_session(
+            start_time=start_time,
+            duration_minutes=30,
+            project_id=project.id,
+            title="Attended Meeting",
+            attendee_ids=[person.id],
+        )
+
+        result = await session.execute(
+            select(MeetingAttendee).where(MeetingAttendee.meeting_id == meeting.id)
+        )
+        attendees = list(result.scalars().all())
+        assert [a.person_id for a in attendees] == [person.id]
+        assert work_session.id is not None
+
     @pytest.mark.asyncio
     async def test_invalid_project_raises_error(
         self,
@@ -5,9 +5,10 @@ and recurring reminder generation.
 """
 
 from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.mosaic.services.reminder_service import ReminderService
 from src.mosaic.services.scheduler_service import SchedulerService
@@ -269,3 +270,35 @@ class TestReminderScheduling:
         assert scheduler.scheduler is not None
 
         await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_check_and_notify_reminders_marks_due_reminders(
+        self,
+        session: AsyncSession,
+        test_session_factory: async_sessionmaker,
+    ):
+        """Test one job run notifies due reminders and commits their notified state."""
+        service = ReminderService(session)
+        reminder_time = datetime.now(timezone.utc) - timedelta(minutes=5)
+        one_time = await service.create_reminder(reminder_time=reminder_time, message="Once")
+        recurring = await service.create_reminder(
+            reminder_time=reminder_time,
+            message="Daily",
+            recurrence_config={"frequency": "daily"},
+        )
+        await session.commit()
+
+        scheduler = SchedulerService(session_factory=test_session_factory)
+        scheduler.notification_service.trigger_notification = AsyncMock(return_value=True)
+
+        await scheduler._check_and_notify_reminders()
+
+        assert scheduler.notification_service.trigger_notification.await_count == 2
+        await session.refresh(one_time)
+        await session.refresh(recurring)
+        assert one_time.last_notified_at is not None
+        assert one_time.is_completed is True
+        assert recurring.last_notified_at is not None
+        assert recurring.is_completed is False
+        # Cooldown keeps the recurring reminder out of the next run
+        assert await service.check_due_reminders() == []
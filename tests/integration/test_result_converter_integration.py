@@ -7,11 +7,21 @@ model instances retrieved from the database, ensuring schema alignment.
 from datetime import datetime, timedelta, timezone
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from src.mosaic.models.base import EntityType
+from src.mosaic.models.base import EntityType, PrivacyLevel
+from src.mosaic.models.employer import Employer
+from src.mosaic.models.meeting import Meeting, MeetingAttendee
+from src.mosaic.models.person import Person
 from src.mosaic.models.reminder import Reminder
-from src.mosaic.schemas.query import ReminderResult
+from src.mosaic.schemas.query import (
+    EmployerResult,
+    MeetingResult,
+    PersonResult,
+    ReminderResult,
+)
 from src.mosaic.services.result_converter import ResultConverter
 
 
@@ -216,3 +226,139 @@ class TestResultConverterIntegration:
         assert results[2].is_completed is False
         assert results[2].entity_type_attached == EntityType.PERSON
         assert results[2].entity_id_attached == 5
+
+    @pytest.mark.asyncio
+    async def test_convert_results_orders_mixed_entity_types(
+        self,
+        test_session: AsyncSession,
+        employer: Employer,
+        person: Person,
+    ):
+        """Test mixed results come back in the fixed entity-type order, not dict order."""
+        reminder = Reminder(
+            reminder_time=datetime.now(timezone.utc) + timedelta(hours=1),
+            message="Mixed results",
+            is_completed=False,
+        )
+        test_session.add(reminder)
+        await test_session.commit()
+        await test_session.refresh(reminder)
+
+        converter = ResultConverter()
+        results = converter.convert_results(
+            {
+                "reminders": [reminder],
+                "employers": [employer],
+                "people": [person],
+                "unknown": [object()],
+            }
+        )
+
+        assert [type(result) for result in results] == [
+            PersonResult,
+            EmployerResult,
+            ReminderResult,
+        ]
+        assert [result.id for result in results] == [person.id, employer.id, reminder.id]
+
+    @pytest.mark.asyncio
+    async def test_convert_entity_list_matches_per_entity_conversion(
+        self,
+        test_session: AsyncSession,
+    ):
+        """Test bulk list conversion yields the same schemas as convert_results."""
+        reminder_time = datetime.now(timezone.utc) + timedelta(hours=1)
+        reminders = [
+            Reminder(reminder_time=reminder_time, message="Bulk one", is_completed=False),
+            Reminder(
+                reminder_time=reminder_time + timedelta(hours=1),
+                message="Bulk two",
+                is_completed=True,
+                tags=["bulk"],
+            ),
+        ]
+        test_session.add_all(reminders)
+        await test_session.commit()
+        for reminder in reminders:
+            await test_session.refresh(reminder)
+
+        converter = ResultConverter()
+        bulk = converter.convert_entity_list(EntityType.REMINDER, reminders)
+
+        assert all(isinstance(result, ReminderResult) for result in bulk)
+        assert bulk == converter.convert_results({"reminders": reminders})
+
+    @pytest.mark.asyncio
+    async def test_convert_meeting_requires_eager_loaded_attendees(
+        self,
+        test_session: AsyncSession,
+        person: Person,
+    ):
+        """Test meetings convert when attendees are eager-loaded and fail clearly otherwise."""
+        meeting = Meeting(
+            title="Planning",
+            start_time=datetime(2024, 1, 15, 14, 0, tzinfo=timezone.utc),
+            duration_minutes=30,
+            privacy_level=PrivacyLevel.PUBLIC,
+        )
+        meeting.attendees.append(MeetingAttendee(person_id=person.id))
+        test_session.add(meeting)
+        await test_session.commit()
+        test_session.expunge_all()
+
+        converter = ResultConverter()
+
+        lazy = (await test_session.execute(select(Meeting))).scalar_one()
+        with pytest.raises(ValueError, match="attendees are not loaded"):
+            converter.convert_results({"meetings": [lazy]})
+
+        test_session.expunge_all()
+        eager = (
+            await test_session.execute(select(Meeting).options(selectinload(Meeting.attendees)))
+        ).scalar_one()
+        [result] = converter.convert_results({"meetings": [eager]})
+
+        assert isinstance(result, MeetingResult)
+        assert result.attendees == [person.id]
+
+    @pytest.mark.asyncio
+    async def test_convert_flat_keeps_input_order_across_models(
+        self,
+        test_session: AsyncSession,
+        employer: Employer,
+        person: Person,
+    ):
+        """Test flat conversion dispatches on model class and preserves input order."""
+        reminder = Reminder(
+            reminder_time=datetime.now(timezone.utc) + timedelta(hours=1),
+            message="Flat results",
+            is_completed=False,
+        )
+        test_session.add(reminder)
+        await test_session.commit()
+        await test_session.refresh(reminder)
+
+        converter = ResultConverter()
+        results = converter.convert_flat([reminder, person, employer])
+
+        assert [type(result) for result in results] == [
+            ReminderResult,
+            PersonResult,
+            EmployerResult,
+        ]
+        assert [result.id for result in results] == [reminder.id, person.id, employer.id]
+        assert results[0] == converter.convert_results({"reminders": [reminder]})[0]
+
+    def test_convert_flat_rejects_unsupported_model(self):
+        """Test convert_flat raises ValueError for objects it cannot convert."""
+        converter = ResultConverter()
+
+        with pytest.raises(ValueError, match="Unsupported model type: object"):
+            converter.convert_flat([object()])
+
+    def test_convert_entity_list_rejects_unsupported_type(self):
+        """Test convert_entity_list raises ValueError for unsupported entity types."""
+        converter = ResultConverter()
+
+        with pytest.raises(ValueError, match="Unsupported entity type"):
+            converter.convert_entity_list(EntityType.BOOKMARK, [])
@@ -338,6 +338,34 @@ class TestTimecardGeneration:
         assert len(timecard) == 1
         assert timecard[0]["project_id"] == project_alpha.id
 
+    async def test_timecard_summary_defaults_to_empty_string(
+        self,
+        work_session_service: WorkSessionService,
+        session: AsyncSession,
+        project_alpha: Project,
+    ):
+        """Test entries without any session summaries report an empty summary."""
+        work_date = date(2024, 1, 15)
+        await work_session_service.create_work_session(
+            project_id=project_alpha.id,
+            date=work_date,
+            duration_hours=Decimal("2.0"),
+        )
+
+        await session.commit()
+
+        timecard = await work_session_service.generate_timecard(
+            start_date=work_date,
+            end_date=work_date,
+        )
+
+        assert dict(timecard[0]) == {
+            "date": work_date,
+            "project_id": project_alpha.id,
+            "total_hours": Decimal("2.0"),
+            "summary": "",
+        }
+
     async def test_timecard_empty_range(
         self,
         work_session_service: WorkSessionService,
@@ -5,8 +5,8 @@ from datetime import datetime, timezone
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from mosaic.models.action_item import ActionItem
-from mosaic.models.base import ActionItemStatus, EntityType, PrivacyLevel
+from src.mosaic.models.action_item import ActionItem
+from src.mosaic.models.base import ActionItemStatus, EntityType, PrivacyLevel
 
 
 @pytest.mark.asyncio
@@ -1,7 +1,9 @@
 """Tests for Base, TimestampMixin, and Enums."""
 
+from unittest.mock import MagicMock
+
 import pytest
-from sqlalchemy import Integer, String
+from sqlalchemy import Integer, String, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -15,6 +17,7 @@ from src.mosaic.models.base import (
     TimestampMixin,
     WeekBoundary,
 )
+from src.mosaic.models.types import trigram_available
 
 
 class TestModel(Base, TimestampMixin):
@@ -99,3 +102,64 @@ def test_enum_values_comprehensive(enum_class: type, expected_values: list[str])
     """Test all enum classes have expected values."""
     actual_values = [e.value for e in enum_class]
     assert set(actual_values) == set(expected_values)
+
+
+def test_trigram_indexes_declared_on_models() -> None:
+    """Test substring-search trigram indexes are part of the model metadata."""
+    indexes = {
+        index.name: index
+        for table in Base.metadata.tables.values()
+        for index in table.indexes
+        if index.name.endswith("_trgm")
+    }
+
+    assert set(indexes) == {
+        "ix_people_full_name_trgm",
+        "ix_people_email_trgm",
+        "ix_people_search_blob_trgm",
+        "ix_work_sessions_summary_trgm",
+        "ix_meetings_title_trgm",
+        "ix_meetings_summary_trgm",
+        "ix_notes_text_trgm",
+        "ix_projects_name_trgm",
+        "ix_projects_description_trgm",
+        "ix_clients_name_trgm",
+        "ix_clients_notes_trgm",
+        "ix_employers_name_trgm",
+        "ix_employers_notes_trgm",
+        "ix_reminders_message_trgm",
+    }
+    for index in indexes.values():
+        assert index.dialect_options["postgresql"]["using"] == "gin"
+        assert set(index.dialect_options["postgresql"]["ops"].values()) == {"gin_trgm_ops"}
+
+
+@pytest.mark.parametrize("available", [True, False])
+def test_trigram_available_follows_server_extensions(available: bool) -> None:
+    """Test the trigram DDL condition reflects whether the server offers pg_trgm."""
+    bind = MagicMock()
+    bind.execute.return_value.scalar.return_value = available
+
+    assert trigram_available(None, "people", bind) is available  # type: ignore[arg-type]
+
+
+def test_trigram_available_false_without_connection() -> None:
+    """Test DDL compiled without a connection leaves trigram indexes out."""
+    assert trigram_available(None, "people", None) is False  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_create_all_builds_trigram_indexes_when_available(session: AsyncSession) -> None:
+    """Test create_all creates trigram indexes exactly when pg_trgm is available."""
+    available = (
+        await session.execute(
+            text("SELECT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')")
+        )
+    ).scalar()
+    created = (
+        await session.execute(
+            text("SELECT EXISTS (SELECT 1 FROM pg_indexes WHERE indexname = 'ix_notes_text_trgm')")
+        )
+    ).scalar()
+
+    assert created is available
@@ -3,8 +3,8 @@
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from mosaic.models.base import EntityType, PrivacyLevel
-from mosaic.models.bookmark import Bookmark
+from src.mosaic.models.base import EntityType, PrivacyLevel
+from src.mosaic.models.bookmark import Bookmark
 
 
 @pytest.mark.asyncio
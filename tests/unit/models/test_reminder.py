@@ -220,6 +220,14 @@ async def test_reminder_active_composite_index(session: AsyncSession) -> None:
     assert all(not r.is_completed for r in active_reminders)
 
 
+def test_reminder_due_partial_index() -> None:
+    """Test partial index on reminder_time covers only open reminders."""
+    index = next(i for i in Reminder.__table__.indexes if i.name == "ix_reminders_due")
+
+    assert [c.name for c in index.columns] == ["reminder_time"]
+    assert str(index.dialect_options["postgresql"]["where"]) == "is_completed = false"
+
+
 @pytest.mark.asyncio
 async def test_reminder_long_text(session: AsyncSession) -> None:
     """Test reminder with long text field."""
@@ -259,3 +259,16 @@ async def test_work_session_leap_day_edge_case(session: AsyncSession, project: P
 
     assert work_session.date == leap_day
     assert work_session.duration_hours == Decimal("8.0")
+
+
+def test_work_session_timecard_indexes() -> None:
+    """Test timecard indexes lead with (date, project_id), one partial for shared sessions."""
+    indexes = {i.name: i for i in WorkSession.__table__.indexes}
+
+    covering = indexes["ix_work_sessions_date_project"]
+    assert [c.name for c in covering.columns] == ["date", "project_id"]
+    assert covering.dialect_options["postgresql"]["include"] == ["duration_hours", "privacy_level"]
+
+    shared = indexes["ix_work_sessions_date_project_shared"]
+    assert [c.name for c in shared.columns] == ["date", "project_id"]
+    assert str(shared.dialect_options["postgresql"]["where"]) == "privacy_level != 'PRIVATE'"
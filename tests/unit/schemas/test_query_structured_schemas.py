@@ -0,0 +1,56 @@
+"""Unit tests for StructuredQueryInput field path validation."""
+
+import pytest
+from pydantic import ValidationError
+
+from src.mosaic.models.base import EntityType
+from src.mosaic.schemas.query_structured import (
+    AggregationSpec,
+    FilterSpec,
+    StructuredQueryInput,
+)
+
+
+def test_structured_query_input_accepts_known_fields():
+    """Test direct, mapped and relationship field paths are accepted."""
+    schema = StructuredQueryInput(
+        entity_type=EntityType.WORK_SESSION,
+        filters=[
+            FilterSpec(field="summary", operator="contains", value="api"),
+            FilterSpec(field="project.client.name", operator="eq", value="Acme"),
+            FilterSpec(field="project.on_behalf_of", operator="is_null", value=None),
+        ],
+        aggregation=AggregationSpec(
+            function="sum", field="duration_hours", group_by=["project.name"]
+        ),
+    )
+    assert len(schema.filters) == 3
+
+
+def test_structured_query_input_accepts_count_star():
+    """Test COUNT(*) does not need a real field."""
+    schema = StructuredQueryInput(
+        entity_type=EntityType.PROJECT,
+        aggregation=AggregationSpec(function="count", field="*"),
+    )
+    assert schema.aggregation is not None
+
+
+def test_structured_query_input_rejects_unknown_filter_field():
+    """Test unknown filter fields are rejected at parse time."""
+    with pytest.raises(ValidationError) as exc_info:
+        StructuredQueryInput(
+            entity_type=EntityType.WORK_SESSION,
+            filters=[FilterSpec(field="project.bogus", operator="eq", value=1)],
+        )
+    assert "Unknown field(s) for work_session: project.bogus" in str(exc_info.value)
+
+
+def test_structured_query_input_rejects_unknown_group_by_field():
+    """Test unknown aggregation and group-by fields are rejected."""
+    with pytest.raises(ValidationError) as exc_info:
+        StructuredQueryInput(
+            entity_type=EntityType.CLIENT,
+            aggregation=AggregationSpec(function="sum", field="hours", group_by=["region"]),
+        )
+    assert "hours, region" in str(exc_info.value)
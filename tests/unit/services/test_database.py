@@ -158,6 +158,17 @@ class TestDatabaseSessionManagement:
 
         # Both should succeed - pool pre-ping keeps connections fresh
 
+    @pytest.mark.asyncio
+    async def test_get_session_jit_disabled(self):
+        """Test engine connections run with PostgreSQL JIT turned off."""
+        await self.asyncSetUp()
+        try:
+            async with get_session() as session:
+                result = await session.execute(text("SHOW jit"))
+                assert result.scalar() == "off"
+        finally:
+            await self.asyncTearDown()
+
 
 class TestTableCreation:
     """Test automatic table creation with SQLAlchemy metadata.create_all()."""
@@ -272,3 +283,42 @@ class TestTableCreation:
             # Verify exception is raised
             with pytest.raises(Exception, match="Connection failed"):
                 await _create_tables()
+
+
+class TestEnsureDatabaseExists:
+    """Test database existence check and creation."""
+
+    @pytest.mark.asyncio
+    async def test_creates_database_with_quoted_identifier(self):
+        """Test missing database is created with a safely quoted name."""
+        from src.mosaic.services.database import _ensure_database_exists
+
+        mock_conn = AsyncMock()
+        mock_conn.fetchval.return_value = False
+
+        with (
+            patch(
+                "src.mosaic.services.database.DATABASE_URL",
+                'postgresql+asyncpg://u:p@localhost:5432/we"ird',
+            ),
+            patch("src.mosaic.services.database.asyncpg.connect", return_value=mock_conn),
+        ):
+            await _ensure_database_exists()
+
+        query = mock_conn.fetchval.call_args.args[0]
+        assert query.startswith("SELECT EXISTS(")
+        mock_conn.execute.assert_awaited_once_with('CREATE DATABASE "we""ird"')
+        mock_conn.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_skips_creation_when_database_exists(self):
+        """Test existing database is left untouched."""
+        from src.mosaic.services.database import _ensure_database_exists
+
+        mock_conn = AsyncMock()
+        mock_conn.fetchval.return_value = True
+
+        with patch("src.mosaic.services.database.asyncpg.connect", return_value=mock_conn):
+            await _ensure_database_exists()
+
+        mock_conn.execute.assert_not_awaited()
@@ -1,10 +1,11 @@
 """Unit tests for NotificationService with desktop-notifier."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from src.mosaic.services.notification_service import NotificationService
+from src.mosaic.services.notification_service import NotificationService, _background_sends
 
 
 class TestNotificationSending:
@@ -79,6 +80,49 @@ class TestNotificationSending:
             assert call_kwargs["sound"] is None
 
 
+class TestFireAndForget:
+    """Test background notification sends."""
+
+    @pytest.mark.asyncio
+    async def test_fire_and_forget_returns_before_send_completes(self):
+        """Test caller is not blocked on the notification backend."""
+        service = NotificationService()
+        release = asyncio.Event()
+
+        async def slow_send(**kwargs):
+            await release.wait()
+
+        with patch.object(service.notifier, "send", side_effect=slow_send) as mock_send:
+            result = await service.trigger_notification(
+                title="Background", message="Queued", fire_and_forget=True
+            )
+
+            assert result is True
+            assert len(_background_sends) == 1
+
+            release.set()
+            await asyncio.gather(*_background_sends)
+
+            mock_send.assert_called_once()
+            assert not _background_sends
+
+    @pytest.mark.asyncio
+    async def test_fire_and_forget_failure_is_logged_not_raised(self):
+        """Test background send failures mark notifications unavailable."""
+        service = NotificationService()
+
+        with patch.object(service.notifier, "send", new_callable=AsyncMock) as mock_send:
+            mock_send.side_effect = RuntimeError("backend down")
+
+            result = await service.trigger_notification(
+                title="Background", message="Queued", fire_and_forget=True
+            )
+            await asyncio.gather(*_background_sends)
+
+            assert result is True
+            assert service._notifications_available is False
+
+
 class TestErrorHandling:
     """Test error handling in notification service."""
 
@@ -142,6 +186,15 @@ class TestDesktopNotifierConfiguration:
         service = NotificationService(app_name="Custom App")
         assert service.notifier is not None
 
+    def test_notifier_reused_for_same_app_name(self):
+        """Test services with the same app name share one pooled notifier."""
+        first = NotificationService()
+        second = NotificationService()
+        other = NotificationService(app_name="Other App")
+
+        assert first.notifier is second.notifier
+        assert other.notifier is not first.notifier
+
     @pytest.mark.asyncio
     async def test_notification_uses_normal_urgency(self):
         """Test notifications use Normal urgency by default."""
@@ -156,3 +209,62 @@ class TestDesktopNotifierConfiguration:
             call_kwargs = mock_send.call_args.kwargs
             # Check urgency is set
             assert "urgency" in call_kwargs
+
+
+class TestCapabilityCache:
+    """Test process-wide caching of notification capabilities."""
+
+    @pytest.fixture(autouse=True)
+    def reset_cache(self):
+        """Clear the module-level capability cache around each test."""
+        with patch("src.mosaic.services.notification_service._capabilities_cache", None):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_capabilities_probed_once_across_instances(self):
+        """Test a second service reuses the first service's probe result."""
+        first = NotificationService(app_name="First App")
+        second = NotificationService(app_name="Second App")
+        capabilities = frozenset({"title", "message"})
+
+        with (
+            patch.object(
+                first.notifier, "get_capabilities", new=AsyncMock(return_value=capabilities)
+            ) as first_probe,
+            patch.object(second.notifier, "get_capabilities", new=AsyncMock()) as second_probe,
+        ):
+            assert await first.check_capabilities() == capabilities
+            assert await second.check_capabilities() == capabilities
+
+        first_probe.assert_awaited_once()
+        second_probe.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_is_not_cached(self):
+        """Test a failed probe returns empty and allows a later retry."""
+        service = NotificationService()
+        probe = AsyncMock(side_effect=[RuntimeError("no backend"), frozenset({"title"})])
+
+        with patch.object(service.notifier, "get_capabilities", new=probe):
+            assert await service.check_capabilities() == frozenset()
+            assert await service.check_capabilities() == frozenset({"title"})
+
+        assert probe.await_count == 2
+
+    def test_concurrent_probes_work_across_event_loops(self):
+        """Test concurrent checks succeed in one event loop and then in a fresh one."""
+        service = NotificationService()
+        capabilities = frozenset({"title"})
+
+        async def slow_probe() -> frozenset[str]:
+            await asyncio.sleep(0)
+            return capabilities
+
+        async def check_concurrently() -> list[frozenset[str] | dict[str, bool]]:
+            return await asyncio.gather(service.check_capabilities(), service.check_capabilities())
+
+        with patch.object(service.notifier, "get_capabilities", new=slow_probe):
+            for _ in range(2):
+                # Uncached each time, so both loops run contended probes
+                with patch("src.mosaic.services.notification_service._capabilities_cache", None):
+                    assert asyncio.run(check_concurrently()) == [capabilities, capabilities]
@@ -1,11 +1,37 @@
 """Unit tests for QueryBuilder service."""
 
 from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
-
-from src.mosaic.services.query_builder import QueryBuilder
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.mosaic.models import (
+    Client,
+    Employer,
+    Meeting,
+    MeetingAttendee,
+    Person,
+    Project,
+    WorkSession,
+)
+from src.mosaic.models.base import EntityType
+from src.mosaic.schemas.query_structured import (
+    AggregationFunction,
+    AggregationSpec,
+    FilterOperator,
+    FilterSpec,
+    StructuredQueryInput,
+)
+from src.mosaic.services.query_builder import (
+    QueryBuilder,
+    _filter_binders,
+    _lookup_field_path,
+    escape_like,
+)
 
 
 class TestQueryBuilderResolveFilterValue:
@@ -113,6 +139,27 @@ class TestQueryBuilderResolveFilterValue:
         assert result.tzinfo is not None
         assert result.tzinfo == timezone.utc
 
+    def test_resolve_uses_supplied_anchors(self, query_builder: QueryBuilder) -> None:
+        """Test shortcuts resolve against caller-supplied today/now anchors."""
+        today = date(2025, 12, 17)  # Wednesday
+        now = datetime(2025, 12, 17, 9, 30, tzinfo=timezone.utc)
+
+        assert query_builder._resolve_filter_value("today", today, now) == today
+        assert query_builder._resolve_filter_value("this_week", today, now) == date(2025, 12, 15)
+        assert query_builder._resolve_filter_value("next_month", today, now) == date(2026, 1, 1)
+        assert query_builder._resolve_filter_value("now", today, now) is now
+
+    def test_build_query_shares_time_anchor(self, query_builder: QueryBuilder) -> None:
+        """Test all shortcuts in one query resolve against the same instant."""
+        _, params = query_builder.build_query(
+            entity_type=EntityType.WORK_SESSION,
+            filters=[
+                FilterSpec(field="date", operator=FilterOperator.GTE, value="this_week"),
+                FilterSpec(field="date", operator=FilterOperator.LTE, value="today"),
+            ],
+        )
+        assert params["p0"] == params["p1"] - timedelta(days=params["p1"].weekday())
+
     # --- ISO datetime parsing tests ---
 
     @pytest.mark.parametrize(
@@ -315,3 +362,535 @@ class TestParseIsoDatetime:
         assert isinstance(result, datetime)
         assert result.microsecond == 123456
         assert result.tzinfo == timezone.utc
+
+
+class TestBuildQueryExecution:
+    """Test QueryBuilder.build_query() statements against the database."""
+
+    @pytest.fixture
+    async def work_sessions(self, session: AsyncSession, project: Project) -> list[WorkSession]:
+        """Create work sessions with varied summaries, tags and dates."""
+        sessions = [
+            WorkSession(
+                project_id=project.id,
+                date=date(2024, 1, 10),
+                duration_hours=Decimal("2.0"),
+                summary="API design review",
+                tags=["backend", "review"],
+            ),
+            WorkSession(
+                project_id=project.id,
+                date=date(2024, 1, 11),
+                duration_hours=Decimal("3.5"),
+                summary="Frontend polish",
+                tags=["frontend"],
+            ),
+            WorkSession(
+                project_id=project.id,
+                date=date(2024, 1, 12),
+                duration_hours=Decimal("1.5"),
+                summary=None,
+                tags=[],
+            ),
+        ]
+        session.add_all(sessions)
+        await session.commit()
+        return sessions
+
+    async def _run(
+        self, session: AsyncSession, entity_type: EntityType, filters: list[FilterSpec], **kwargs
+    ) -> list[Any]:
+        builder = QueryBuilder(session)
+        query, params = builder.build_query(entity_type, filters, **kwargs)
+        result = await session.execute(query, params)
+        if kwargs.get("aggregation"):
+            return list(result.all())
+        return list(result.scalars().all())
+
+    @pytest.mark.parametrize(
+        "operator,value,expected",
+        [
+            ("contains", "design", ["API design review"]),
+            ("starts_with", "front", ["Frontend polish"]),
+            ("ends_with", "REVIEW", ["API design review"]),
+            ("eq", "Frontend polish", ["Frontend polish"]),
+            ("ne", "Frontend polish", ["API design review"]),
+            ("in", ["Frontend polish", "nope"], ["Frontend polish"]),
+            ("not_in", ["Frontend polish"], ["API design review"]),
+        ],
+    )
+    async def test_string_operators(
+        self,
+        session: AsyncSession,
+        work_sessions: list[WorkSession],
+        operator: str,
+        value: Any,
+        expected: list[str],
+    ) -> None:
+        """Test value-bound operators filter rows correctly."""
+        rows = await self._run(
+            session,
+            EntityType.WORK_SESSION,
+            [FilterSpec(field="summary", operator=operator, value=value)],
+        )
+        assert sorted(ws.summary for ws in rows) == expected
+
+    @pytest.mark.parametrize(
+        "operator,value,expected",
+        [
+            ("contains", "100%", ["Hit 100% coverage"]),
+            ("contains", "snake_case", ["Renamed snake_case"]),
+            ("starts_with", "_", []),
+            ("ends_with", "%", []),
+        ],
+    )
+    async def test_like_wildcards_match_literally(
+        self,
+        session: AsyncSession,
+        project: Project,
+        operator: str,
+        value: str,
+        expected: list[str],
+    ) -> None:
+        """Test % and _ in pattern operator values are not wildcards."""
+        session.add_all(
+            [
+                WorkSession(
+                    project_id=project.id,
+                    date=date(2024, 1, 10),
+                    duration_hours=Decimal("1.0"),
+                    summary=summary,
+                )
+                for summary in (
+                    "Hit 100% coverage",
+                    "Hit 1000 tests",
+                    "Renamed snake_case",
+                    "snakeXcase",
+                )
+            ]
+        )
+        await session.commit()
+
+        rows = await self._run(
+            session,
+            EntityType.WORK_SESSION,
+            [FilterSpec(field="summary", operator=operator, value=value)],
+        )
+        assert sorted(ws.summary for ws in rows) == expected
+
+    async def test_null_operators(
+        self, session: AsyncSession, work_sessions: list[WorkSession]
+    ) -> None:
+        """Test is_null / is_not_null ignore the value."""
+        nulls = await self._run(
+            session,
+            EntityType.WORK_SESSION,
+            [FilterSpec(field="summary", operator="is_null", value=None)],
+        )
+        not_nulls = await self._run(
+            session,
+            EntityType.WORK_SESSION,
+            [FilterSpec(field="summary", operator="is_not_null", value="ignored")],
+        )
+        assert len(nulls) == 1
+        assert len(not_nulls) == 2
+
+    async def test_tag_operators(
+        self, session: AsyncSession, work_sessions: list[WorkSession]
+    ) -> None:
+        """Test has_tag and has_any_tag array operators."""
+        has_tag = await self._run(
+            session,
+            EntityType.WORK_SESSION,
+            [FilterSpec(field="tags", operator="has_tag", value="review")],
+        )
+        has_any = await self._run(
+            session,
+            EntityType.WORK_SESSION,
+            [FilterSpec(field="tags", operator="has_any_tag", value=["frontend", "backend"])],
+        )
+        assert [ws.summary for ws in has_tag] == ["API design review"]
+        assert len(has_any) == 2
+
+    async def test_relationship_filters_share_joins(
+        self,
+        session: AsyncSession,
+        work_sessions: list[WorkSession],
+        client: Client,
+        employer: Employer,
+    ) -> None:
+        """Test overlapping relationship paths join each table once."""
+        rows = await self._run(
+            session,
+            EntityType.WORK_SESSION,
+            [
+                FilterSpec(field="project.name", operator="eq", value="Test Project"),
+                FilterSpec(field="project.client.name", operator="contains", value="client"),
+                FilterSpec(field="project.employer.name", operator="eq", value=employer.name),
+                FilterSpec(field="date", operator="gte", value="2024-01-11"),
+            ],
+        )
+        assert len(rows) == 2
+
+    async def test_meeting_attendee_person_filter(
+        self, session: AsyncSession, person: Person
+    ) -> None:
+        """Test filtering meetings through attendees.person."""
+        meeting = Meeting(
+            title="Sync",
+            start_time=datetime(2024, 1, 10, 9, 0, tzinfo=timezone.utc),
+            duration_minutes=30,
+            attendees=[MeetingAttendee(person_id=person.id)],
+        )
+        session.add(meeting)
+        await session.commit()
+
+        rows = await self._run(
+            session,
+            EntityType.MEETING,
+            [FilterSpec(field="attendees.person.full_name", operator="eq", value="John Doe")],
+        )
+        assert [m.id for m in rows] == [meeting.id]
+        assert [a.person_id for a in rows[0].attendees] == [person.id]
+
+    async def test_limit_and_offset(
+        self, session: AsyncSession, work_sessions: list[WorkSession]
+    ) -> None:
+        """Test pagination is applied through bound parameters."""
+        first = await self._run(session, EntityType.WORK_SESSION, [], limit=2)
+        rest = await self._run(session, EntityType.WORK_SESSION, [], limit=2, offset=2)
+        assert len(first) == 2
+        assert len(rest) == 1
+        assert {ws.id for ws in first}.isdisjoint({ws.id for ws in rest})
+
+    async def test_pagination_shares_statement(
+        self, session: AsyncSession, work_sessions: list[WorkSession]
+    ) -> None:
+        """Test paginated and unpaginated calls reuse one statement."""
+        filters = [FilterSpec(field="duration_hours", operator="gt", value=0)]
+        builder = QueryBuilder(session)
+        plain, plain_params = builder.build_query(EntityType.WORK_SESSION, filters)
+        paged, _ = builder.build_query(EntityType.WORK_SESSION, filters, limit=1, offset=1)
+        assert plain is paged
+        assert plain_params["limit"] is None
+        assert len(await self._run(session, EntityType.WORK_SESSION, filters)) == 3
+
+    async def test_load_paths_eager_load_relationships(
+        self, session: AsyncSession, work_sessions: list[WorkSession]
+    ) -> None:
+        """Test requested relationship paths are loaded without lazy loads."""
+        session.expunge_all()
+        rows = await self._run(
+            session,
+            EntityType.WORK_SESSION,
+            [],
+            load_paths=["project", "project.client"],
+        )
+        assert len(rows) == 3
+        assert {ws.project.client.name for ws in rows} == {"Test Client Inc"}
+
+    def test_load_paths_part_of_statement_shape(self) -> None:
+        """Test load paths select a distinct cached statement."""
+        builder = QueryBuilder(session=MagicMock())
+        plain, _ = builder.build_query(EntityType.WORK_SESSION, [])
+        loaded, _ = builder.build_query(EntityType.WORK_SESSION, [], load_paths=["project"])
+        assert plain is not loaded
+
+    def test_invalid_load_path_raises(self) -> None:
+        """Test unknown load paths raise ValueError."""
+        builder = QueryBuilder(session=MagicMock())
+        with pytest.raises(ValueError, match="has no relationship 'nope'"):
+            builder.build_query(EntityType.WORK_SESSION, [], load_paths=["nope"])
+
+    async def test_grouped_aggregation_with_relationship_filter(
+        self, session: AsyncSession, work_sessions: list[WorkSession]
+    ) -> None:
+        """Test SUM grouped by a related field with a filter on a deeper path."""
+        rows = await self._run(
+            session,
+            EntityType.WORK_SESSION,
+            [FilterSpec(field="project.client.name", operator="contains", value="Client")],
+            aggregation=AggregationSpec(
+                function="sum", field="duration_hours", group_by=["project.name"]
+            ),
+        )
+        assert rows == [("Test Project", Decimal("7.00"))]
+
+    async def test_global_count_aggregation(
+        self, session: AsyncSession, work_sessions: list[WorkSession]
+    ) -> None:
+        """Test COUNT(*) without grouping."""
+        rows = await self._run(
+            session,
+            EntityType.WORK_SESSION,
+            [FilterSpec(field="tags", operator="has_any_tag", value=["frontend"])],
+            aggregation=AggregationSpec(function="count", field="*"),
+        )
+        assert rows == [(1,)]
+
+    async def test_build_queries_batch(
+        self, session: AsyncSession, work_sessions: list[WorkSession]
+    ) -> None:
+        """Test sibling aggregations are built in one call, in order."""
+        builder = QueryBuilder(session)
+        specs = [
+            StructuredQueryInput(
+                entity_type=EntityType.WORK_SESSION,
+                aggregation=AggregationSpec(function="count", field="*"),
+            ),
+            StructuredQueryInput(
+                entity_type=EntityType.WORK_SESSION,
+                aggregation=AggregationSpec(function="sum", field="duration_hours"),
+            ),
+        ]
+        results = [
+            (await session.execute(query, params)).scalar_one()
+            for query, params in builder.build_queries(specs)
+        ]
+        assert results == [3, Decimal("7.00")]
+
+    def test_statement_reused_for_same_shape(self) -> None:
+        """Test repeated query shapes reuse one cached statement."""
+        builder = QueryBuilder(session=MagicMock())
+        first, first_params = builder.build_query(
+            EntityType.WORK_SESSION,
+            [FilterSpec(field="summary", operator="contains", value="alpha")],
+        )
+        second, second_params = builder.build_query(
+            EntityType.WORK_SESSION,
+            [FilterSpec(field="summary", operator="contains", value="beta")],
+        )
+        assert first is second
+        assert first_params != second_params
+
+    def test_invalid_field_raises(self) -> None:
+        """Test unknown fields raise ValueError."""
+        builder = QueryBuilder(session=MagicMock())
+        with pytest.raises(ValueError, match="not found"):
+            builder.build_query(
+                EntityType.WORK_SESSION,
+                [FilterSpec(field="project.nonexistent", operator="eq", value=1)],
+            )
+
+
+class TestQueryBuilderDispatch:
+    """Test operator and aggregation dispatch tables."""
+
+    def test_every_operator_has_builder(self) -> None:
+        """Test each FilterOperator maps to an expression builder."""
+        assert set(QueryBuilder._OPERATOR_DISPATCH) == set(FilterOperator)
+
+    def test_every_aggregation_has_builder(self) -> None:
+        """Test each AggregationFunction maps to an aggregate builder."""
+        assert set(QueryBuilder._AGGREGATION_DISPATCH) == set(AggregationFunction)
+
+    def test_unsupported_operator_raises(self) -> None:
+        """Test unknown operators raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported operator"):
+            QueryBuilder._apply_operator(WorkSession.summary, "bogus", "x")  # type: ignore
+
+    def test_unsupported_aggregation_raises(self) -> None:
+        """Test unknown aggregation functions raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported aggregation function"):
+            QueryBuilder._apply_aggregation_function("median", WorkSession.id)  # type: ignore
+
+
+class TestResolvedFieldCache:
+    """Test the precomputed field resolution table."""
+
+    def test_direct_and_mapped_fields_resolved(self) -> None:
+        """Test base-model columns and schema-name mappings are precomputed."""
+        fields = QueryBuilder._RESOLVED_FIELDS[Project]
+        assert fields["name"] == (Project.name, (), "")
+        assert fields["on_behalf_of"] == (Project.on_behalf_of_id, (), "")
+
+    def test_relationship_fields_resolved_with_joins(self) -> None:
+        """Test related-model columns carry their join models."""
+        fields = QueryBuilder._RESOLVED_FIELDS[WorkSession]
+        assert fields["project.client.name"] == (Client.name, (Project, Client), "project.client")
+        assert fields["project.on_behalf_of"] == (Project.on_behalf_of_id, (Project,), "project")
+
+    def test_generated_search_vector_not_a_field(self) -> None:
+        """Test deferred tsvector columns are not exposed as queryable fields."""
+        assert "searchable" not in QueryBuilder.field_paths(EntityType.NOTE)
+        assert "project.searchable" not in QueryBuilder.field_paths(EntityType.WORK_SESSION)
+
+    def test_parse_field_path_uses_cache(self) -> None:
+        """Test field parsing returns the cached column and joins."""
+        column, joins = QueryBuilder._parse_field_path_with_joins(
+            Meeting, "attendees.person.full_name"
+        )
+        assert column is Person.full_name
+        assert joins == [MeetingAttendee, Person]
+        assert QueryBuilder._parse_field_path(Meeting, "attendees.person_id") is (
+            MeetingAttendee.person_id
+        )
+
+    def test_lookup_tables_read_only(self) -> None:
+        """Test the tables behind cached statements cannot be mutated."""
+        with pytest.raises(TypeError):
+            QueryBuilder.RELATIONSHIP_PATHS[EntityType.NOTE] = {}  # type: ignore
+        with pytest.raises(TypeError):
+            QueryBuilder.FIELD_NAME_MAPPINGS[EntityType.PROJECT]["x"] = "y"  # type: ignore
+        with pytest.raises(TypeError):
+            QueryBuilder._RESOLVED_FIELDS[Project]["x"] = (Project.id, ())  # type: ignore
+
+    def test_invalid_field_lookup_memoized(self) -> None:
+        """Test repeated invalid paths reuse the cached slow-path result."""
+        _lookup_field_path.cache_clear()
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Field bogus not found on Project"):
+                QueryBuilder._parse_field_path(WorkSession, "project.bogus")
+        info = _lookup_field_path.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_non_column_attribute_resolved(self) -> None:
+        """Test attributes outside the column table resolve via the slow path."""
+        assert QueryBuilder._parse_field_path(WorkSession, "project") is WorkSession.project
+
+
+class TestJoinDeduplication:
+    """Test relationship joins are applied once per query."""
+
+    @pytest.fixture
+    def query_builder(self) -> QueryBuilder:
+        """Create QueryBuilder instance with mock session."""
+        return QueryBuilder(session=MagicMock())
+
+    def test_shared_prefix_joined_once(self, query_builder: QueryBuilder) -> None:
+        """Test sibling paths under one relationship join it a single time."""
+        query, _ = query_builder.build_query(
+            entity_type=EntityType.WORK_SESSION,
+            filters=[
+                FilterSpec(field="project.name", operator=FilterOperator.EQ, value="A"),
+                FilterSpec(field="project.client.name", operator=FilterOperator.EQ, value="B"),
+                FilterSpec(field="project.employer.name", operator=FilterOperator.EQ, value="C"),
+            ],
+        )
+        sql = str(query)
+        assert sql.count("JOIN projects") == 1
+        assert sql.count("JOIN clients") == 1
+        assert sql.count("JOIN employers") == 1
+
+    def test_aggregation_group_by_and_filter_share_join(self, query_builder: QueryBuilder) -> None:
+        """Test a relationship used by GROUP BY and a filter is joined once."""
+        query, _ = query_builder.build_query(
+            entity_type=EntityType.WORK_SESSION,
+            filters=[
+                FilterSpec(field="project.client.name", operator=FilterOperator.EQ, value="B"),
+            ],
+            aggregation=AggregationSpec(
+                function=AggregationFunction.SUM,
+                field="duration_hours",
+                group_by=["project.name"],
+            ),
+        )
+        sql = str(query)
+        assert sql.count("JOIN projects") == 1
+        assert sql.count("JOIN clients") == 1
+
+    def test_join_tree_reused(self) -> None:
+        """Test the join tree for a set of paths is built once."""
+        first = QueryBuilder._apply_joins(
+            select(WorkSession), WorkSession, ["project", "project.client"]
+        )
+        second = QueryBuilder._apply_joins(
+            select(WorkSession), WorkSession, ["project", "project.client"]
+        )
+        assert first.get_final_froms()[0] is second.get_final_froms()[0]
+
+    def test_relationship_chain_memoized(self) -> None:
+        """Test relationship attribute chains are resolved once per path."""
+        first = QueryBuilder._resolve_relationship_chain(WorkSession, "project.client")
+        second = QueryBuilder._resolve_relationship_chain(WorkSession, "project.client")
+        assert first is second
+        assert first == (WorkSession.project, Project.client)
+
+    def test_invalid_relationship_raises(self) -> None:
+        """Test unknown relationships raise ValueError."""
+        with pytest.raises(ValueError, match="has no relationship 'nope'"):
+            QueryBuilder._resolve_relationship_chain(WorkSession, "project.nope")
+
+
+class TestEntityModelLookup:
+    """Test entity type <-> model class lookups."""
+
+    def test_lookups_round_trip(self) -> None:
+        """Test every entity type maps to a model and back."""
+        for entity_type in QueryBuilder._MODEL_BY_ENTITY:
+            model = QueryBuilder._get_model_class(entity_type)
+            assert QueryBuilder._get_entity_type(model) is entity_type
+
+    def test_unknown_model_raises(self) -> None:
+        """Test unrecognized models raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown model"):
+            QueryBuilder._get_entity_type(MeetingAttendee)
+
+
+class TestBaseSelects:
+    """Test prebuilt statements for unfiltered listings."""
+
+    def test_unfiltered_listing_uses_prebuilt_select(self) -> None:
+        """Test plain listings return the prebuilt statement and pagination params."""
+        builder = QueryBuilder(session=MagicMock())
+        query, params = builder.build_query(EntityType.PROJECT, [], limit=10)
+        assert query is QueryBuilder._BASE_SELECTS[EntityType.PROJECT]
+        assert params == {"limit": 10, "offset": None}
+
+    def test_prebuilt_meeting_select_loads_attendees(self) -> None:
+        """Test the meeting listing keeps attendee eager loading."""
+        query = QueryBuilder._BASE_SELECTS[EntityType.MEETING]
+        assert any("attendees" in str(option.path) for option in query._with_options)
+
+
+class TestFilterBinders:
+    """Test the cached per-shape value binding plan."""
+
+    def test_binders_skip_valueless_and_carry_shapers(self) -> None:
+        """Test valueless operators are skipped and shapers precomputed."""
+        binders = _filter_binders(
+            (
+                ("summary", FilterOperator.CONTAINS),
+                ("summary", FilterOperator.IS_NULL),
+                ("date", FilterOperator.GTE),
+            )
+        )
+        assert [(index, name) for index, name, _ in binders] == [(0, "p0"), (2, "p2")]
+        assert binders[0][2]("x") == "%x%"
+        assert binders[1][2] is None
+
+    def test_build_query_binds_shaped_values(self) -> None:
+        """Test build_query params follow the binding plan."""
+        builder = QueryBuilder(session=MagicMock())
+        _, params = builder.build_query(
+            EntityType.WORK_SESSION,
+            [
+                FilterSpec(field="tags", operator=FilterOperator.HAS_TAG, value="api"),
+                FilterSpec(field="summary", operator=FilterOperator.IS_NOT_NULL, value=None),
+                FilterSpec(field="date", operator=FilterOperator.EQ, value="2024-01-10"),
+            ],
+        )
+        assert params == {
+            "p0": ["api"],
+            "p2": date(2024, 1, 10),
+            "limit": None,
+            "offset": None,
+        }
+
+
+class TestEscapeLike:
+    """Test LIKE wildcard escaping for user text."""
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("plain", "plain"),
+            ("100%", "100\\%"),
+            ("snake_case", "snake\\_case"),
+            ("back\\slash", "back\\\\slash"),
+            (42, "42"),
+        ],
+    )
+    def test_escape_like(self, text: Any, expected: str) -> None:
+        """Test backslash, % and _ are escaped and other text is unchanged."""
+        assert escape_like(text) == expected
@@ -1,12 +1,43 @@
 """Unit tests for QueryParser service."""
 
+import dataclasses
+import re
+from dataclasses import FrozenInstanceError
 from datetime import date, timedelta
 from unittest.mock import patch
 
 import pytest
 
-from src.mosaic.models.base import EntityType, PrivacyLevel
-from src.mosaic.services.query_parser import ParsedQuery, QueryParser, _last_month_range
+from src.mosaic.models.base import ClientStatus, EntityType, PrivacyLevel, ProjectStatus
+from src.mosaic.services.query_parser import (
+    _DEFAULT,
+    ParsedQuery,
+    QueryParser,
+    _last_month_range,
+    _last_week_range,
+    _this_month_range,
+    _this_week_range,
+    _this_year_range,
+    parse,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_parse_cache():
+    """Start every test with an empty module-level parse() cache."""
+    _DEFAULT._parse_cached.cache_clear()
+    yield
+    _DEFAULT._parse_cached.cache_clear()
+
+
+def _entity_types(parser: QueryParser, query: str) -> tuple[EntityType, ...]:
+    """Parse a query and return its entity types (empty tuple when none match)."""
+    return parser.parse(query).entity_types or ()
+
+
+def _privacy_levels(parser: QueryParser, query: str) -> tuple[PrivacyLevel, ...]:
+    """Parse a query and return its privacy levels (empty tuple when none match)."""
+    return parser.parse(query).privacy_levels or ()
 
 
 class TestParsedQuery:
@@ -28,13 +59,17 @@ class TestParsedQuery:
         assert parsed.employer_id is None
         assert parsed.limit is None
 
+    def test_parsed_query_is_slotted(self):
+        """Test ParsedQuery instances carry no per-instance __dict__."""
+        assert not hasattr(ParsedQuery(), "__dict__")
+
     def test_parsed_query_with_values(self):
         """Test ParsedQuery with all fields populated."""
         parsed = ParsedQuery(
-            entity_types=[EntityType.WORK_SESSION],
+            entity_types=(EntityType.WORK_SESSION,),
             start_date=date(2024, 1, 1),
             end_date=date(2024, 1, 31),
-            privacy_levels=[PrivacyLevel.PUBLIC],
+            privacy_levels=(PrivacyLevel.PUBLIC,),
             include_private=False,
             search_text="test query",
             project_id=1,
@@ -44,10 +79,10 @@ class TestParsedQuery:
             limit=10,
         )
 
-        assert parsed.entity_types == [EntityType.WORK_SESSION]
+        assert parsed.entity_types == (EntityType.WORK_SESSION,)
         assert parsed.start_date == date(2024, 1, 1)
         assert parsed.end_date == date(2024, 1, 31)
-        assert parsed.privacy_levels == [PrivacyLevel.PUBLIC]
+        assert parsed.privacy_levels == (PrivacyLevel.PUBLIC,)
         assert parsed.include_private is False
         assert parsed.search_text == "test query"
         assert parsed.project_id == 1
@@ -57,6 +92,20 @@ class TestParsedQuery:
         assert parsed.limit == 10
 
 
+class TestModuleDefinitions:
+    """Guard against a stale, less complete parser definition shadowing the live one."""
+
+    def test_query_parser_has_full_pattern_tables(self):
+        """Test the live QueryParser carries month and status tables."""
+        for attr in ("MONTH_NAMES", "PROJECT_STATUS_PATTERNS", "CLIENT_STATUS_PATTERNS"):
+            assert attr in QueryParser.__dict__
+
+    def test_parsed_query_has_full_field_set(self):
+        """Test the live ParsedQuery carries id and status fields."""
+        fields = {f.name for f in dataclasses.fields(ParsedQuery)}
+        assert {"project_id", "project_status", "client_status"} <= fields
+
+
 class TestQueryParser:
     """Test QueryParser functionality."""
 
@@ -69,163 +118,163 @@ class TestQueryParser:
 
     def test_extract_work_session_pattern_1(self, parser: QueryParser):
         """Test extraction of work session pattern 'work sessions'."""
-        result = parser._extract_entity_types("show me work sessions")
+        result = _entity_types(parser, "show me work sessions")
         assert EntityType.WORK_SESSION in result
         assert len(result) == 1
 
     def test_extract_work_session_pattern_2(self, parser: QueryParser):
         """Test extraction of work session pattern 'time entries'."""
-        result = parser._extract_entity_types("list time entries")
+        result = _entity_types(parser, "list time entries")
         assert EntityType.WORK_SESSION in result
         assert len(result) == 1
 
     def test_extract_work_session_pattern_3(self, parser: QueryParser):
         """Test extraction of work session pattern 'hours'."""
-        result = parser._extract_entity_types("show my hours")
+        result = _entity_types(parser, "show my hours")
         assert EntityType.WORK_SESSION in result
         assert len(result) == 1
 
     def test_extract_work_session_pattern_4(self, parser: QueryParser):
         """Test extraction of work session pattern 'worked'."""
-        result = parser._extract_entity_types("what I worked on")
+        result = _entity_types(parser, "what I worked on")
         assert EntityType.WORK_SESSION in result
         assert len(result) == 1
 
     def test_extract_work_session_singular(self, parser: QueryParser):
         """Test extraction of singular 'work session'."""
-        result = parser._extract_entity_types("show me work session")
+        result = _entity_types(parser, "show me work session")
         assert EntityType.WORK_SESSION in result
 
     def test_extract_work_session_singular_hour(self, parser: QueryParser):
         """Test extraction of singular 'hour'."""
-        result = parser._extract_entity_types("show me hour")
+        result = _entity_types(parser, "show me hour")
         assert EntityType.WORK_SESSION in result
 
     def test_extract_meeting_pattern(self, parser: QueryParser):
         """Test extraction of meeting patterns."""
-        result = parser._extract_entity_types("show me meetings")
+        result = _entity_types(parser, "show me meetings")
         assert EntityType.MEETING in result
 
     def test_extract_meeting_singular(self, parser: QueryParser):
         """Test extraction of singular 'meeting'."""
-        result = parser._extract_entity_types("find meeting")
+        result = _entity_types(parser, "find meeting")
         assert EntityType.MEETING in result
 
     def test_extract_meeting_calls(self, parser: QueryParser):
         """Test extraction of 'calls' as meeting."""
-        result = parser._extract_entity_types("show me calls")
+        result = _entity_types(parser, "show me calls")
         assert EntityType.MEETING in result
 
     def test_extract_meeting_call_singular(self, parser: QueryParser):
         """Test extraction of singular 'call' as meeting."""
-        result = parser._extract_entity_types("find call")
+        result = _entity_types(parser, "find call")
         assert EntityType.MEETING in result
 
     def test_extract_project_pattern(self, parser: QueryParser):
         """Test extraction of project patterns."""
-        result = parser._extract_entity_types("list projects")
+        result = _entity_types(parser, "list projects")
         assert EntityType.PROJECT in result
 
     def test_extract_project_singular(self, parser: QueryParser):
         """Test extraction of singular 'project'."""
-        result = parser._extract_entity_types("find project")
+        result = _entity_types(parser, "find project")
         assert EntityType.PROJECT in result
 
     def test_extract_person_pattern_people(self, parser: QueryParser):
         """Test extraction of 'people' pattern."""
-        result = parser._extract_entity_types("show me people")
+        result = _entity_types(parser, "show me people")
         assert EntityType.PERSON in result
 
     def test_extract_person_pattern_persons(self, parser: QueryParser):
         """Test extraction of 'persons' pattern."""
-        result = parser._extract_entity_types("list persons")
+        result = _entity_types(parser, "list persons")
         assert EntityType.PERSON in result
 
     def test_extract_person_pattern_contacts(self, parser: QueryParser):
         """Test extraction of 'contacts' pattern."""
-        result = parser._extract_entity_types("show my contacts")
+        result = _entity_types(parser, "show my contacts")
         assert EntityType.PERSON in result
 
     def test_extract_person_pattern_contact_singular(self, parser: QueryParser):
         """Test extraction of singular 'contact' pattern."""
-        result = parser._extract_entity_types("find contact")
+        result = _entity_types(parser, "find contact")
         assert EntityType.PERSON in result
 
     def test_extract_person_singular(self, parser: QueryParser):
         """Test extraction of singular 'person'."""
-        result = parser._extract_entity_types("find person")
+        result = _entity_types(parser, "find person")
         assert EntityType.PERSON in result
 
     def test_extract_client_pattern(self, parser: QueryParser):
         """Test extraction of client patterns."""
-        result = parser._extract_entity_types("show me clients")
+        result = _entity_types(parser, "show me clients")
         assert EntityType.CLIENT in result
 
     def test_extract_client_singular(self, parser: QueryParser):
         """Test extraction of singular 'client'."""
-        result = parser._extract_entity_types("find client")
+        result = _entity_types(parser, "find client")
         assert EntityType.CLIENT in result
 
     def test_extract_employer_pattern(self, parser: QueryParser):
         """Test extraction of employer patterns."""
-        result = parser._extract_entity_types("list employers")
+        result = _entity_types(parser, "list employers")
         assert EntityType.EMPLOYER in result
 
     def test_extract_employer_singular(self, parser: QueryParser):
         """Test extraction of singular 'employer'."""
-        result = parser._extract_entity_types("find employer")
+        result = _entity_types(parser, "find employer")
         assert EntityType.EMPLOYER in result
 
     def test_extract_reminder_pattern_reminders(self, parser: QueryParser):
         """Test extraction of 'reminders' pattern."""
-        result = parser._extract_entity_types("show my reminders")
+        result = _entity_types(parser, "show my reminders")
         assert EntityType.REMINDER in result
 
     def test_extract_reminder_pattern_todos(self, parser: QueryParser):
         """Test extraction of 'todos' pattern."""
-        result = parser._extract_entity_types("list todos")
+        result = _entity_types(parser, "list todos")
         assert EntityType.REMINDER in result
 
     def test_extract_reminder_pattern_todo_singular(self, parser: QueryParser):
         """Test extraction of singular 'todo' pattern."""
-        result = parser._extract_entity_types("find todo")
+        result = _entity_types(parser, "find todo")
         assert EntityType.REMINDER in result
 
     def test_extract_reminder_singular(self, parser: QueryParser):
         """Test extraction of singular 'reminder'."""
-        result = parser._extract_entity_types("find reminder")
+        result = _entity_types(parser, "find reminder")
         assert EntityType.REMINDER in result
 
     def test_extract_note_pattern_notes(self, parser: QueryParser):
         """Test extraction of 'notes' pattern."""
-        result = parser._extract_entity_types("show my notes")
+        result = _entity_types(parser, "show my notes")
         assert EntityType.NOTE in result
 
     def test_extract_note_singular(self, parser: QueryParser):
         """Test extraction of singular 'note'."""
-        result = parser._extract_entity_types("find note")
+        result = _entity_types(parser, "find note")
         assert EntityType.NOTE in result
 
     def test_extract_multiple_entity_types(self, parser: QueryParser):
         """Test extraction of multiple entity types."""
-        result = parser._extract_entity_types("show me meetings and projects")
+        result = _entity_types(parser, "show me meetings and projects")
         assert EntityType.MEETING in result
         assert EntityType.PROJECT in result
         assert len(result) == 2
 
     def test_extract_no_entity_types(self, parser: QueryParser):
         """Test extraction when no entity types present."""
-        result = parser._extract_entity_types("show me something else")
-        assert result == []
+        result = _entity_types(parser, "show me something else")
+        assert result == ()
 
     def test_extract_entity_types_case_insensitive(self, parser: QueryParser):
         """Test that entity type extraction is case insensitive."""
-        result = parser._extract_entity_types("show me meetings")
+        result = _entity_types(parser, "show me meetings")
         assert EntityType.MEETING in result
 
     def test_extract_entity_types_no_duplicate(self, parser: QueryParser):
         """Test that entity types are not duplicated if matched multiple times."""
-        result = parser._extract_entity_types("work sessions time entries hours worked")
+        result = _entity_types(parser, "work sessions time entries hours worked")
         # Should only have one WORK_SESSION despite matching multiple patterns
         assert result.count(EntityType.WORK_SESSION) == 1
 
@@ -275,7 +324,7 @@ class TestQueryParser:
     def test_extract_date_range_last_month(self, parser: QueryParser):
         """Test extraction of 'last month' date range."""
         start, end = parser._extract_date_range("show me work from last month")
-        expected_start, expected_end = _last_month_range()
+        expected_start, expected_end = _last_month_range(date.today())
         assert start == expected_start
         assert end == expected_end
 
@@ -305,44 +354,44 @@ class TestQueryParser:
 
     def test_extract_privacy_level_public(self, parser: QueryParser):
         """Test extraction of 'public' privacy level."""
-        result = parser._extract_privacy_levels("show public work")
+        result = _privacy_levels(parser, "show public work")
         assert PrivacyLevel.PUBLIC in result
 
     def test_extract_privacy_level_internal(self, parser: QueryParser):
         """Test extraction of 'internal' privacy level."""
-        result = parser._extract_privacy_levels("show internal work")
+        result = _privacy_levels(parser, "show internal work")
         assert PrivacyLevel.INTERNAL in result
 
     def test_extract_privacy_level_private(self, parser: QueryParser):
         """Test extraction of 'private' privacy level."""
-        result = parser._extract_privacy_levels("show private work")
+        result = _privacy_levels(parser, "show private work")
         assert PrivacyLevel.PRIVATE in result
 
     def test_extract_privacy_levels_multiple(self, parser: QueryParser):
         """Test extraction of multiple privacy levels."""
-        result = parser._extract_privacy_levels("show public and private work")
+        result = _privacy_levels(parser, "show public and private work")
         assert PrivacyLevel.PUBLIC in result
         assert PrivacyLevel.PRIVATE in result
         assert len(result) == 2
 
     def test_extract_privacy_levels_none(self, parser: QueryParser):
         """Test extraction when no privacy levels present."""
-        result = parser._extract_privacy_levels("show me work")
-        assert result == []
+        result = _privacy_levels(parser, "show me work")
+        assert result == ()
 
     def test_extract_privacy_levels_case_insensitive(self, parser: QueryParser):
         """Test that privacy level extraction is case insensitive."""
-        result = parser._extract_privacy_levels("show public work")
+        result = _privacy_levels(parser, "show public work")
         assert PrivacyLevel.PUBLIC in result
 
     def test_extract_privacy_levels_no_duplicate(self, parser: QueryParser):
         """Test that privacy levels are not duplicated."""
-        result = parser._extract_privacy_levels("show public public work")
+        result = _privacy_levels(parser, "show public public work")
         assert result.count(PrivacyLevel.PUBLIC) == 1
 
     def test_extract_privacy_levels_all_three(self, parser: QueryParser):
         """Test extraction of all three privacy levels."""
-        result = parser._extract_privacy_levels("show public internal and private work")
+        result = _privacy_levels(parser, "show public internal and private work")
         assert PrivacyLevel.PUBLIC in result
         assert PrivacyLevel.INTERNAL in result
         assert PrivacyLevel.PRIVATE in result
@@ -360,7 +409,7 @@ class TestQueryParser:
     def test_parse_simple_query(self, parser: QueryParser):
         """Test parsing a simple query."""
         result = parser.parse("show me work sessions")
-        assert result.entity_types == [EntityType.WORK_SESSION]
+        assert result.entity_types == (EntityType.WORK_SESSION,)
         assert result.start_date is None
         assert result.end_date is None
         assert result.privacy_levels is None
@@ -370,15 +419,15 @@ class TestQueryParser:
     def test_parse_query_with_date(self, parser: QueryParser):
         """Test parsing query with date range."""
         result = parser.parse("show me work sessions from today")
-        assert result.entity_types == [EntityType.WORK_SESSION]
+        assert result.entity_types == (EntityType.WORK_SESSION,)
         assert result.start_date == date.today()
         assert result.end_date == date.today()
 
     def test_parse_query_with_privacy(self, parser: QueryParser):
         """Test parsing query with privacy level."""
         result = parser.parse("show me public work sessions")
-        assert result.entity_types == [EntityType.WORK_SESSION]
-        assert result.privacy_levels == [PrivacyLevel.PUBLIC]
+        assert result.entity_types == (EntityType.WORK_SESSION,)
+        assert result.privacy_levels == (PrivacyLevel.PUBLIC,)
 
     def test_parse_query_multiple_entities(self, parser: QueryParser):
         """Test parsing query with multiple entity types."""
@@ -398,7 +447,7 @@ class TestQueryParser:
     def test_parse_query_case_insensitive(self, parser: QueryParser):
         """Test that parsing is case insensitive."""
         result = parser.parse("SHOW ME WORK SESSIONS FROM TODAY")
-        assert result.entity_types == [EntityType.WORK_SESSION]
+        assert result.entity_types == (EntityType.WORK_SESSION,)
         assert result.start_date == date.today()
 
     def test_parse_query_defaults(self, parser: QueryParser):
@@ -418,74 +467,65 @@ class TestQueryParser:
 class TestLastMonthRange:
     """Test _last_month_range helper function."""
 
-    @patch("src.mosaic.services.query_parser.date")
-    def test_last_month_range_january(self, mock_date):
+    def test_last_month_range_january(self):
         """Test last month range when current month is January."""
-        # Mock date.today() to return January 15, 2024
-        mock_date.today.return_value = date(2024, 1, 15)
-        mock_date.side_effect = lambda *args, **kwargs: date(*args, **kwargs)
-
-        start, end = _last_month_range()
+        # Reference date: January 15, 2024
+        start, end = _last_month_range(date(2024, 1, 15))
 
         # December 2023: 12/1 - 12/31
         assert start == date(2023, 12, 1)
         assert end == date(2023, 12, 31)
 
-    @patch("src.mosaic.services.query_parser.date")
-    def test_last_month_range_march(self, mock_date):
+    def test_last_month_range_march(self):
         """Test last month range when current month is March (handles Feb)."""
-        # Mock date.today() to return March 15, 2024 (leap year)
-        mock_date.today.return_value = date(2024, 3, 15)
-        mock_date.side_effect = lambda *args, **kwargs: date(*args, **kwargs)
-
-        start, end = _last_month_range()
+        # Reference date: March 15, 2024 (leap year)
+        start, end = _last_month_range(date(2024, 3, 15))
 
         # February 2024 (leap year): 2/1 - 2/29
         assert start == date(2024, 2, 1)
         assert end == date(2024, 2, 29)
 
-    @patch("src.mosaic.services.query_parser.date")
-    def test_last_month_range_march_non_leap_year(self, mock_date):
+    def test_last_month_range_march_non_leap_year(self):
         """Test last month range for February in non-leap year."""
-        # Mock date.today() to return March 15, 2023 (non-leap year)
-        mock_date.today.return_value = date(2023, 3, 15)
-        mock_date.side_effect = lambda *args, **kwargs: date(*args, **kwargs)
-
-        start, end = _last_month_range()
+        # Reference date: March 15, 2023 (non-leap year)
+        start, end = _last_month_range(date(2023, 3, 15))
 
         # February 2023 (non-leap year): 2/1 - 2/28
         assert start == date(2023, 2, 1)
         assert end == date(2023, 2, 28)
 
-    @patch("src.mosaic.services.query_parser.date")
-    def test_last_month_range_may(self, mock_date):
+    def test_last_month_range_may(self):
         """Test last month range for a 30-day month."""
-        # Mock date.today() to return May 20, 2024
-        mock_date.today.return_value = date(2024, 5, 20)
-        mock_date.side_effect = lambda *args, **kwargs: date(*args, **kwargs)
-
-        start, end = _last_month_range()
+        # Reference date: May 20, 2024
+        start, end = _last_month_range(date(2024, 5, 20))
 
         # April 2024: 4/1 - 4/30
         assert start == date(2024, 4, 1)
         assert end == date(2024, 4, 30)
 
-    @patch("src.mosaic.services.query_parser.date")
-    def test_last_month_range_february(self, mock_date):
+    def test_last_month_range_february(self):
         """Test last month range for a 31-day month."""
-        # Mock date.today() to return February 15, 2024
-        mock_date.today.return_value = date(2024, 2, 15)
-        mock_date.side_effect = lambda *args, **kwargs: date(*args, **kwargs)
-
-        start, end = _last_month_range()
+        # Reference date: February 15, 2024
+        start, end = _last_month_range(date(2024, 2, 15))
 
         # January 2024: 1/1 - 1/31
         assert start == date(2024, 1, 1)
         assert end == date(2024, 1, 31)
 
+    @patch("src.mosaic.services.query_parser.date")
+    def test_date_range_reads_clock_once(self, mock_date):
+        """Test a date range is computed from a single date.today() snapshot."""
+        mock_date.today.return_value = date(2024, 3, 13)  # Wednesday
+
+        start, end = QueryParser()._extract_date_range("work from last week")
+
+        assert start == date(2024, 3, 4)
+        assert end == date(2024, 3, 10)
+        mock_date.today.assert_called_once()
+
     def test_last_month_range_real_call(self):
         """Test _last_month_range without mocking (real dates)."""
-        start, end = _last_month_range()
+        start, end = _last_month_range(date.today())
 
         # Verify that start is first day of some month
         assert start.day == 1
@@ -515,20 +555,20 @@ class TestQueryParserEdgeCases:
     def test_parse_query_with_special_characters(self, parser: QueryParser):
         """Test parsing query with special characters."""
         result = parser.parse("show me work sessions with @tags #hashtags")
-        assert result.entity_types == [EntityType.WORK_SESSION]
+        assert result.entity_types == (EntityType.WORK_SESSION,)
         assert result.search_text == "with @tags #hashtags"
 
     def test_parse_query_with_numbers(self, parser: QueryParser):
         """Test parsing query with numbers."""
         result = parser.parse("find work sessions with 100 hours")
-        assert result.entity_types == [EntityType.WORK_SESSION]
+        assert result.entity_types == (EntityType.WORK_SESSION,)
         assert result.search_text == "with 100"
 
     def test_parse_query_very_long(self, parser: QueryParser):
         """Test parsing a very long query."""
         long_query = "show me work sessions " + "word " * 100
         result = parser.parse(long_query)
-        assert result.entity_types == [EntityType.WORK_SESSION]
+        assert result.entity_types == (EntityType.WORK_SESSION,)
         # Search text should be cleaned but still present
         assert result.search_text is not None
         assert len(result.search_text) > 0
@@ -539,6 +579,11 @@ class TestQueryParserEdgeCases:
         assert result.entity_types is None
         assert result.search_text is None
 
+    def test_search_text_whitespace_runs_collapsed(self, parser: QueryParser):
+        """Test tabs, newlines and repeated spaces collapse to single spaces."""
+        result = parser.parse("  quarterly\t\tbudget \n  review  ")
+        assert result.search_text == "quarterly budget review"
+
     def test_entity_types_none_when_empty(self, parser: QueryParser):
         """Test that entity_types is None (not empty list) when no matches."""
         result = parser.parse("random query")
@@ -553,7 +598,7 @@ class TestQueryParserEdgeCases:
         """Test that entity patterns respect word boundaries."""
         # "workplace" should not match "work" pattern because patterns use \b word boundaries
         # "sessions" alone should match "work sessions?" pattern
-        result = parser._extract_entity_types("workplace sessions")
+        result = _entity_types(parser, "workplace sessions")
         # Pattern r"\b(work\s+sessions?|time\s+entries|hours?)\b" requires "work sessions"
         # So "workplace sessions" should match because "sessions" with \b at start/end
         # Actually the pattern is r"\b(work\s+sessions?..." which requires "work " before "sessions"
@@ -567,6 +612,12 @@ class TestQueryParserEdgeCases:
         assert result.start_date == date.today()
         assert result.end_date == date.today()
 
+    def test_extract_search_text_strips_only_leading_prefix(self, parser: QueryParser):
+        """Test prefixes are stripped only at the start and as whole words."""
+        assert parser._extract_search_text("how many widgets") == "widgets"
+        assert parser._extract_search_text("findings list") == "findings list"
+        assert parser._extract_search_text("search what changed") == "what changed"
+
     def test_extract_search_text_no_prefix(self, parser: QueryParser):
         """Test search text extraction when no prefix to remove."""
         result = parser._extract_search_text("just some text")
@@ -578,3 +629,245 @@ class TestQueryParserEdgeCases:
         start, end = parser._extract_date_range("today and yesterday")
         assert start == date.today()
         assert end == date.today()
+
+    def test_parse_mixed_case_query_without_lowercasing(self, parser: QueryParser):
+        """Test mixed-case input is matched after a single lowercase pass."""
+        result = parser.parse("Show Me PUBLIC Meetings from Yesterday")
+        assert result.entity_types == (EntityType.MEETING,)
+        assert result.privacy_levels == (PrivacyLevel.PUBLIC,)
+        assert result.start_date == date.today() - timedelta(days=1)
+
+    def test_extract_date_range_month_name_word_boundary(self, parser: QueryParser):
+        """Test month names only match as whole words."""
+        start, end = parser._extract_date_range("notes about the mayor")
+        assert start is None
+        assert end is None
+
+        start, end = parser._extract_date_range("notes from march")
+        year = date.today().year
+        assert start == date(year, 3, 1)
+        assert end == date(year, 3, 31)
+
+    def test_extract_search_text_removes_all_pattern_kinds(self, parser: QueryParser):
+        """Test the fused removal pass strips dates, months, entities, privacy and status."""
+        result = parser._extract_search_text(
+            "show me public active projects and paused meetings from last week in march budget"
+        )
+        assert result == "and budget"
+
+
+class TestTagExtraction:
+    """Test single-pass tagging of entity, privacy and status keywords."""
+
+    @pytest.fixture
+    def parser(self) -> QueryParser:
+        """Create a QueryParser instance."""
+        return QueryParser()
+
+    def test_active_sets_project_and_client_status(self, parser: QueryParser):
+        """Test a keyword shared by two status tables tags both."""
+        result = parser.parse("active clients")
+        assert result.project_status == "active"
+        assert result.client_status == "active"
+
+    def test_shared_active_source_compiled_once(self):
+        """Test "active" is one named group that tags both status tables."""
+        assert QueryParser._TAG_RE.pattern.count(r"\bactive\b") == 1
+        assert QueryParser._TAG_HITS["PST_CST_ACTIVE"] == (
+            ("PST", ProjectStatus.ACTIVE),
+            ("CST", ClientStatus.ACTIVE),
+        )
+
+    def test_status_keywords(self, parser: QueryParser):
+        """Test project and client status keywords are extracted."""
+        assert parser.parse("paused projects").project_status == "paused"
+        assert parser.parse("completed projects").project_status == "completed"
+        assert parser.parse("past clients").client_status == "past"
+        assert parser.parse("projects").project_status is None
+
+    def test_entity_types_follow_declaration_order(self, parser: QueryParser):
+        """Test entity types keep pattern table order, not query order."""
+        result = parser.parse("Reminders, notes, projects and hours")
+        assert result.entity_types == (
+            EntityType.WORK_SESSION,
+            EntityType.PROJECT,
+            EntityType.NOTE,
+            EntityType.REMINDER,
+        )
+
+    def test_search_text_is_lowercased(self, parser: QueryParser):
+        """Test search text comes back lowercase (matched with ILIKE downstream)."""
+        result = parser.parse("Find Notes about Budget Review")
+        assert result.entity_types == (EntityType.NOTE,)
+        assert result.search_text == "about budget review"
+
+
+class TestMonthNameRanges:
+    """Test month-name date range extraction."""
+
+    @patch("src.mosaic.services.query_parser.date")
+    def test_month_name_february_leap_year(self, mock_date):
+        """Test February ends on the 29th in a leap year."""
+        mock_date.today.return_value = date(2024, 6, 1)
+        mock_date.side_effect = lambda *args, **kwargs: date(*args, **kwargs)
+
+        start, end = QueryParser()._extract_date_range("notes from february")
+
+        assert start == date(2024, 2, 1)
+        assert end == date(2024, 2, 29)
+
+    @patch("src.mosaic.services.query_parser.date")
+    def test_month_name_first_mentioned_wins(self, mock_date):
+        """Test the first month in the query text is used."""
+        mock_date.today.return_value = date(2023, 6, 1)
+        mock_date.side_effect = lambda *args, **kwargs: date(*args, **kwargs)
+
+        start, end = QueryParser()._extract_date_range("december or april meetings")
+
+        assert start == date(2023, 12, 1)
+        assert end == date(2023, 12, 31)
+
+
+class TestKeywordFastPath:
+    """Test the fast path for queries without entity, status or date keywords."""
+
+    @pytest.fixture
+    def parser(self) -> QueryParser:
+        """Create a QueryParser instance."""
+        return QueryParser()
+
+    def test_plain_search_text_skips_extraction(self, parser: QueryParser):
+        """Test keyword-free queries skip tag and date extraction."""
+        with patch.object(QueryParser, "_extract_date_range") as mock_dates:
+            result = parser.parse("Find the quarterly budget review?")
+
+        mock_dates.assert_not_called()
+        assert result == ParsedQuery(search_text="quarterly budget review")
+
+    def test_keyword_query_uses_full_pipeline(self, parser: QueryParser):
+        """Test queries with keywords still run full extraction."""
+        result = parser.parse("budget notes from yesterday")
+        assert result.entity_types == (EntityType.NOTE,)
+        assert result.start_date == date.today() - timedelta(days=1)
+        assert result.search_text == "budget"
+
+    def test_filler_words_removed_as_whole_words(self, parser: QueryParser):
+        """Test filler words are dropped only when they are whole words."""
+        result = parser.parse("the island at the Martian outpost")
+        assert result.search_text == "island martian outpost"
+
+
+class TestParseCache:
+    """Test memoization of parse() results."""
+
+    def test_repeat_query_returns_cached_result(self):
+        """Test the same query on the same day is parsed once."""
+        parser = QueryParser()
+        with patch.object(QueryParser, "_parse", wraps=parser._parse) as mock_parse:
+            first = parser.parse("meetings from this week")
+            second = parser.parse("meetings from this week")
+
+        assert first is second
+        mock_parse.assert_called_once()
+
+    def test_module_parse_reuses_its_cached_result(self):
+        """Test the module-level parse() memoizes through one shared parser."""
+        assert parse("notes from today") is parse("notes from today")
+
+    def test_parsers_do_not_share_cached_results(self):
+        """Test a subclass with its own tables gets its own parse, not a cached default."""
+
+        class YesterdayParser(QueryParser):
+            DATE_PATTERNS = {
+                **QueryParser.DATE_PATTERNS,
+                re.compile(r"\btoday\b"): lambda t: (t - timedelta(days=1), t),
+            }
+
+        default = QueryParser().parse("notes from today")
+        custom = YesterdayParser().parse("notes from today")
+
+        assert default.start_date == date.today()
+        assert custom.start_date == date.today() - timedelta(days=1)
+
+    def test_subclass_tables_drive_matching(self):
+        """Test a subclass's entity and month tables are compiled into its regexes."""
+
+        class CustomParser(QueryParser):
+            ENTITY_PATTERNS = {
+                **QueryParser.ENTITY_PATTERNS,
+                EntityType.MEETING: re.compile(r"\b(meetings?|standups?)\b"),
+            }
+            MONTH_NAMES = {**QueryParser.MONTH_NAMES, "sept": 9}
+
+        result = CustomParser().parse("standups from sept")
+
+        assert result.entity_types == (EntityType.MEETING,)
+        assert result.start_date is not None
+        assert result.start_date.month == 9
+        assert result.search_text is None
+        assert QueryParser().parse("standups").entity_types is None
+
+    def test_parsed_query_is_frozen(self):
+        """Test cached results cannot be reassigned by callers."""
+        result = QueryParser().parse("projects")
+        with pytest.raises(FrozenInstanceError):
+            result.limit = 5  # type: ignore[misc]
+
+    def test_cached_filter_collections_are_immutable(self):
+        """Test cached entity types and privacy levels are tuples callers cannot mutate."""
+        result = QueryParser().parse("public meetings")
+
+        assert isinstance(result.entity_types, tuple)
+        assert isinstance(result.privacy_levels, tuple)
+        assert QueryParser().parse("public meetings").entity_types == (EntityType.MEETING,)
+
+    @patch("src.mosaic.services.query_parser.date")
+    def test_cache_rolls_over_with_the_day(self, mock_date):
+        """Test relative ranges are recomputed when the day changes."""
+        mock_date.fromordinal.side_effect = date.fromordinal
+        parser = QueryParser()
+
+        mock_date.today.return_value = date(2024, 5, 1)
+        first = parser.parse("notes from today")
+        mock_date.today.return_value = date(2024, 5, 2)
+        second = parser.parse("notes from today")
+
+        assert first.start_date == date(2024, 5, 1)
+        assert second.start_date == date(2024, 5, 2)
+
+    def test_extract_search_text_opt_out(self):
+        """Test search text extraction is skipped when the caller opts out."""
+        parser = QueryParser()
+        with patch.object(QueryParser, "_extract_search_text") as mock_extract:
+            filters_only = parser.parse("budget meetings from today", extract_search_text=False)
+            plain = parser.parse("quarterly budget", extract_search_text=False)
+
+        mock_extract.assert_not_called()
+        assert filters_only.entity_types == (EntityType.MEETING,)
+        assert filters_only.search_text is None
+        assert plain == ParsedQuery()
+        assert parser.parse("budget meetings from today").search_text == "budget"
+
+
+class TestCalendarRanges:
+    """Test per-day cached calendar range helpers."""
+
+    def test_week_ranges(self):
+        """Test this/last week ranges start on Monday."""
+        wednesday = date(2024, 3, 13)
+        assert _this_week_range(wednesday) == (date(2024, 3, 11), wednesday)
+        assert _last_week_range(wednesday) == (date(2024, 3, 4), date(2024, 3, 10))
+
+    def test_month_and_year_ranges(self):
+        """Test this month/year ranges end on the reference date."""
+        today = date(2024, 8, 20)
+        assert _this_month_range(today) == (date(2024, 8, 1), today)
+        assert _this_year_range(today) == (date(2024, 1, 1), today)
+
+    def test_ranges_cached_per_day(self):
+        """Test a repeated reference date is served from the cache."""
+        _last_week_range.cache_clear()
+        _last_week_range(date(2024, 3, 13))
+        _last_week_range(date(2024, 3, 13))
+        info = _last_week_range.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
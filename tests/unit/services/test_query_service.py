@@ -1,10 +1,12 @@
 """Unit tests for QueryService with privacy filtering."""
 
+from contextlib import asynccontextmanager
 from datetime import date, datetime, timezone
 from decimal import Decimal
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.mosaic.models.base import EntityType, PrivacyLevel
 from src.mosaic.models.client import Client, ClientStatus, ClientType
@@ -15,7 +17,8 @@ from src.mosaic.models.person import Person
 from src.mosaic.models.project import Project, ProjectStatus
 from src.mosaic.models.reminder import Reminder
 from src.mosaic.models.work_session import WorkSession
-from src.mosaic.services.query_service import QueryService
+from src.mosaic.schemas.query_structured import AggregationSpec, FilterOperator, FilterSpec
+from src.mosaic.services.query_service import QueryService, _flexible_statement
 
 
 class TestFlexibleQuery:
@@ -93,6 +96,96 @@ class TestFlexibleQuery:
         assert len(results["meetings"]) == 0
         assert len(results["people"]) == 0
 
+    @pytest.mark.asyncio
+    async def test_concurrent_sub_queries_match_sequential(
+        self,
+        session: AsyncSession,
+        test_session_factory: async_sessionmaker[AsyncSession],
+        project: Project,
+        person: Person,
+    ):
+        """Test session_factory runs sub-queries concurrently with identical results."""
+        session.add(
+            WorkSession(
+                project_id=project.id,
+                date=date(2024, 1, 15),
+                duration_hours=Decimal("1.0"),
+                summary="Work",
+                privacy_level=PrivacyLevel.PUBLIC,
+            )
+        )
+        await session.commit()
+
+        sequential = await QueryService(session).flexible_query()
+        concurrent = await QueryService(session, test_session_factory).flexible_query()
+
+        assert concurrent.keys() == sequential.keys()
+        for key, rows in sequential.items():
+            assert [row.id for row in concurrent[key]] == [row.id for row in rows]
+        assert len(concurrent["work_sessions"]) == 1
+        assert len(concurrent["people"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sub_queries_bounded(
+        self,
+        session: AsyncSession,
+        test_session_factory: async_sessionmaker[AsyncSession],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test one flexible_query never holds more than the allowed sessions."""
+        monkeypatch.setattr(QueryService, "MAX_CONCURRENT_SUBQUERIES", 2)
+        open_sessions = 0
+        peak = 0
+
+        @asynccontextmanager
+        async def counting_factory():
+            nonlocal open_sessions, peak
+            open_sessions += 1
+            peak = max(peak, open_sessions)
+            try:
+                async with test_session_factory() as sub_session:
+                    yield sub_session
+            finally:
+                open_sessions -= 1
+
+        service = QueryService(session, counting_factory)  # type: ignore[arg-type]
+        results = await service.flexible_query()
+
+        assert peak == 2
+        assert all(rows == [] for rows in results.values())
+
+    @pytest.mark.parametrize(
+        "entity_types,filled",
+        [([], set()), ([EntityType.NOTE], {"notes"}), ([EntityType.BOOKMARK], set())],
+    )
+    @pytest.mark.asyncio
+    async def test_zero_or_one_sub_query_uses_callers_session(
+        self,
+        session: AsyncSession,
+        project: Project,
+        entity_types: list[EntityType],
+        filled: set[str],
+    ):
+        """Test a lone (or no) sub-query never opens extra sessions."""
+        session.add(
+            Note(
+                entity_type=EntityType.PROJECT,
+                entity_id=project.id,
+                text="Only note",
+                privacy_level=PrivacyLevel.PUBLIC,
+            )
+        )
+        await session.commit()
+
+        def no_sessions():
+            raise AssertionError("session factory should not be used")
+
+        service = QueryService(session, no_sessions)  # type: ignore[arg-type]
+        results = await service.flexible_query(entity_types=entity_types)
+
+        assert {key for key, rows in results.items() if rows} == filled
+        assert len(results) == 9
+
     @pytest.mark.asyncio
     async def test_query_with_date_range(self, session: AsyncSession, project: Project):
         """Test querying with start_date and end_date filters."""
@@ -197,6 +290,36 @@ class TestPrivacyFiltering:
 
         assert len(results["work_sessions"]) == 2
 
+    @pytest.mark.asyncio
+    async def test_privacy_levels_bound_as_one_array(self, session: AsyncSession, project: Project):
+        """Test privacy level lists of any length bind as one array parameter."""
+        session.add_all(
+            [
+                WorkSession(
+                    project_id=project.id,
+                    date=date(2024, 1, 15),
+                    duration_hours=Decimal("1.0"),
+                    summary=level.value,
+                    privacy_level=level,
+                )
+                for level in PrivacyLevel
+            ]
+        )
+        await session.commit()
+
+        statement = _flexible_statement(EntityType.WORK_SESSION, frozenset({"privacy_levels"}))
+        assert "ANY" in str(statement.compile(dialect=postgresql.dialect()))
+
+        service = QueryService(session)
+        outcomes = {}
+        for levels in ([], [PrivacyLevel.PUBLIC], [PrivacyLevel.PUBLIC, PrivacyLevel.INTERNAL]):
+            results = await service.flexible_query(
+                entity_types=[EntityType.WORK_SESSION], privacy_levels=levels
+            )
+            outcomes[len(levels)] = sorted(ws.summary for ws in results["work_sessions"])
+
+        assert outcomes == {0: [], 1: ["public"], 2: ["internal", "public"]}
+
     @pytest.mark.asyncio
     async def test_include_private_false_excludes_private(
         self, session: AsyncSession, project: Project
@@ -540,6 +663,25 @@ class TestTextSearch:
         assert len(results["notes"]) == 1
         assert "database optimization" in results["notes"][0].text
 
+    @pytest.mark.asyncio
+    async def test_text_search_matches_stemmed_words(self, session: AsyncSession):
+        """Test full-text search matches word stems, not raw substrings."""
+        session.add_all(
+            [
+                Note(text="Optimized the reporting queries", privacy_level=PrivacyLevel.PUBLIC),
+                Note(text="Reportage draft", privacy_level=PrivacyLevel.PUBLIC),
+            ]
+        )
+        await session.commit()
+
+        service = QueryService(session)
+        results = await service.flexible_query(
+            entity_types=[EntityType.NOTE],
+            search_text="optimizing reports",
+        )
+
+        assert [n.text for n in results["notes"]] == ["Optimized the reporting queries"]
+
     @pytest.mark.asyncio
     async def test_text_search_people(self, session: AsyncSession):
         """Test text search on people by name and email (line 351)."""
@@ -559,6 +701,40 @@ class TestTextSearch:
         # Should find Alice Johnson (name) and charlie@johnson.com (email)
         assert len(results["people"]) == 2
 
+    @pytest.mark.asyncio
+    async def test_text_search_people_case_and_field_boundary(self, session: AsyncSession):
+        """Test people search ignores case and never matches across name and email."""
+        session.add(Person(full_name="Dana Scully", email="dana@fbi.gov"))
+        await session.commit()
+
+        service = QueryService(session)
+
+        upper = await service.flexible_query(entity_types=[EntityType.PERSON], search_text="FBI")
+        spanning = await service.flexible_query(
+            entity_types=[EntityType.PERSON], search_text="scully dana"
+        )
+
+        assert [p.full_name for p in upper["people"]] == ["Dana Scully"]
+        assert spanning["people"] == []
+
+    @pytest.mark.asyncio
+    async def test_text_search_people_wildcards_literal(self, session: AsyncSession):
+        """Test % and _ in people search text match literally."""
+        session.add_all(
+            [
+                Person(full_name="Ann Lee", email="ann_lee@example.com"),
+                Person(full_name="Ann Leeds", email="annxlee@example.com"),
+            ]
+        )
+        await session.commit()
+
+        service = QueryService(session)
+        results = await service.flexible_query(
+            entity_types=[EntityType.PERSON], search_text="ann_lee"
+        )
+
+        assert [p.full_name for p in results["people"]] == ["Ann Lee"]
+
     @pytest.mark.asyncio
     async def test_text_search_clients(self, session: AsyncSession):
         """Test text search on clients by name and notes (line 375)."""
@@ -721,6 +897,59 @@ class TestRelationshipFilters:
         assert len(results["work_sessions"]) == 1
         assert results["work_sessions"][0].summary == "Work for Employer A"
 
+    @pytest.mark.asyncio
+    async def test_filter_work_sessions_by_employer_with_limit(
+        self,
+        session: AsyncSession,
+        client: Client,
+    ):
+        """Test employer filter with limit returns the newest matching sessions."""
+        employer1 = Employer(name="Employer A", is_current=True)
+        employer2 = Employer(name="Employer B", is_current=False)
+        session.add_all([employer1, employer2])
+        await session.flush()
+
+        project1 = Project(
+            name="Project A",
+            on_behalf_of_id=employer1.id,
+            client_id=client.id,
+            status=ProjectStatus.ACTIVE,
+        )
+        project2 = Project(
+            name="Project B",
+            on_behalf_of_id=employer2.id,
+            client_id=client.id,
+            status=ProjectStatus.ACTIVE,
+        )
+        session.add_all([project1, project2])
+        await session.flush()
+
+        # Employer B owns the newest sessions, so limiting before the join would miss A's
+        session.add_all(
+            [
+                WorkSession(
+                    project_id=project.id,
+                    date=date(2024, 1, day),
+                    duration_hours=Decimal("1.0"),
+                    summary=f"{project.name} day {day}",
+                    privacy_level=PrivacyLevel.PUBLIC,
+                )
+                for project, days in ((project1, (10, 11, 12)), (project2, (20, 21)))
+                for day in days
+            ]
+        )
+        await session.commit()
+
+        service = QueryService(session)
+        results = await service.flexible_query(
+            entity_types=[EntityType.WORK_SESSION],
+            employer_id=employer1.id,
+            start_date=date(2024, 1, 11),
+            limit=1,
+        )
+
+        assert [ws.summary for ws in results["work_sessions"]] == ["Project A day 12"]
+
     @pytest.mark.asyncio
     async def test_filter_meetings_by_person(self, session: AsyncSession, person: Person):
         """Test filtering meetings by person_id (attendee)."""
@@ -759,6 +988,41 @@ class TestRelationshipFilters:
         assert len(results["meetings"]) == 1
         assert results["meetings"][0].summary == "Meeting 1"
 
+    @pytest.mark.asyncio
+    async def test_filter_meetings_by_person_keeps_all_attendees(
+        self, session: AsyncSession, person: Person
+    ):
+        """Test the person filter does not trim the loaded attendee list."""
+        person2 = Person(full_name="Jane Smith", email="jane@example.com")
+        meeting = Meeting(
+            title="Sync",
+            start_time=datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc),
+            duration_minutes=30,
+            privacy_level=PrivacyLevel.PUBLIC,
+        )
+        session.add_all([person2, meeting])
+        await session.flush()
+        session.add_all(
+            [
+                MeetingAttendee(meeting_id=meeting.id, person_id=person.id),
+                MeetingAttendee(meeting_id=meeting.id, person_id=person2.id),
+            ]
+        )
+        await session.commit()
+        session.expunge_all()
+
+        service = QueryService(session)
+        results = await service.flexible_query(
+            entity_types=[EntityType.MEETING],
+            person_id=person.id,
+        )
+
+        assert len(results["meetings"]) == 1
+        assert {a.person_id for a in results["meetings"][0].attendees} == {
+            person.id,
+            person2.id,
+        }
+
     @pytest.mark.asyncio
     async def test_filter_projects_by_client(
         self,
@@ -1094,6 +1358,59 @@ class TestEntitySpecificQueries:
 
         assert len(notes) == 2
 
+    @pytest.mark.asyncio
+    async def test_query_note_ids_by_entity(self, session: AsyncSession, project: Project):
+        """Test note ID queries apply the same filters and return only IDs."""
+        public = Note(
+            entity_type=EntityType.PROJECT,
+            entity_id=project.id,
+            text="Public",
+            privacy_level=PrivacyLevel.PUBLIC,
+        )
+        private = Note(
+            entity_type=EntityType.PROJECT,
+            entity_id=project.id,
+            text="Private",
+            privacy_level=PrivacyLevel.PRIVATE,
+        )
+        session.add_all([public, private])
+        await session.commit()
+
+        service = QueryService(session)
+        all_ids = await service.query_note_ids_by_entity(EntityType.PROJECT, project.id)
+        public_ids = await service.query_note_ids_by_entity(
+            EntityType.PROJECT, project.id, include_private=False
+        )
+
+        assert sorted(all_ids) == sorted([public.id, private.id])
+        assert public_ids == [public.id]
+
+    @pytest.mark.asyncio
+    async def test_query_reminder_ids_by_entity(self, session: AsyncSession, project: Project):
+        """Test reminder ID queries keep order and the completed filter."""
+        reminders = [
+            Reminder(
+                reminder_time=datetime(2024, 1, 15, hour, 0, tzinfo=timezone.utc),
+                message=f"At {hour}",
+                is_completed=hour == 9,
+                related_entity_type=EntityType.PROJECT,
+                related_entity_id=project.id,
+            )
+            for hour in (11, 9, 10)
+        ]
+        session.add_all(reminders)
+        await session.commit()
+        later, completed, earlier = reminders
+
+        service = QueryService(session)
+        open_ids = await service.query_reminder_ids_by_entity(EntityType.PROJECT, project.id)
+        first_two = await service.query_reminder_ids_by_entity(
+            EntityType.PROJECT, project.id, include_completed=True, limit=2
+        )
+
+        assert open_ids == [earlier.id, later.id]
+        assert first_two == [completed.id, earlier.id]
+
     @pytest.mark.asyncio
     async def test_query_notes_by_entity_exclude_private(
         self, session: AsyncSession, project: Project
@@ -1445,3 +1762,192 @@ class TestReminderEntityIncludeCompleted:
         # Should include both completed and non-completed
         assert len(reminders) == 2
         assert {r.message for r in reminders} == {"Reminder 1", "Reminder 2"}
+
+
+class TestStatementCache:
+    """Test flexible_query reuses one statement per filter shape."""
+
+    def test_same_shape_reuses_statement(self):
+        """Test a repeated filter shape returns the identical Select."""
+        shape = frozenset({"search_text", "limit"})
+
+        first = _flexible_statement(EntityType.NOTE, shape)
+        second = _flexible_statement(EntityType.NOTE, frozenset({"limit", "search_text"}))
+
+        assert first is second
+        assert first is not _flexible_statement(EntityType.NOTE, frozenset({"limit"}))
+
+    def test_filter_values_are_bound_not_inlined(self):
+        """Test filter values become bind parameters of the cached statement."""
+        statement = _flexible_statement(
+            EntityType.WORK_SESSION, frozenset({"project_id", "start_date", "limit"})
+        )
+
+        compiled = statement.compile()
+
+        assert {"project_id", "start_date", "limit"} <= set(compiled.params)
+
+    @pytest.mark.asyncio
+    async def test_repeated_shape_binds_new_values(self, session: AsyncSession, project: Project):
+        """Test two calls sharing a shape each see their own filter values."""
+        session.add_all(
+            [
+                WorkSession(
+                    project_id=project.id,
+                    date=date(2024, 1, day),
+                    duration_hours=Decimal("1.0"),
+                    summary=f"Day {day}",
+                    privacy_level=PrivacyLevel.PUBLIC,
+                )
+                for day in (10, 20)
+            ]
+        )
+        await session.commit()
+
+        service = QueryService(session)
+        early = await service.flexible_query(
+            entity_types=[EntityType.WORK_SESSION], end_date=date(2024, 1, 15)
+        )
+        late = await service.flexible_query(
+            entity_types=[EntityType.WORK_SESSION], end_date=date(2024, 1, 25)
+        )
+
+        assert [ws.summary for ws in early["work_sessions"]] == ["Day 10"]
+        assert len(late["work_sessions"]) == 2
+
+
+class TestResultStreaming:
+    """Test flexible_query streams rows in chunks."""
+
+    @pytest.mark.asyncio
+    async def test_results_span_multiple_chunks(
+        self, session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test results larger than one chunk come back complete and ordered."""
+        monkeypatch.setattr(QueryService, "STREAM_CHUNK_SIZE", 2)
+        session.add_all(
+            [
+                Meeting(
+                    title=f"Meeting {hour}",
+                    start_time=datetime(2024, 1, 15, hour, 0, tzinfo=timezone.utc),
+                    duration_minutes=30,
+                    privacy_level=PrivacyLevel.PUBLIC,
+                )
+                for hour in range(9, 14)
+            ]
+        )
+        await session.commit()
+
+        service = QueryService(session)
+        results = await service.flexible_query(entity_types=[EntityType.MEETING])
+
+        assert [m.title for m in results["meetings"]] == [
+            f"Meeting {hour}" for hour in range(13, 8, -1)
+        ]
+        # Eager-loaded collections survive chunked loading
+        assert all(m.attendees == [] for m in results["meetings"])
+
+
+class TestStructuredQueryTotals:
+    """Test structured_query reports total matches, not page size."""
+
+    @pytest.fixture
+    async def five_sessions(self, session: AsyncSession, project: Project) -> None:
+        """Create five work sessions on consecutive days."""
+        session.add_all(
+            [
+                WorkSession(
+                    project_id=project.id,
+                    date=date(2024, 1, day),
+                    duration_hours=Decimal("1.0"),
+                    summary=f"Day {day}",
+                    privacy_level=PrivacyLevel.PUBLIC,
+                )
+                for day in range(10, 15)
+            ]
+        )
+        await session.commit()
+
+    @pytest.mark.asyncio
+    async def test_total_count_ignores_pagination(self, session: AsyncSession, five_sessions):
+        """Test total_count counts every match while results hold one page."""
+        service = QueryService(session)
+        output = await service.structured_query(
+            entity_type=EntityType.WORK_SESSION, filters=[], limit=2, offset=1
+        )
+
+        assert len(output["results"]) == 2
+        assert output["total_count"] == 5
+
+    @pytest.mark.asyncio
+    async def test_total_count_with_filter(self, session: AsyncSession, five_sessions):
+        """Test total_count applies the filters."""
+        service = QueryService(session)
+        output = await service.structured_query(
+            entity_type=EntityType.WORK_SESSION,
+            filters=[FilterSpec(field="date", operator=FilterOperator.GTE, value="2024-01-12")],
+            limit=1,
+        )
+
+        assert len(output["results"]) == 1
+        assert output["total_count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_total_count_past_last_page(self, session: AsyncSession, five_sessions):
+        """Test an empty page past the end still reports the total."""
+        service = QueryService(session)
+        output = await service.structured_query(
+            entity_type=EntityType.WORK_SESSION, filters=[], limit=2, offset=10
+        )
+
+        assert output["results"] == []
+        assert output["total_count"] == 5
+
+    @pytest.mark.asyncio
+    async def test_total_count_past_last_page_with_join(
+        self, session: AsyncSession, project: Project, five_sessions
+    ):
+        """Test the past-the-end count keeps relationship joins and their filters."""
+        service = QueryService(session)
+        output = await service.structured_query(
+            entity_type=EntityType.WORK_SESSION,
+            filters=[
+                FilterSpec(field="project.name", operator=FilterOperator.EQ, value=project.name),
+                FilterSpec(field="date", operator=FilterOperator.GTE, value="2024-01-12"),
+            ],
+            limit=2,
+            offset=10,
+        )
+
+        assert output["results"] == []
+        assert output["total_count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_total_count_no_matches(self, session: AsyncSession):
+        """Test a query with no matches reports zero."""
+        service = QueryService(session)
+        output = await service.structured_query(entity_type=EntityType.WORK_SESSION, filters=[])
+
+        assert output["results"] == []
+        assert output["total_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_enum_values_from_tool_input(self, session: AsyncSession, five_sessions):
+        """Test plain-string enum values (as tool inputs carry them) are accepted."""
+        service = QueryService(session)
+        aggregation = AggregationSpec(function="count", field="id")
+        assert isinstance(aggregation.function, str)
+
+        listing = await service.structured_query(
+            entity_type="work_session", filters=[], limit=1  # type: ignore[arg-type]
+        )
+        counted = await service.structured_query(
+            entity_type="work_session",  # type: ignore[arg-type]
+            filters=[],
+            aggregation=aggregation,
+        )
+
+        assert listing["entity_type"] == "work_session"
+        assert listing["total_count"] == 5
+        assert counted["entity_type"] == "work_session"
+        assert counted["aggregation"] == {"function": "count", "field": "id", "result": 5}
@@ -1,11 +1,13 @@
 """Unit tests for ReminderService with recurrence logic."""
 
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 import pytest
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.mosaic.services.reminder_service import ReminderService
+from src.mosaic.services.reminder_service import ReminderService, _max_day
 
 
 class TestReminderCreation:
@@ -175,6 +177,98 @@ class TestRecurrenceValidation:
             )
 
 
+class TestRecurringSeries:
+    """Test materializing a recurring reminder series in one insert."""
+
+    @pytest.mark.asyncio
+    async def test_create_daily_series_in_one_statement(self, session: AsyncSession):
+        """Test a daily series is inserted by a single statement up to the horizon."""
+        service = ReminderService(session)
+        start = datetime(2024, 1, 15, 9, 0, 0, tzinfo=timezone.utc)
+        config = {"frequency": "daily"}
+
+        with patch.object(session, "execute", wraps=session.execute) as execute:
+            series = await service.create_recurring_series(
+                reminder_time=start,
+                until=start + timedelta(days=4, hours=1),
+                message="Standup",
+                recurrence_config=config,
+                tags=["team"],
+            )
+
+        execute.assert_awaited_once()
+        # Rows must come back in parameter order for the last-row recurrence below
+        assert execute.await_args.args[0]._sort_by_parameter_order is True
+        assert [r.reminder_time for r in series] == [start + timedelta(days=i) for i in range(5)]
+        assert all(r.id is not None and r.message == "Standup" for r in series)
+        assert all(r.tags == ["team"] and r.is_completed is False for r in series)
+        # Only the last occurrence carries the rule forward
+        assert [r.recurrence_config for r in series] == [None] * 4 + [config]
+
+    @pytest.mark.asyncio
+    async def test_create_monthly_series_clamps_short_months(self, session: AsyncSession):
+        """Test monthly series follow the same month-end clamping as completion."""
+        service = ReminderService(session)
+        start = datetime(2024, 1, 31, 9, 0, 0, tzinfo=timezone.utc)
+
+        series = await service.create_recurring_series(
+            reminder_time=start,
+            until=datetime(2024, 4, 30, 9, 0, 0, tzinfo=timezone.utc),
+            message="Month end",
+            recurrence_config={"frequency": "monthly", "day_of_month": 31},
+        )
+
+        assert [(r.reminder_time.month, r.reminder_time.day) for r in series] == [
+            (1, 31),
+            (2, 29),
+            (3, 31),
+            (4, 30),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_completing_last_occurrence_continues_series(self, session: AsyncSession):
+        """Test completing the final materialized occurrence schedules the next one."""
+        service = ReminderService(session)
+        start = datetime(2024, 1, 15, 9, 0, 0, tzinfo=timezone.utc)
+
+        series = await service.create_recurring_series(
+            reminder_time=start,
+            until=start + timedelta(weeks=2),
+            message="Weekly review",
+            recurrence_config={"frequency": "weekly", "day_of_week": 0},
+        )
+        await session.commit()
+
+        assert await service.complete_reminder(series[0].id) is None
+        next_reminder = await service.complete_reminder(series[-1].id)
+        await session.commit()
+
+        assert next_reminder is not None
+        assert next_reminder.reminder_time == start + timedelta(weeks=3)
+
+    @pytest.mark.asyncio
+    async def test_create_series_rejects_bad_horizons(self, session: AsyncSession):
+        """Test horizons before the start or beyond the size cap raise errors."""
+        service = ReminderService(session)
+        start = datetime(2024, 1, 15, 9, 0, 0, tzinfo=timezone.utc)
+
+        with pytest.raises(ValueError, match="until must not be before reminder_time"):
+            await service.create_recurring_series(
+                reminder_time=start,
+                until=start - timedelta(days=1),
+                message="Backwards",
+                recurrence_config={"frequency": "daily"},
+            )
+
+        with pytest.raises(ValueError, match="more than 1000 reminders"):
+            await service.create_recurring_series(
+                reminder_time=start,
+                until=start + timedelta(days=1000),
+                message="Too long",
+                recurrence_config={"frequency": "daily"},
+            )
+
+
 class TestReminderCompletion:
     """Test completing reminders and generating next occurrences."""
 
@@ -282,6 +376,27 @@ class TestReminderCompletion:
 
         assert reminder.snoozed_until is None
 
+    @pytest.mark.asyncio
+    async def test_complete_recurring_reminder_flushes_once(self, session: AsyncSession):
+        """Test completion and next occurrence are written in a single flush."""
+        service = ReminderService(session)
+        reminder_time = datetime(2024, 1, 15, 9, 0, 0, tzinfo=timezone.utc)
+
+        reminder = await service.create_reminder(
+            reminder_time=reminder_time,
+            message="Daily reminder",
+            recurrence_config={"frequency": "daily"},
+        )
+        await session.commit()
+
+        with patch.object(session, "flush", wraps=session.flush) as flush:
+            next_reminder = await service.complete_reminder(reminder.id)
+
+        assert flush.await_count == 1
+        assert next_reminder is not None
+        assert next_reminder.id is not None
+        await session.commit()
+
 
 class TestReminderSnoozing:
     """Test snoozing reminders."""
@@ -301,6 +416,22 @@ class TestReminderSnoozing:
 
         assert updated.snoozed_until == snooze_until
 
+    @pytest.mark.asyncio
+    async def test_snooze_reminder_returns_timestamps_without_refresh(self, session: AsyncSession):
+        """Test the snooze UPDATE returns updated_at so no refresh query is needed."""
+        service = ReminderService(session)
+        reminder_time = datetime(2024, 1, 15, 9, 0, 0, tzinfo=timezone.utc)
+
+        reminder = await service.create_reminder(reminder_time=reminder_time, message="Test")
+        await session.commit()
+
+        with patch.object(session, "refresh", wraps=session.refresh) as refresh:
+            updated = await service.snooze_reminder(reminder.id, reminder_time + timedelta(hours=1))
+
+        refresh.assert_not_called()
+        assert "updated_at" not in inspect(updated).unloaded
+        assert updated.updated_at >= updated.created_at
+
     @pytest.mark.asyncio
     async def test_snooze_reminder_past_time_raises_error(self, session: AsyncSession):
         """Test snoozing to past time raises error."""
@@ -440,6 +571,67 @@ class TestRecurrenceCalculation:
         assert next_reminder.reminder_time.month == 1
         assert next_reminder.reminder_time.day == 15
 
+    def test_next_n_occurrences_daily_and_weekly(self, session: AsyncSession):
+        """Test daily and weekly occurrences stride by their period."""
+        service = ReminderService(session)
+        start = datetime(2024, 1, 15, 9, 0, 0, tzinfo=timezone.utc)
+
+        daily = service.next_n_occurrences(start, {"frequency": "daily"}, 3)
+        weekly = service.next_n_occurrences(start, {"frequency": "weekly", "day_of_week": 0}, 2)
+
+        assert daily == [start + timedelta(days=i) for i in (1, 2, 3)]
+        assert weekly == [start + timedelta(weeks=i) for i in (1, 2)]
+
+    def test_next_n_occurrences_monthly_clamps_each_month(self, session: AsyncSession):
+        """Test monthly occurrences clamp to short months and roll over the year."""
+        service = ReminderService(session)
+        start = datetime(2024, 11, 30, 9, 0, 0, tzinfo=timezone.utc)
+        config = {"frequency": "monthly", "day_of_month": 31}
+
+        occurrences = service.next_n_occurrences(start, config, 4)
+
+        assert [(o.year, o.month, o.day) for o in occurrences] == [
+            (2024, 12, 31),
+            (2025, 1, 31),
+            (2025, 2, 28),
+            (2025, 3, 31),
+        ]
+        assert all(o.hour == 9 and o.tzinfo == timezone.utc for o in occurrences)
+
+    def test_next_n_occurrences_matches_chained_next_occurrence(self, session: AsyncSession):
+        """Test striding gives the same times as repeated single-step calculation."""
+        service = ReminderService(session)
+        start = datetime(2024, 1, 31, 9, 0, 0, tzinfo=timezone.utc)
+        config = {"frequency": "monthly", "day_of_month": 31}
+
+        chained = []
+        current = start
+        for _ in range(13):
+            current = service._calculate_next_occurrence(current, config)
+            chained.append(current)
+
+        assert service.next_n_occurrences(start, config, 13) == chained
+
+    def test_next_n_occurrences_edge_cases(self, session: AsyncSession):
+        """Test zero count, unknown frequency, and negative count."""
+        service = ReminderService(session)
+        start = datetime(2024, 1, 15, 9, 0, 0, tzinfo=timezone.utc)
+
+        assert service.next_n_occurrences(start, {"frequency": "daily"}, 0) == []
+        assert service.next_n_occurrences(start, {"frequency": "yearly"}, 3) == []
+        with pytest.raises(ValueError, match="n must be non-negative"):
+            service.next_n_occurrences(start, {"frequency": "daily"}, -1)
+
+    def test_max_day_is_memoized(self):
+        """Test month lengths are cached and respect leap years."""
+        _max_day.cache_clear()
+
+        assert _max_day(2023, 2) == 28
+        assert _max_day(2024, 2) == 29
+        assert _max_day(2024, 2) == 29
+
+        assert _max_day.cache_info().hits == 1
+
 
 class TestNotificationSpamPrevention:
     """Test notification spam prevention with cooldown and auto-complete."""
@@ -524,6 +716,62 @@ class TestNotificationSpamPrevention:
         with pytest.raises(ValueError, match="Reminder with ID 999 not found"):
             await service.mark_notified(999)
 
+    @pytest.mark.asyncio
+    async def test_mark_notified_many_updates_batch(self, session: AsyncSession):
+        """Test mark_notified_many stamps every reminder and completes only one-time ones."""
+        service = ReminderService(session)
+        reminder_time = datetime.now(timezone.utc) - timedelta(hours=1)
+
+        one_time = await service.create_reminder(reminder_time=reminder_time, message="One-time")
+        recurring = await service.create_reminder(
+            reminder_time=reminder_time,
+            message="Daily standup",
+            recurrence_config={"frequency": "daily"},
+        )
+        untouched = await service.create_reminder(reminder_time=reminder_time, message="Other")
+        await session.commit()
+
+        notified_at = datetime.now(timezone.utc)
+        await service.mark_notified_many([one_time.id, recurring.id], notified_at)
+        await session.commit()
+
+        for reminder in (one_time, recurring, untouched):
+            await session.refresh(reminder)
+
+        assert one_time.last_notified_at == notified_at
+        assert one_time.is_completed is True
+        assert recurring.last_notified_at == notified_at
+        assert recurring.is_completed is False
+        assert untouched.last_notified_at is None
+        assert untouched.is_completed is False
+
+    @pytest.mark.asyncio
+    async def test_mark_notified_many_issues_one_unsynchronized_update(self, session: AsyncSession):
+        """Test the batch is a single id = ANY(array) UPDATE without session sync."""
+        service = ReminderService(session)
+        reminder_time = datetime.now(timezone.utc) - timedelta(hours=1)
+        first = await service.create_reminder(reminder_time=reminder_time, message="First")
+        second = await service.create_reminder(reminder_time=reminder_time, message="Second")
+        await session.commit()
+
+        with patch.object(session, "execute", wraps=session.execute) as execute:
+            await service.mark_notified_many([first.id, second.id])
+
+        execute.assert_awaited_once()
+        statement = execute.call_args.args[0]
+        assert "= ANY (" in str(statement)
+        assert statement.get_execution_options()["synchronize_session"] is False
+
+    @pytest.mark.asyncio
+    async def test_mark_notified_many_empty_is_noop(self, session: AsyncSession):
+        """Test mark_notified_many issues no statement for an empty batch."""
+        service = ReminderService(session)
+
+        with patch.object(session, "execute", wraps=session.execute) as execute:
+            await service.mark_notified_many([])
+
+        execute.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_check_due_reminders_excludes_recently_notified(self, session: AsyncSession):
         """Test check_due_reminders excludes reminders notified within cooldown period."""
@@ -1,9 +1,11 @@
 """Unit tests for SchedulerService with APScheduler."""
 
-from datetime import datetime, timezone
+import asyncio
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from apscheduler import CoalescePolicy
 
 from src.mosaic.services.scheduler_service import SchedulerService
 
@@ -107,6 +109,9 @@ class TestSchedulerLifecycle:
             # Check trigger is IntervalTrigger with 1 minute
             trigger = call_args[1]["trigger"]
             assert trigger.minutes == 1
+            # Missed ticks collapse into one late run instead of a burst
+            assert call_args[1]["coalesce"] == CoalescePolicy.latest
+            assert call_args[1]["misfire_grace_time"] == timedelta(seconds=30)
 
 
 class TestReminderCheckJob:
@@ -130,13 +135,13 @@ class TestReminderCheckJob:
             mock_reminder.related_entity_type = "project"
             mock_reminder.related_entity_id = 456
 
-            with patch("src.mosaic.services.scheduler_service.get_session") as mock_get_session:
+            with patch.object(service, "_session_factory") as mock_session_factory:
                 with patch(
                     "src.mosaic.services.scheduler_service.ReminderService"
                 ) as mock_reminder_service_class:
                     # Mock session
-                    mock_session = AsyncMock()
-                    mock_get_session.return_value.__aenter__.return_value = mock_session
+                    mock_session = MagicMock()
+                    mock_session_factory.return_value.__aenter__.return_value = mock_session
 
                     # Mock ReminderService
                     mock_reminder_service = AsyncMock()
@@ -170,13 +175,13 @@ class TestReminderCheckJob:
         ):
             service = SchedulerService()
 
-            with patch("src.mosaic.services.scheduler_service.get_session") as mock_get_session:
+            with patch.object(service, "_session_factory") as mock_session_factory:
                 with patch(
                     "src.mosaic.services.scheduler_service.ReminderService"
                 ) as mock_reminder_service_class:
                     # Mock session
-                    mock_session = AsyncMock()
-                    mock_get_session.return_value.__aenter__.return_value = mock_session
+                    mock_session = MagicMock()
+                    mock_session_factory.return_value.__aenter__.return_value = mock_session
 
                     # Mock ReminderService - no reminders
                     mock_reminder_service = AsyncMock()
@@ -209,13 +214,13 @@ class TestReminderCheckJob:
             mock_reminder.related_entity_type = None
             mock_reminder.related_entity_id = None
 
-            with patch("src.mosaic.services.scheduler_service.get_session") as mock_get_session:
+            with patch.object(service, "_session_factory") as mock_session_factory:
                 with patch(
                     "src.mosaic.services.scheduler_service.ReminderService"
                 ) as mock_reminder_service_class:
                     # Mock session
-                    mock_session = AsyncMock()
-                    mock_get_session.return_value.__aenter__.return_value = mock_session
+                    mock_session = MagicMock()
+                    mock_session_factory.return_value.__aenter__.return_value = mock_session
 
                     # Mock ReminderService
                     mock_reminder_service = AsyncMock()
@@ -240,9 +245,11 @@ class TestReminderCheckJob:
         ):
             service = SchedulerService()
 
-            with patch("src.mosaic.services.scheduler_service.get_session") as mock_get_session:
+            with patch.object(service, "_session_factory") as mock_session_factory:
                 # Mock session raises exception
-                mock_get_session.return_value.__aenter__.side_effect = Exception("Database error")
+                mock_session_factory.return_value.__aenter__.side_effect = Exception(
+                    "Database error"
+                )
 
                 # Should not raise exception
                 await service._check_and_notify_reminders()
@@ -272,13 +279,13 @@ class TestReminderCheckJob:
             mock_reminder2.related_entity_type = None
             mock_reminder2.related_entity_id = None
 
-            with patch("src.mosaic.services.scheduler_service.get_session") as mock_get_session:
+            with patch.object(service, "_session_factory") as mock_session_factory:
                 with patch(
                     "src.mosaic.services.scheduler_service.ReminderService"
                 ) as mock_reminder_service_class:
                     # Mock session
-                    mock_session = AsyncMock()
-                    mock_get_session.return_value.__aenter__.return_value = mock_session
+                    mock_session = MagicMock()
+                    mock_session_factory.return_value.__aenter__.return_value = mock_session
 
                     # Mock ReminderService
                     mock_reminder_service = AsyncMock()
@@ -296,6 +303,118 @@ class TestReminderCheckJob:
                     # Verify notifications sent for both
                     assert service.notification_service.trigger_notification.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_check_and_notify_reminders_sends_concurrently(self):
+        """Test notifications for due reminders are in flight at the same time."""
+        mock_scheduler = AsyncMock()
+        with patch(
+            "src.mosaic.services.scheduler_service.AsyncScheduler", return_value=mock_scheduler
+        ):
+            service = SchedulerService()
+
+            reminders = []
+            for reminder_id in (1, 2, 3):
+                reminder = MagicMock()
+                reminder.id = reminder_id
+                reminder.reminder_time = datetime(2024, 1, 15, 9, 0, tzinfo=timezone.utc)
+                reminders.append(reminder)
+
+            in_flight = 0
+            peak = 0
+
+            async def slow_notification(**kwargs):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return True
+
+            with patch.object(service, "_session_factory") as mock_session_factory:
+                with patch(
+                    "src.mosaic.services.scheduler_service.ReminderService"
+                ) as mock_reminder_service_class:
+                    mock_session = MagicMock()
+                    mock_session_factory.return_value.__aenter__.return_value = mock_session
+
+                    mock_reminder_service = AsyncMock()
+                    mock_reminder_service.check_due_reminders.return_value = reminders
+                    mock_reminder_service_class.return_value = mock_reminder_service
+
+                    service.notification_service.trigger_notification = slow_notification
+
+                    await service._check_and_notify_reminders()
+
+                    assert peak == 3
+                    mock_session.begin.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_check_and_notify_reminders_isolates_notification_errors(self):
+        """Test one failing notification does not stop the others being marked."""
+        mock_scheduler = AsyncMock()
+        with patch(
+            "src.mosaic.services.scheduler_service.AsyncScheduler", return_value=mock_scheduler
+        ):
+            service = SchedulerService()
+
+            failing = MagicMock()
+            failing.id = 1
+            failing.reminder_time = datetime(2024, 1, 15, 9, 0, tzinfo=timezone.utc)
+            working = MagicMock()
+            working.id = 2
+            working.reminder_time = datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc)
+
+            with patch.object(service, "_session_factory") as mock_session_factory:
+                with patch(
+                    "src.mosaic.services.scheduler_service.ReminderService"
+                ) as mock_reminder_service_class:
+                    mock_session = MagicMock()
+                    mock_session_factory.return_value.__aenter__.return_value = mock_session
+
+                    mock_reminder_service = AsyncMock()
+                    mock_reminder_service.check_due_reminders.return_value = [failing, working]
+                    mock_reminder_service_class.return_value = mock_reminder_service
+
+                    service.notification_service.trigger_notification = AsyncMock(
+                        side_effect=[RuntimeError("notifier down"), True]
+                    )
+
+                    await service._check_and_notify_reminders()
+
+                    mock_reminder_service.mark_notified_many.assert_awaited_once_with([2])
+                    mock_session.begin.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_check_and_notify_reminders_skips_overlapping_run(self):
+        """Test a run that starts while the previous one is in progress is skipped."""
+        mock_scheduler = AsyncMock()
+        with patch(
+            "src.mosaic.services.scheduler_service.AsyncScheduler", return_value=mock_scheduler
+        ):
+            service = SchedulerService()
+
+            release = asyncio.Event()
+
+            async def slow_check():
+                await release.wait()
+
+            with patch.object(
+                service, "_run_reminder_check", side_effect=slow_check
+            ) as mock_run_check:
+                first = asyncio.create_task(service._check_and_notify_reminders())
+                await asyncio.sleep(0)
+
+                # Second tick arrives while the first is still running
+                await service._check_and_notify_reminders()
+                assert mock_run_check.await_count == 1
+
+                release.set()
+                await first
+
+                # Once the first run finishes, the next tick runs normally
+                await service._check_and_notify_reminders()
+                assert mock_run_check.await_count == 2
+
 
 class TestIntegration:
     """Test integration scenarios."""
@@ -318,13 +437,13 @@ class TestIntegration:
             mock_reminder.related_entity_type = None
             mock_reminder.related_entity_id = None
 
-            with patch("src.mosaic.services.scheduler_service.get_session") as mock_get_session:
+            with patch.object(service, "_session_factory") as mock_session_factory:
                 with patch(
                     "src.mosaic.services.scheduler_service.ReminderService"
                 ) as mock_reminder_service_class:
                     # Mock session
-                    mock_session = AsyncMock()
-                    mock_get_session.return_value.__aenter__.return_value = mock_session
+                    mock_session = MagicMock()
+                    mock_session_factory.return_value.__aenter__.return_value = mock_session
 
                     # Mock ReminderService
                     mock_reminder_service = AsyncMock()
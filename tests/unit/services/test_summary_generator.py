@@ -2,6 +2,7 @@
 
 from datetime import date, datetime, timezone
 from decimal import Decimal
+from typing import get_args
 
 import pytest
 
@@ -16,11 +17,12 @@ from src.mosaic.schemas.query import (
     NoteResult,
     PersonResult,
     ProjectResult,
+    QueryResultEntity,
     ReminderResult,
     UserResult,
     WorkSessionResult,
 )
-from src.mosaic.services.summary_generator import SummaryGenerator
+from src.mosaic.services.summary_generator import _PRIVACY_SCHEMAS, SummaryGenerator
 
 
 class TestSummaryGenerator:
@@ -705,8 +707,8 @@ class TestSummaryGenerator:
         summary = generator.generate([project, person], include_private=False)
         assert summary == "Found 1 project and 1 person."
 
-    def test_group_by_entity_type(self, generator: SummaryGenerator):
-        """Test _group_by_entity_type method."""
+    def test_count_by_entity_type(self, generator: SummaryGenerator):
+        """Test _count_by_entity_type method."""
         ws = WorkSessionResult(
             id=1,
             date=date(2024, 1, 15),
@@ -733,14 +735,52 @@ class TestSummaryGenerator:
             updated_at=datetime(2024, 1, 15, 14, 0, tzinfo=timezone.utc),
         )
 
-        grouped = generator._group_by_entity_type([ws, meeting])
+        counts, work_sessions = generator._count_by_entity_type([ws, meeting, meeting])
 
-        assert "work_sessions" in grouped
-        assert "meetings" in grouped
-        assert len(grouped["work_sessions"]) == 1
-        assert len(grouped["meetings"]) == 1
-        assert grouped["work_sessions"][0].id == 1
-        assert grouped["meetings"][0].id == 1
+        assert counts == {"work_session": 1, "meeting": 2}
+        assert counts["project"] == 0
+        assert work_sessions == [ws]
+
+    def test_count_by_entity_type_skips_private(self, generator: SummaryGenerator):
+        """Test _count_by_entity_type drops private results when asked."""
+        public_ws = WorkSessionResult(
+            id=1,
+            date=date(2024, 1, 15),
+            project_id=1,
+            duration_hours=Decimal("2.0"),
+            description="Public work",
+            privacy_level=PrivacyLevel.PUBLIC,
+            tags=[],
+            created_at=datetime(2024, 1, 15, 9, 0, tzinfo=timezone.utc),
+            updated_at=datetime(2024, 1, 15, 9, 0, tzinfo=timezone.utc),
+        )
+        private_ws = public_ws.model_copy(update={"id": 2, "privacy_level": PrivacyLevel.PRIVATE})
+        project = ProjectResult(
+            id=1,
+            name="Project",
+            client_id=1,
+            status=ProjectStatus.ACTIVE,
+            on_behalf_of=None,
+            description=None,
+            tags=[],
+            created_at=datetime(2024, 1, 1, 9, 0, tzinfo=timezone.utc),
+            updated_at=datetime(2024, 1, 15, 9, 0, tzinfo=timezone.utc),
+        )
+
+        counts, work_sessions = generator._count_by_entity_type(
+            [public_ws, private_ws, project], include_private=False
+        )
+
+        assert counts == {"work_session": 1, "project": 1}
+        assert work_sessions == [public_ws]
+
+    def test_privacy_schemas_cover_every_private_capable_result(self):
+        """Test the privacy filter checks every result schema that has privacy_level."""
+        schemas = get_args(get_args(QueryResultEntity)[0])
+
+        assert set(_PRIVACY_SCHEMAS) == {
+            schema for schema in schemas if "privacy_level" in schema.model_fields
+        }
 
     def test_summarize_work_sessions(self, generator: SummaryGenerator):
         """Test _summarize_work_sessions method."""
@@ -787,3 +827,21 @@ class TestSummaryGenerator:
 
         summary = generator._summarize_work_sessions([ws])
         assert summary == "1 work session (3.0 hours)"
+
+    def test_summarize_work_sessions_rounds_exact_total(self, generator: SummaryGenerator):
+        """Test hour totals round from the exact decimal sum (no float drift)."""
+        ws = WorkSessionResult(
+            id=1,
+            date=date(2024, 1, 15),
+            project_id=1,
+            duration_hours=Decimal("0.15"),
+            description="Work",
+            privacy_level=PrivacyLevel.PUBLIC,
+            tags=[],
+            created_at=datetime(2024, 1, 15, 9, 0, tzinfo=timezone.utc),
+            updated_at=datetime(2024, 1, 15, 9, 0, tzinfo=timezone.utc),
+        )
+
+        # float(0.15) is 0.1499..., which would format as 0.1
+        summary = generator._summarize_work_sessions([ws])
+        assert summary == "1 work session (0.2 hours)"
@@ -262,3 +262,72 @@ class TestWorkSessionServiceUpdate:
                 work_session_id=99999,
                 duration_hours=Decimal("4.0"),
             )
+
+    @pytest.mark.asyncio
+    async def test_update_work_session_refreshes_loaded_instance(
+        self,
+        service: WorkSessionService,
+        session: AsyncSession,
+        existing_work_session: WorkSession,
+    ):
+        """Test the UPDATE ... RETURNING result overwrites the instance already in the session."""
+        updated = await service.update_work_session(
+            work_session_id=existing_work_session.id,
+            summary="Returned summary",
+            tags=["billing"],
+        )
+
+        assert updated is existing_work_session
+        assert existing_work_session.summary == "Returned summary"
+        assert existing_work_session.tags == ["billing"]
+        assert existing_work_session.duration_hours == Decimal("8.0")
+
+    @pytest.mark.asyncio
+    async def test_update_work_session_no_fields(
+        self,
+        service: WorkSessionService,
+        session: AsyncSession,
+        existing_work_session: WorkSession,
+    ):
+        """Test an update with no fields returns the session, or raises if it is missing."""
+        unchanged = await service.update_work_session(work_session_id=existing_work_session.id)
+        assert unchanged is existing_work_session
+
+        with pytest.raises(ValueError, match="WorkSession with id 99999 not found"):
+            await service.update_work_session(work_session_id=99999)
+
+
+class TestWorkSessionServiceDelete:
+    """Test work session delete operations."""
+
+    @pytest.fixture
+    async def service(self, session: AsyncSession) -> WorkSessionService:
+        """Create work session service."""
+        return WorkSessionService(session)
+
+    @pytest.mark.asyncio
+    async def test_delete_work_session(
+        self,
+        service: WorkSessionService,
+        session: AsyncSession,
+        project: Project,
+    ):
+        """Test deleting a work session removes it and reports success."""
+        work_session = await service.create_work_session(
+            project_id=project.id,
+            date=date(2024, 1, 15),
+            duration_hours=Decimal("2.0"),
+        )
+
+        assert await service.delete_work_session(work_session.id) is True
+        assert await session.get(WorkSession, work_session.id) is None
+        assert await service.get_work_session(work_session.id) is None
+
+    @pytest.mark.asyncio
+    async def test_delete_work_session_nonexistent(
+        self,
+        service: WorkSessionService,
+        session: AsyncSession,
+    ):
+        """Test deleting a non-existent work session returns False."""
+        assert await service.delete_work_session(99999) is False
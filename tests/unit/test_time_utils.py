@@ -1,10 +1,11 @@
-"""Unit tests for time utility functions (duration validation only)."""
+"""Unit tests for time utility functions (duration validation and minutes)."""
 
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
 import pytest
 
-from src.mosaic.services.time_utils import validate_duration_hours
+from src.mosaic.services.time_utils import minutes_between, validate_duration_hours
 
 
 class TestValidateDurationHours:
@@ -93,3 +94,24 @@ class TestValidateDurationHours:
         """Test that integer input is converted to Decimal."""
         validate_duration_hours(Decimal(8))
         # Function returns None - validation only
+
+
+class TestMinutesBetween:
+    """Test whole-minute duration calculation."""
+
+    @pytest.mark.parametrize(
+        "delta",
+        [
+            timedelta(minutes=1),
+            timedelta(seconds=59, microseconds=999999),  # Partial minute dropped
+            timedelta(minutes=30, seconds=30),
+            timedelta(hours=23, minutes=59, seconds=59),
+            timedelta(days=1),  # Crosses into the days field
+            timedelta(days=3, hours=4, minutes=5, seconds=6, microseconds=7),
+        ],
+    )
+    def test_minutes_between_matches_float_division(self, delta: timedelta):
+        """Test integer arithmetic agrees with int(total_seconds() / 60)."""
+        start = datetime(2024, 1, 15, 9, 0, tzinfo=timezone.utc)
+
+        assert minutes_between(start, start + delta) == int(delta.total_seconds() / 60)